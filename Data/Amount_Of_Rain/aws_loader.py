@@ -0,0 +1,232 @@
+import io
+import os
+import re
+import csv
+import codecs
+import argparse
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 500_000
+QUARANTINE_DIR = 'quarantine'
+
+# KMA downloads are CP949 (EUC-KR superset); converted files are UTF-8 with or without BOM
+ENCODINGS = ('utf-8', 'cp949')
+SAMPLE_BYTES = 1 << 20
+
+DATE_COLUMNS = ('일시',)
+INT_COLUMNS = ('지점',)
+TEXT_COLUMNS = ('지점명', '지역명')
+
+# SURFACE_AWS_<station>_DAY_<first year>_<last year>_<download vintage>.csv
+VINTAGE_PATTERN = re.compile(r'SURFACE_AWS_(\d+)_DAY_(\d{4})_(\d{4})_(\d{4})')
+
+# Undecodable bytes survive reading as lone surrogates (errors='surrogateescape')
+SURROGATES = re.compile('[\udc80-\udcff]')
+
+def detect_encoding(path, sample_bytes=SAMPLE_BYTES):
+    """UTF-8 BOM, then strict UTF-8, then CP949 on the first sample_bytes of the file."""
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes)
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ENCODINGS:
+        try:
+            # final=False: the sample may end in the middle of a multibyte character
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return ENCODINGS[-1]
+
+def read_header(path, encoding=None):
+    """Column names of a file without reading its rows."""
+    encoding = encoding or detect_encoding(path)
+    with open(path, 'r', encoding=encoding, errors='surrogateescape', newline='') as f:
+        return next(csv.reader([f.readline().rstrip('\r\n')]))
+
+def parse_aws_filename(filename):
+    """(station, first year, last year, vintage) from a KMA daily export name, or None."""
+    match = VINTAGE_PATTERN.search(os.path.basename(filename))
+    return tuple(int(g) for g in match.groups()) if match else None
+
+def latest_vintages(filenames):
+    """
+    For overlapping downloads, the newest vintage wins each station-year.
+    Returns {filename: set of years to keep}, omitting files that win no year.
+    Names without a vintage keep all their rows (set is None).
+    """
+    winners = {}
+    kept = {}
+    for filename in sorted(filenames):
+        parsed = parse_aws_filename(filename)
+        if parsed is None:
+            kept[filename] = None
+            continue
+        station, first, last, vintage = parsed
+        for year in range(first, last + 1):
+            if (station, year) not in winners or vintage >= winners[(station, year)][0]:
+                winners[(station, year)] = (vintage, filename)
+
+    for (_, year), (_, filename) in winners.items():
+        kept.setdefault(filename, set()).add(year)
+    return kept
+
+def check_line(line, n_fields):
+    """None for a good line, 'blank' for an empty one, otherwise the quarantine reason."""
+    stripped = line.rstrip('\r\n')
+    if not stripped.strip():
+        return 'blank'
+    if SURROGATES.search(stripped):
+        return 'encoding'
+    fields = len(next(csv.reader([stripped]))) if '"' in stripped else stripped.count(',') + 1
+    if fields != n_fields:
+        return 'field_count'
+    return None
+
+def column_dtypes(columns):
+    """read_csv dtypes for the fast path: keys and names as str, measurements float32."""
+    return {c: (str if c in DATE_COLUMNS + INT_COLUMNS + TEXT_COLUMNS else 'float32') for c in columns}
+
+def type_columns(df):
+    """
+    Station as int32, '일시' as datetime, names as str, every other column float32.
+    Returns (typed DataFrame, mask of rows whose station or date could not be parsed, coerced value count).
+    """
+    invalid = np.zeros(len(df), dtype=bool)
+    coerced = 0
+    for col in df.columns:
+        raw = df[col]
+        if col in TEXT_COLUMNS:
+            continue
+        if col in DATE_COLUMNS:
+            df[col] = pd.to_datetime(raw, format='ISO8601', errors='coerce')
+            invalid |= df[col].isna().to_numpy()
+        elif col in INT_COLUMNS:
+            values = pd.to_numeric(raw, errors='coerce')
+            invalid |= values.isna().to_numpy()
+            df[col] = values.fillna(-1).astype('int32')
+        elif not pd.api.types.is_numeric_dtype(raw):
+            values = pd.to_numeric(raw, errors='coerce')
+            coerced += int((values.isna() & raw.notna() & (raw != '')).sum())
+            df[col] = values.astype('float32')
+    return df, invalid, coerced
+
+def parse_lines(text, header, usecols=None):
+    """
+    Parses validated lines with the C engine. Measurements are read as float32 directly; a chunk
+    with a non-numeric measurement is re-read as text and coerced value by value.
+    """
+    try:
+        chunk = pd.read_csv(io.StringIO(text), header=None, names=header, usecols=usecols,
+                            dtype=column_dtypes(header), keep_default_na=False, na_values=[''])
+    except ValueError:
+        chunk = pd.read_csv(io.StringIO(text), header=None, names=header, usecols=usecols,
+                            dtype=str, keep_default_na=False)
+    return type_columns(chunk)
+
+def read_chunks(path, chunksize=CHUNK_SIZE, usecols=None, encoding=None, quarantine_dir=QUARANTINE_DIR, stats=None):
+    """
+    Streams one AWS export as typed DataFrames of up to chunksize rows, decoding on the fly.
+
+    Lines that cannot be decoded, have the wrong number of fields, or have no valid station/date
+    are written to <quarantine_dir>/<file>.bad as 'line_no<TAB>reason<TAB>original bytes'.
+    If a dict is passed as stats it is filled with the encoding and row/bad-line counts.
+    """
+    encoding = encoding or detect_encoding(path)
+    stats = {} if stats is None else stats
+    stats.update(file=os.path.basename(path), encoding=encoding, rows=0, bad_lines=0, coerced=0, reasons=Counter())
+    quarantine = None
+
+    def write_bad(bad):
+        nonlocal quarantine
+        if quarantine is None:
+            os.makedirs(quarantine_dir, exist_ok=True)
+            quarantine = open(os.path.join(quarantine_dir, os.path.basename(path) + '.bad'), 'wb')
+        for line_no, reason, line in bad:
+            quarantine.write(f"{line_no}\t{reason}\t".encode('utf-8'))
+            quarantine.write(line.rstrip('\r\n').encode(encoding, 'surrogateescape') + b'\n')
+            stats['reasons'][reason] += 1
+        stats['bad_lines'] += len(bad)
+
+    try:
+        with open(path, 'r', encoding=encoding, errors='surrogateescape', newline='') as f:
+            header = next(csv.reader([f.readline().rstrip('\r\n')]))
+            line_no = 1
+            while True:
+                lines = list(islice(f, chunksize))
+                if not lines:
+                    break
+
+                good, good_no, bad = [], [], []
+                for no, line in enumerate(lines, line_no + 1):
+                    reason = check_line(line, len(header))
+                    if reason is None:
+                        good.append(line)
+                        good_no.append(no)
+                    elif reason != 'blank':
+                        bad.append((no, reason, line))
+                line_no += len(lines)
+                if not good:
+                    write_bad(bad)
+                    continue
+
+                chunk, invalid, coerced = parse_lines(''.join(good), header, usecols)
+                if invalid.any():
+                    bad += [(good_no[i], 'bad_key', good[i]) for i in np.flatnonzero(invalid)]
+                    chunk = chunk[~invalid].reset_index(drop=True)
+                if bad:
+                    write_bad(sorted(bad))
+
+                stats['rows'] += len(chunk)
+                stats['coerced'] += coerced
+                yield chunk
+    finally:
+        if quarantine is not None:
+            quarantine.close()
+
+def load_file(path, usecols=None, chunksize=CHUNK_SIZE, quarantine_dir=QUARANTINE_DIR):
+    """Reads a whole file through read_chunks. Returns (DataFrame, stats)."""
+    stats = {}
+    chunks = list(read_chunks(path, chunksize, usecols, quarantine_dir=quarantine_dir, stats=stats))
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+    return df, stats
+
+def _load_file_task(args):
+    path, usecols, chunksize, quarantine_dir = args
+    return load_file(path, usecols, chunksize, quarantine_dir)
+
+def load_files(paths, usecols=None, max_workers=None, chunksize=CHUNK_SIZE, quarantine_dir=QUARANTINE_DIR):
+    """Loads many files in a process pool, yielding (path, DataFrame, stats) in input order."""
+    tasks = [(path, usecols, chunksize, quarantine_dir) for path in paths]
+    # Batch small files per task so per-file dispatch overhead does not dominate
+    batch = max(1, len(tasks) // ((max_workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for path, (df, stats) in zip(paths, executor.map(_load_file_task, tasks, chunksize=batch)):
+            yield path, df, stats
+
+def report(stats):
+    line = f"{stats['file']}: {stats['encoding']}, {stats['rows']} rows"
+    if stats['bad_lines']:
+        reasons = ', '.join(f"{r}={n}" for r, n in sorted(stats['reasons'].items()))
+        line += f", {stats['bad_lines']} quarantined ({reasons})"
+    if stats['coerced']:
+        line += f", {stats['coerced']} unparseable values set to NaN"
+    return line
+
+def main():
+    parser = argparse.ArgumentParser(description='Check AWS CSV exports: encoding, row counts and quarantined lines')
+    parser.add_argument('paths', nargs='+')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--quarantine-dir', default=QUARANTINE_DIR)
+    args = parser.parse_args()
+
+    for _, _, stats in load_files(args.paths, max_workers=args.workers, quarantine_dir=args.quarantine_dir):
+        print(report(stats))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import pandas as pd
+
+from combine_csv import REGION_MAP
+from aws_loader import load_file, latest_vintages, parse_aws_filename, report
+
+INPUT_DIR = 'converted_data'
+STORE_DIR = 'aws_store'
+# Leading underscore: ignored by the Parquet dataset reader
+MANIFEST_FILE = '_manifest.json'
+WATCH_INTERVAL = 60
+
+FILE_PATTERN = re.compile(r'SURFACE_AWS_(\d+)_DAY')
+
+def read_aws_file(filepath):
+    """
+    Reads one SURFACE_AWS_*_DAY_*.csv file into a typed DataFrame:
+    '일시' as datetime, measurements as float32, plus '지역명' and 'YEAR'.
+    """
+    df, stats = load_file(filepath)
+    if stats['bad_lines']:
+        print(report(stats))
+
+    region_code = FILE_PATTERN.search(os.path.basename(filepath)).group(1)
+    df['지점'] = pd.to_numeric(df['지점'], errors='coerce').fillna(int(region_code)).astype('int32')
+    df['일시'] = pd.to_datetime(df['일시'], errors='coerce')
+    df = df.dropna(subset=['일시'])
+
+    # All measurement columns (rainfall, temperature, wind, hhmi times) become float
+    value_cols = [c for c in df.columns if c not in ('지점', '일시')]
+    df[value_cols] = df[value_cols].apply(pd.to_numeric, errors='coerce').astype('float32')
+
+    df.insert(1, '지역명', REGION_MAP.get(region_code, '알 수 없음'))
+    df['YEAR'] = df['일시'].dt.year.astype('int32')
+    return df
+
+def write_partition(df, store_dir=STORE_DIR):
+    """Appends rows to the store, partitioned by station ('지점') and 'YEAR'."""
+    df.to_parquet(store_dir, partition_cols=['지점', 'YEAR'], index=False)
+
+def scan_files(input_dir=INPUT_DIR):
+    return sorted(f for f in os.listdir(input_dir) if FILE_PATTERN.search(f) and f.endswith('.csv'))
+
+def keep_latest(df, years):
+    """Rows of the station-years this file wins (all rows if the name has no vintage)."""
+    return df if years is None else df[df['YEAR'].isin(years)]
+
+def build_store(input_dir=INPUT_DIR, store_dir=STORE_DIR):
+    """Converts every AWS daily CSV in input_dir into the partitioned Parquet store."""
+    file_list = scan_files(input_dir)
+    if not file_list:
+        print("No CSV files found in the input directory.")
+        return
+
+    # Rebuild from scratch so partitions are not appended twice
+    if os.path.exists(store_dir):
+        shutil.rmtree(store_dir)
+
+    # Overlapping downloads: only the newest vintage of every station-year is stored
+    keep_years = latest_vintages(file_list)
+
+    # One write per station keeps memory bounded while avoiding tiny files
+    files_by_station = {}
+    for filename in file_list:
+        if filename in keep_years:
+            files_by_station.setdefault(FILE_PATTERN.search(filename).group(1), []).append(filename)
+
+    for station_files in files_by_station.values():
+        df = pd.concat([keep_latest(read_aws_file(os.path.join(input_dir, f)), keep_years[f]) for f in station_files],
+                       ignore_index=True)
+        write_partition(df, store_dir)
+
+    # Record every file so later runs of ingest() only pick up new or changed downloads
+    manifest = {f: file_entry(os.path.join(input_dir, f)) for f in file_list}
+    save_manifest(manifest, store_dir)
+
+    print(f"Converted {len(file_list)} files into {store_dir}")
+
+# --- Incremental ingestion ---
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def file_entry(path, digest=None):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest or file_hash(path)}
+
+def load_manifest(store_dir=STORE_DIR):
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(manifest, store_dir=STORE_DIR):
+    os.makedirs(store_dir, exist_ok=True)
+    path = os.path.join(store_dir, MANIFEST_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(path + '.tmp', path)
+
+def changed_files(input_dir, manifest):
+    """
+    Files that are new or whose content changed since they were ingested.
+    Size and mtime are checked first; the hash is only computed when they differ,
+    so a touched but identical file is not re-ingested.
+    """
+    changed = {}
+    for filename in scan_files(input_dir):
+        path = os.path.join(input_dir, filename)
+        stat = os.stat(path)
+        entry = manifest.get(filename)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            continue
+        digest = file_hash(path)
+        if entry and entry['sha256'] == digest:
+            entry['mtime_ns'] = stat.st_mtime_ns
+            continue
+        changed[filename] = file_entry(path, digest)
+    return changed
+
+def replace_partitions(df, store_dir=STORE_DIR):
+    """Deletes the station-year partitions present in df, then writes df in their place."""
+    for station, year in df[['지점', 'YEAR']].drop_duplicates().itertuples(index=False):
+        shutil.rmtree(os.path.join(store_dir, f'지점={station}', f'YEAR={year}'), ignore_errors=True)
+    write_partition(df, store_dir)
+
+def station_year_winners(keep_years):
+    """{(station, year): filename} for every station-year a vintage-named file wins."""
+    winners = {}
+    for filename, years in keep_years.items():
+        parsed = parse_aws_filename(filename)
+        if parsed is not None and years is not None:
+            winners.update({(parsed[0], year): filename for year in years})
+    return winners
+
+def ingest(input_dir=INPUT_DIR, store_dir=STORE_DIR):
+    """
+    Adds new or changed downloads to the store. A file's station-years replace the stored
+    partitions only where it is the newest vintage; superseded files are just recorded.
+    When a winning file disappears, its station-years are re-ingested from the new winners.
+    Returns the number of files ingested.
+    """
+    if not os.path.exists(store_dir):
+        build_store(input_dir, store_dir)
+        return len(scan_files(input_dir))
+
+    manifest = load_manifest(store_dir)
+    file_list = scan_files(input_dir)
+    old_winners = station_year_winners(latest_vintages(manifest))
+    keep_years = latest_vintages(file_list)
+    new_winners = station_year_winners(keep_years)
+
+    removed = set(manifest) - set(file_list)
+    for filename in sorted(removed):
+        print(f"  {filename} no longer in {input_dir}")
+        del manifest[filename]
+
+    changed = changed_files(input_dir, manifest)
+
+    # Station-years whose stored rows came from a removed file: reload them from the file that now wins.
+    # Without any remaining file for a station-year, its rows stay in the store (full rebuild drops them).
+    refill = {}
+    for key, filename in old_winners.items():
+        if filename in removed:
+            winner = new_winners.get(key)
+            if winner is None:
+                print(f"  {filename}: no other file covers station {key[0]} year {key[1]} (stored data kept)")
+            elif winner not in changed:
+                refill.setdefault(winner, set()).add(key[1])
+    for filename, years in sorted(refill.items()):
+        df = keep_latest(read_aws_file(os.path.join(input_dir, filename)), years)
+        if not df.empty:
+            replace_partitions(df, store_dir)
+        print(f"  {filename}: {len(df)} rows re-ingested for years {sorted(years)}")
+
+    if not changed:
+        save_manifest(manifest, store_dir)
+        return len(refill)
+
+    for filename, entry in sorted(changed.items()):
+        if filename not in keep_years:
+            print(f"  {filename}: superseded by a newer vintage, skipped")
+        else:
+            df = keep_latest(read_aws_file(os.path.join(input_dir, filename)), keep_years[filename])
+            if not df.empty:
+                replace_partitions(df, store_dir)
+            print(f"  {filename}: {len(df)} rows ingested")
+        manifest[filename] = entry
+        save_manifest(manifest, store_dir)
+
+    return len(changed) + len(refill)
+
+def watch(input_dir=INPUT_DIR, store_dir=STORE_DIR, interval=WATCH_INTERVAL):
+    """Polls input_dir and ingests new downloads until interrupted."""
+    print(f"Watching {input_dir} every {interval}s (Ctrl+C to stop)")
+    try:
+        while True:
+            count = ingest(input_dir, store_dir)
+            if count:
+                print(f"Ingested {count} files into {store_dir}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+def load_aws(stations=None, start=None, end=None, columns=None, store_dir=STORE_DIR):
+    """
+    Loads only the requested stations, date range and columns from the store.
+    Partition pruning skips other stations/years; '지점' and '일시' are always returned.
+    """
+    filters = []
+    if stations is not None:
+        filters.append(('지점', 'in', [int(s) for s in stations]))
+    if start is not None:
+        start = pd.Timestamp(start)
+        filters += [('YEAR', '>=', start.year), ('일시', '>=', start)]
+    if end is not None:
+        end = pd.Timestamp(end)
+        filters += [('YEAR', '<=', end.year), ('일시', '<=', end)]
+
+    if columns is not None:
+        columns = list(dict.fromkeys(['지점', '일시'] + list(columns)))
+
+    df = pd.read_parquet(store_dir, columns=columns, filters=filters or None, memory_map=True)
+
+    # Partition keys come back as categoricals
+    df['지점'] = df['지점'].astype('int32')
+    if 'YEAR' in df.columns:
+        df['YEAR'] = df['YEAR'].astype('int32')
+    return df.sort_values(['지점', '일시'], kind='stable').reset_index(drop=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert AWS daily CSVs into a partitioned Parquet store')
+    parser.add_argument('--input-dir', default=INPUT_DIR)
+    parser.add_argument('--store-dir', default=STORE_DIR)
+    parser.add_argument('--ingest', action='store_true', help='only add new or changed files to an existing store')
+    parser.add_argument('--watch', action='store_true', help='keep polling the input folder and ingest new files')
+    parser.add_argument('--interval', type=int, default=WATCH_INTERVAL, help='polling interval in seconds for --watch')
+    args = parser.parse_args()
+
+    if args.watch:
+        watch(args.input_dir, args.store_dir, args.interval)
+    elif args.ingest:
+        count = ingest(args.input_dir, args.store_dir)
+        print(f"Ingested {count} files into {args.store_dir}" if count else "Store is up to date.")
+    else:
+        build_store(args.input_dir, args.store_dir)
+
+if __name__ == '__main__':
+    main()
@@ -1,78 +1,81 @@
 
-import csv
-from datetime import datetime, timedelta
+import argparse
+import numpy as np
+import pandas as pd
+
+from fill_rain_gaps import fill_rain_data
 
 INPUT_FILE = 'rain_data.csv'
 OUTPUT_FILE = 'cumulative_rain_data.csv'
 
-def process_rainfall_period(period):
-    """Processes a list of rows representing a consecutive rainfall period."""
-    if not period:
-        return None
+HEADER = ["지점", "지역명", "강수 시작일", "강수 종료일", "강수 기간", "기간 누적 강수량", "최대 일강수량"]
+
+def find_rain_events(df, threshold=0.0, max_dry_gap=0):
+    """
+    Splits every station's series into rainfall events in one vectorized pass.
+
+    A row counts as rain when its rainfall is greater than `threshold`. An event
+    continues across at most `max_dry_gap` consecutive non-rain rows; a longer dry
+    spell or a station change ends it. Duration is the number of rows from the
+    event's first to last rain day, dry days inside the event included.
+    """
+    df = df.sort_values(['지점', '일시'], kind='stable').reset_index(drop=True)
+
+    # Treat non-numeric or empty as no rain
+    rain = pd.to_numeric(df['일강수량(mm)'], errors='coerce').fillna(0.0).to_numpy()
+    station = df['지점'].to_numpy()
+
+    # Row position within each station
+    station_start = np.r_[True, station[1:] != station[:-1]]
+    pos = np.arange(len(df)) - np.maximum.accumulate(np.where(station_start, np.arange(len(df)), 0))
 
-    station = period[0]['지점']
-    region_name = period[0]['지역명']
-    start_date = period[0]['일시']
-    end_date = period[-1]['일시']
-    duration = len(period)
-    cumulative_rain = sum(float(row['일강수량(mm)']) for row in period)
+    wet = np.flatnonzero(rain > threshold)
+    if len(wet) == 0:
+        return pd.DataFrame(columns=HEADER)
 
-    return [station, region_name, start_date, end_date, duration, cumulative_rain]
+    # A new event starts at the first rain row, on a station change, or after too long a dry gap
+    new_event = np.r_[True, (station[wet[1:]] != station[wet[:-1]])
+                      | (pos[wet[1:]] - pos[wet[:-1]] - 1 > max_dry_gap)]
+    starts = np.flatnonzero(new_event)
+    ends = np.r_[starts[1:], len(wet)] - 1
+
+    first, last = wet[starts], wet[ends]
+    wet_rain = rain[wet]
+
+    return pd.DataFrame({
+        "지점": station[first],
+        "지역명": df['지역명'].to_numpy()[first],
+        "강수 시작일": df['일시'].to_numpy()[first],
+        "강수 종료일": df['일시'].to_numpy()[last],
+        "강수 기간": pos[last] - pos[first] + 1,
+        "기간 누적 강수량": np.add.reduceat(wet_rain, starts),
+        "최대 일강수량": np.maximum.reduceat(wet_rain, starts),
+    })
 
 def main():
+    parser = argparse.ArgumentParser(description='Extract consecutive rainfall periods per station')
+    parser.add_argument('--input', default=INPUT_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--threshold', type=float, default=0.0, help='daily rainfall above this counts as rain (mm)')
+    parser.add_argument('--max-dry-gap', type=int, default=0, help='dry days allowed inside one event')
+    parser.add_argument('--fill-gaps', action='store_true', help='impute missing days from neighbouring stations first')
+    args = parser.parse_args()
+
     try:
-        with open(INPUT_FILE, 'r', newline='', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
-            data = sorted(reader, key=lambda row: (row['지점'], row['일시']))
-
-        results = []
-        current_period = []
-        current_station = None
-
-        for row in data:
-            station = row['지점']
-            
-            # Handle station change
-            if station != current_station:
-                if current_period:
-                    processed_row = process_rainfall_period(current_period)
-                    if processed_row:
-                        results.append(processed_row)
-                current_period = []
-                current_station = station
-
-            # Handle rainfall data
-            try:
-                rainfall = float(row['일강수량(mm)']) if row['일강수량(mm)'] else 0.0
-            except (ValueError, TypeError):
-                rainfall = 0.0 # Treat non-numeric or empty as no rain
-
-            if rainfall > 0:
-                current_period.append(row)
-            else: # rainfall is 0 or less
-                if current_period:
-                    processed_row = process_rainfall_period(current_period)
-                    if processed_row:
-                        results.append(processed_row)
-                    current_period = []
-
-        # Process the last period at the end of the file
-        if current_period:
-            processed_row = process_rainfall_period(current_period)
-            if processed_row:
-                results.append(processed_row)
+        df = pd.read_csv(args.input, encoding='utf-8', dtype={'지점': str, '지역명': str, '일시': str})
+        if args.fill_gaps:
+            # Otherwise missing values count as dry days and split events
+            df = fill_rain_data(df)
+
+        results = find_rain_events(df, threshold=args.threshold, max_dry_gap=args.max_dry_gap)
 
         # Write results to the output file
-        header = ["지점", "지역명", "강수 시작일", "강수 종료일", "강수 기간", "기간 누적 강수량"]
-        with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as outfile:
-            writer = csv.writer(outfile)
-            writer.writerow(header)
-            writer.writerows(results)
+        results.to_csv(args.output, index=False, encoding='utf-8')
 
-        print(f"Successfully created {OUTPUT_FILE}")
+        print(f"Successfully created {args.output}")
 
     except FileNotFoundError:
-        print(f"Error: {INPUT_FILE} not found.")
+        print(f"Error: {args.input} not found.")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
@@ -1,7 +1,9 @@
 
-import csv
 import os
 import re
+import pandas as pd
+
+from aws_loader import load_files, latest_vintages, read_header, report, CHUNK_SIZE
 
 REGION_MAP = {
     '400': '강남', '401': '서초', '402': '강동', '403': '송파', '404': '강서',
@@ -15,38 +17,50 @@ REGION_MAP = {
 INPUT_DIR = 'converted_data'
 OUTPUT_FILE = 'combined_data.csv'
 
-# Get file list and header from the first file
-file_list = sorted([f for f in os.listdir(INPUT_DIR) if f.endswith('.csv')])
-if not file_list:
-    print("No CSV files found in the input directory.")
-    exit()
+def main():
+    # Raw KMA downloads (CP949) and converted UTF-8 files are both accepted
+    file_list = sorted(f for f in os.listdir(INPUT_DIR) if f.endswith('.csv') and re.search(r'SURFACE_AWS_(\d+)_DAY', f))
+    if not file_list:
+        print("No CSV files found in the input directory.")
+        return
 
-with open(os.path.join(INPUT_DIR, file_list[0]), 'r', encoding='utf-8') as f:
-    header = f.readline().strip().split(',')
+    # Overlapping downloads: keep only the newest vintage of every station-year
+    keep_years = latest_vintages(file_list)
+    file_list = [f for f in file_list if f in keep_years]
+    paths = [os.path.join(INPUT_DIR, f) for f in file_list]
 
-# Prepare new header
-new_header = [header[0]] + ['지역명'] + header[1:]
+    # Newer exports add columns (e.g. 1시간 최다강수량); align every file to the union of headers by name
+    columns = list(dict.fromkeys(c for path in paths for c in read_header(path)))
+    columns = [columns[0], '지역명'] + columns[1:]
 
-with open(OUTPUT_FILE, 'w', newline='', encoding='utf-8') as outfile:
-    writer = csv.writer(outfile)
-    writer.writerow(new_header)
+    # Rows are buffered and written in blocks of CHUNK_SIZE to keep memory bounded
+    buffer, buffered, first = [], 0, True
+    def flush():
+        nonlocal buffer, buffered, first
+        if buffer:
+            pd.concat(buffer, ignore_index=True).reindex(columns=columns).to_csv(
+                OUTPUT_FILE, mode='w' if first else 'a', header=first, index=False, encoding='utf-8',
+                date_format='%Y-%m-%d')
+            buffer, buffered, first = [], 0, False
 
-    # Process each file
-    for filename in file_list:
-        match = re.search(r'SURFACE_AWS_(\d+)_DAY', filename)
-        if not match:
+    for path, df, stats in load_files(paths):
+        if stats['bad_lines'] or stats['coerced']:
+            print(report(stats))
+        years = keep_years[os.path.basename(path)]
+        if years is not None and not df.empty:
+            df = df[df['일시'].dt.year.isin(years)]
+        if df.empty:
             continue
-        
-        region_code = match.group(1)
-        region_name = REGION_MAP.get(region_code, '알 수 없음') # Default value if code not in map
-
-        filepath = os.path.join(INPUT_DIR, filename)
-        with open(filepath, 'r', encoding='utf-8') as infile:
-            reader = csv.reader(infile)
-            next(reader) # Skip header
-            for row in reader:
-                # Insert region name into the row
-                row.insert(1, region_name)
-                writer.writerow(row)
-
-print(f"All files have been combined into {OUTPUT_FILE}")
+
+        region_code = re.search(r'SURFACE_AWS_(\d+)_DAY', os.path.basename(path)).group(1)
+        df.insert(1, '지역명', REGION_MAP.get(region_code, '알 수 없음')) # Default value if code not in map
+        buffer.append(df)
+        buffered += len(df)
+        if buffered >= CHUNK_SIZE:
+            flush()
+    flush()
+
+    print(f"All files have been combined into {OUTPUT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+import os
+import sys
+import glob
+import json
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# District boundary path shared with the land-cover scripts (Land_Cover_Info/land_cover_codes.py)
+sys.path.append(os.path.join(SCRIPT_DIR, '..', 'Land_Cover_Info'))
+from land_cover_codes import SIGUNGU_PATH
+
+RAIN_DATA_FILE = 'rain_data.csv'
+# KMA station metadata export with columns 지점, 위도, 경도
+STATION_FILE = 'aws_stations.csv'
+SIGUNGU_FILE = SIGUNGU_PATH
+OUTPUT_FILE = 'district_rain_data.csv'
+
+def load_stations(station_file, crs):
+    """Station points projected to the district CRS."""
+    import geopandas as gpd
+
+    stations = pd.read_csv(station_file, encoding='utf-8')
+    stations['지점'] = stations['지점'].astype(int)
+    stations = stations.drop_duplicates('지점', keep='last').sort_values('지점')
+    points = gpd.points_from_xy(stations['경도'], stations['위도'], crs='EPSG:4326')
+    return gpd.GeoDataFrame(stations[['지점']].reset_index(drop=True), geometry=points).to_crs(crs)
+
+def load_districts(sigungu_file):
+    import geopandas as gpd
+
+    districts = gpd.read_file(sigungu_file)
+    districts.geometry = districts.geometry.make_valid()
+    return districts.sort_values('SIGUNGU_NM').reset_index(drop=True)
+
+def thiessen_weights(stations, districts):
+    """
+    (district × station) weights: share of each district's area inside each station's
+    Thiessen (Voronoi) cell.
+    """
+    import geopandas as gpd
+    import shapely
+
+    extent = shapely.box(*districts.total_bounds).buffer(10_000)
+    cells = shapely.get_parts(shapely.voronoi_polygons(shapely.multipoints(stations.geometry.values), extend_to=extent))
+    cells = gpd.GeoDataFrame(geometry=cells, crs=districts.crs)
+
+    # Voronoi output order is not the input order; match each cell to the station it contains
+    cell_station = gpd.sjoin(stations, cells, how='inner', predicate='within')
+    cells = cells.loc[cell_station['index_right'].to_numpy()].reset_index(drop=True)
+    cells['station_idx'] = cell_station.index.to_numpy()
+
+    pieces = gpd.overlay(districts[['SIGUNGU_NM', 'geometry']].reset_index(names='district_idx'),
+                         cells, how='intersection')
+    weights = np.zeros((len(districts), len(stations)))
+    np.add.at(weights, (pieces['district_idx'].to_numpy(), pieces['station_idx'].to_numpy()), pieces.geometry.area.to_numpy())
+    return weights / weights.sum(axis=1, keepdims=True)
+
+def idw_weights(stations, districts, power=2.0, spacing=500.0):
+    """
+    (district × station) weights: inverse-distance weights averaged over a regular grid of
+    sample points (every `spacing` metres) inside each district, i.e. the areal mean of
+    the IDW surface. Small districts fall back to their representative point.
+    """
+    import geopandas as gpd
+
+    minx, miny, maxx, maxy = districts.total_bounds
+    xs, ys = np.meshgrid(np.arange(minx, maxx, spacing), np.arange(miny, maxy, spacing))
+    grid = gpd.GeoDataFrame(geometry=gpd.points_from_xy(xs.ravel(), ys.ravel()), crs=districts.crs)
+    samples = gpd.sjoin(grid, districts[['geometry']], how='inner', predicate='within')
+    district_idx = samples['index_right'].to_numpy()
+    sample_xy = np.column_stack([samples.geometry.x, samples.geometry.y])
+
+    missing = np.setdiff1d(np.arange(len(districts)), district_idx)
+    if len(missing):
+        points = districts.geometry.iloc[missing].representative_point()
+        district_idx = np.r_[district_idx, missing]
+        sample_xy = np.vstack([sample_xy, np.column_stack([points.x, points.y])])
+
+    station_xy = np.column_stack([stations.geometry.x, stations.geometry.y])
+    dist = np.sqrt(((sample_xy[:, None, :] - station_xy[None, :, :]) ** 2).sum(axis=2))
+    inv = 1.0 / np.maximum(dist, 1.0) ** power
+    inv /= inv.sum(axis=1, keepdims=True)
+
+    weights = np.zeros((len(districts), len(stations)))
+    np.add.at(weights, district_idx, inv)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+def build_weights(method, station_file=STATION_FILE, sigungu_file=SIGUNGU_FILE, power=2.0):
+    districts = load_districts(sigungu_file)
+    stations = load_stations(station_file, districts.crs)
+    if method == 'thiessen':
+        weights = thiessen_weights(stations, districts)
+    else:
+        weights = idw_weights(stations, districts, power=power)
+    # District names as a 'U' string array so the .npz cache loads without pickle
+    return weights, np.asarray(districts['SIGUNGU_NM'], dtype=str), stations['지점'].to_numpy()
+
+def weights_key(method, station_file=STATION_FILE, sigungu_file=SIGUNGU_FILE, power=2.0):
+    """
+    Fingerprint of everything the weights depend on: method, IDW power, and the content of
+    the station file and of every file of the district shapefile (.shp, .dbf, .prj, ...).
+    """
+    h = hashlib.sha256(json.dumps([method, power if method == 'idw' else None]).encode())
+    sidecars = sorted(glob.glob(glob.escape(os.path.splitext(sigungu_file)[0]) + '.*'))
+    for path in [station_file] + sidecars:
+        with open(path, 'rb') as f:
+            h.update(os.path.basename(path).encode())
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+def load_or_build_weights(method, cache_file, rebuild=False, **kwargs):
+    """
+    Weights are computed once and cached in an .npz file together with their weights_key;
+    a cache built from other inputs or parameters is rebuilt.
+    """
+    key = weights_key(method, **kwargs)
+    if not rebuild and os.path.exists(cache_file):
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                if str(cached['key']) == key:
+                    return cached['weights'], cached['districts'], cached['stations']
+        except (KeyError, ValueError):
+            # No key, or district names stored as an object array by an older version
+            pass
+        print(f"{cache_file} was built from different stations, districts or parameters; rebuilding")
+
+    weights, districts, stations = build_weights(method, **kwargs)
+    np.savez(cache_file, weights=weights, districts=districts, stations=stations, key=key)
+    print(f"Saved {method} weights ({weights.shape[0]} districts × {weights.shape[1]} stations) to {cache_file}")
+    return weights, districts, stations
+
+def district_rainfall(rain_df, weights, districts, stations):
+    """
+    District rainfall for every day as one matrix product. Missing station values are
+    dropped and the remaining weights renormalized per district and day.
+    """
+    rain_df = rain_df[rain_df['지점'].isin(stations)]
+    matrix = rain_df.pivot_table(index='일시', columns='지점', values='일강수량(mm)', aggfunc='mean')
+    matrix = matrix.reindex(columns=stations)
+
+    values = matrix.to_numpy(dtype=float)
+    observed = np.isfinite(values)
+    numerator = np.where(observed, values, 0.0) @ weights.T
+    denominator = observed.astype(float) @ weights.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = numerator / denominator
+
+    return pd.DataFrame(result, index=matrix.index, columns=districts)
+
+def main():
+    parser = argparse.ArgumentParser(description='Interpolate station rainfall to Seoul districts')
+    parser.add_argument('--method', choices=['thiessen', 'idw'], default='thiessen')
+    parser.add_argument('--power', type=float, default=2.0, help='IDW distance exponent')
+    parser.add_argument('--rain', default=RAIN_DATA_FILE)
+    parser.add_argument('--stations', default=STATION_FILE)
+    parser.add_argument('--sigungu', default=SIGUNGU_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--rebuild', action='store_true', help='recompute cached weights')
+    args = parser.parse_args()
+
+    weights, districts, stations = load_or_build_weights(
+        args.method, f'district_weights_{args.method}.npz', rebuild=args.rebuild,
+        station_file=args.stations, sigungu_file=args.sigungu, power=args.power)
+
+    rain_df = pd.read_csv(args.rain, encoding='utf-8')
+    rain_df['일강수량(mm)'] = pd.to_numeric(rain_df['일강수량(mm)'], errors='coerce')
+    wide = district_rainfall(rain_df, weights, districts, stations)
+
+    # Long format to join with Seoul_Land_info.csv on SIGUNGU_NM
+    result = wide.rename_axis(columns='SIGUNGU_NM').stack().rename('일강수량(mm)').reset_index()
+    result['일강수량(mm)'] = result['일강수량(mm)'].round(2)
+    result.to_csv(args.output, index=False, encoding='utf-8')
+    print(f"Successfully created {args.output}")
+
+if __name__ == '__main__':
+    main()
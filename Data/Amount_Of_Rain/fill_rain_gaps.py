@@ -0,0 +1,164 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+RAIN_DATA_FILE = 'rain_data.csv'
+STATION_FILE = 'aws_stations.csv'
+OUTPUT_FILE = 'rain_data_filled.csv'
+
+N_NEIGHBORS = 5
+MIN_OVERLAP_DAYS = 365
+IMPUTED_COL = 'imputed'
+
+def rain_matrix(df):
+    """
+    (station × day) rainfall matrix over the full calendar, NaN where missing.
+    Cells outside a station's first..last observation are marked as out of record.
+    Returns (values, in_record mask, station codes, station names, days).
+    """
+    df = df.dropna(subset=['일시'])
+    days = pd.to_datetime(df['일시'])
+    rain = pd.to_numeric(df['일강수량(mm)'], errors='coerce')
+
+    codes, station_pos = np.unique(df['지점'].astype(int).to_numpy(), return_inverse=True)
+    calendar = pd.date_range(days.min(), days.max(), freq='D')
+    day_pos = (days - calendar[0]).dt.days.to_numpy()
+
+    values = np.full((len(codes), len(calendar)), np.nan)
+    # Duplicate (station, day) rows: the last one wins, as when appending newer files
+    values[station_pos, day_pos] = rain.to_numpy(dtype=float)
+
+    first = np.full(len(codes), len(calendar))
+    last = np.full(len(codes), -1)
+    np.minimum.at(first, station_pos, day_pos)
+    np.maximum.at(last, station_pos, day_pos)
+    in_record = (np.arange(len(calendar)) >= first[:, None]) & (np.arange(len(calendar)) <= last[:, None])
+
+    names = pd.Series(df['지역명'].to_numpy()).groupby(station_pos).last().reindex(range(len(codes))).to_numpy()
+    return values, in_record, codes, names, calendar
+
+def correlation_weights(values, n_neighbors=N_NEIGHBORS, min_overlap=MIN_OVERLAP_DAYS):
+    """
+    (station × station) weights from pairwise Pearson correlation on co-observed days,
+    all pairs at once through masked matrix products. Each station keeps its n_neighbors
+    best positively correlated neighbours, weighted by r².
+    """
+    observed = np.isfinite(values).astype(float)
+    x = np.where(observed > 0, values, 0.0)
+
+    n = observed @ observed.T
+    sx = x @ observed.T            # sum of station i over days where j is observed too
+    sxx = (x * x) @ observed.T
+    sxy = x @ x.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sx.T
+        var = (n * sxx - sx * sx) * (n * sxx - sx * sx).T
+        corr = cov / np.sqrt(var)
+    corr[~np.isfinite(corr) | (n < min_overlap)] = 0.0
+    np.fill_diagonal(corr, 0.0)
+
+    return top_neighbors(np.maximum(corr, 0.0) ** 2, n_neighbors)
+
+def idw_weights(codes, station_file=STATION_FILE, power=2.0, n_neighbors=N_NEIGHBORS):
+    """(station × station) inverse-distance weights from station coordinates (지점, 위도, 경도)."""
+    stations = pd.read_csv(station_file, encoding='utf-8').drop_duplicates('지점', keep='last')
+    stations = stations.set_index(stations['지점'].astype(int)).reindex(codes)
+    lat, lon = np.radians(stations['위도'].to_numpy()), np.radians(stations['경도'].to_numpy())
+
+    # Haversine distance (km)
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2
+    dist = 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weights = 1.0 / np.maximum(dist, 0.1) ** power
+    weights[~np.isfinite(weights)] = 0.0
+    np.fill_diagonal(weights, 0.0)
+    return top_neighbors(weights, n_neighbors)
+
+def top_neighbors(weights, n_neighbors):
+    """Zeroes all but the n_neighbors largest weights of each row."""
+    if n_neighbors and n_neighbors < weights.shape[1]:
+        cutoff = -np.sort(-weights, axis=1)[:, n_neighbors - 1:n_neighbors]
+        weights = np.where(weights >= cutoff, weights, 0.0)
+    return weights
+
+def ratio_scale(values):
+    """
+    (station × station) normal-ratio factors: mean of station i / mean of station j over
+    the days both observed, so a wetter neighbour is scaled down to the target's climate.
+    """
+    observed = np.isfinite(values).astype(float)
+    x = np.where(observed > 0, values, 0.0)
+    sx = x @ observed.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = sx / sx.T
+    ratio[~np.isfinite(ratio)] = 1.0
+    return ratio
+
+def fill_gaps(values, in_record, weights):
+    """
+    Fills every missing in-record cell in one pass:
+        estimate[i, d] = Σ_j w_ij · ratio_ij · x[j, d] / Σ_j w_ij   over neighbours j observed on day d
+    Returns (filled values, imputed mask). Cells with no observed neighbour stay NaN.
+    """
+    observed = np.isfinite(values)
+    x = np.where(observed, values, 0.0)
+    scaled = weights * ratio_scale(values)
+
+    numerator = scaled @ x
+    denominator = weights @ observed.astype(float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        estimate = numerator / denominator
+
+    imputed = ~observed & in_record & (denominator > 0)
+    filled = np.where(imputed, estimate, values)
+    return filled, imputed
+
+def fill_rain_data(df, method='correlation', n_neighbors=N_NEIGHBORS, station_file=STATION_FILE):
+    """
+    Gap-filled daily rainfall in rain_data.csv format plus an 'imputed' flag column.
+    Days missing from a station's record (inside its first..last date) are added as rows.
+    """
+    values, in_record, codes, names, calendar = rain_matrix(df)
+    if method == 'idw':
+        weights = idw_weights(codes, station_file, n_neighbors=n_neighbors)
+    else:
+        weights = correlation_weights(values, n_neighbors)
+    filled, imputed = fill_gaps(values, in_record, weights)
+
+    station_idx, day_idx = np.nonzero(in_record)
+    return pd.DataFrame({
+        '지점': codes[station_idx],
+        '지역명': names[station_idx],
+        '일시': calendar[day_idx].strftime('%Y-%m-%d'),
+        '일강수량(mm)': np.round(filled[station_idx, day_idx], 1),
+        IMPUTED_COL: imputed[station_idx, day_idx].astype(np.int8),
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description='Fill missing daily rainfall from neighbouring stations')
+    parser.add_argument('--input', default=RAIN_DATA_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--method', choices=['correlation', 'idw'], default='correlation',
+                        help='neighbour weights: r² of daily series, or inverse distance (needs --stations)')
+    parser.add_argument('--stations', default=STATION_FILE)
+    parser.add_argument('--neighbors', type=int, default=N_NEIGHBORS)
+    args = parser.parse_args()
+
+    try:
+        df = pd.read_csv(args.input, encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Error: {args.input} not found.")
+        return
+
+    result = fill_rain_data(df, args.method, args.neighbors, args.stations)
+    result.to_csv(args.output, index=False, encoding='utf-8')
+
+    missing = result['일강수량(mm)'].isna().sum()
+    print(f"Filled {int(result[IMPUTED_COL].sum())} of {len(result)} station-days "
+          f"({missing} still missing) into {args.output}")
+
+if __name__ == '__main__':
+    main()
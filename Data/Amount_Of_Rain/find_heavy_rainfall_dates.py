@@ -1,20 +1,215 @@
-
+import os
+import argparse
+import numpy as np
 import pandas as pd
 
 RAIN_DATA_FILE = 'rain_data.csv'
+INDEX_FILE = '{stem}_index.npz'
+
+def build_index(df):
+    """
+    Sorted, per-station arrays for fast queries:
+    - rows sorted by (station, date); offsets[i]:offsets[i+1] is station i
+    - by_rain: the same rows ordered by (station, rainfall) for threshold lookups
+    Dates are stored as int64 days since 1970-01-01.
+    """
+    df = df.dropna(subset=['일시'])
+    station = df['지점'].astype(np.int64).to_numpy()
+    dates = pd.to_datetime(df['일시']).to_numpy().astype('datetime64[D]').astype(np.int64)
+    rain = pd.to_numeric(df['일강수량(mm)'], errors='coerce').fillna(0.0).to_numpy(dtype=np.float64)
+
+    order = np.lexsort((dates, station))
+    station, dates, rain = station[order], dates[order], rain[order]
+    names = df['지역명'].to_numpy()[order]
+
+    codes, starts = np.unique(station, return_index=True)
+    offsets = np.r_[starts, len(station)]
+    by_rain = np.lexsort((rain, station))
+
+    return {
+        'codes': codes,
+        'names': names[starts].astype(str),
+        'offsets': offsets,
+        'dates': dates,
+        'rain': rain,
+        'by_rain': by_rain,
+    }
+
+def index_path(rain_file):
+    """Cache file next to rain_file, named after it (rain_data.csv -> rain_data_index.npz)."""
+    stem = os.path.splitext(os.path.basename(rain_file))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(rain_file)), INDEX_FILE.format(stem=stem))
+
+def source_stamp(rain_file):
+    """Source path, size and mtime stored in the cache to detect a stale or foreign index."""
+    stat = os.stat(rain_file)
+    return {
+        'source': np.array(os.path.abspath(rain_file)),
+        'source_size': np.array(stat.st_size, dtype=np.int64),
+        'source_mtime': np.array(stat.st_mtime_ns, dtype=np.int64),
+    }
+
+def load_index(rain_file=RAIN_DATA_FILE, index_file=None):
+    """Loads the cached index, rebuilding it when it was built from another file or an older rain_file."""
+    index_file = index_file or index_path(rain_file)
+    stamp = source_stamp(rain_file)
+    if os.path.exists(index_file):
+        with np.load(index_file) as cached:
+            if all(k in cached.files and cached[k] == v for k, v in stamp.items()):
+                return {k: cached[k] for k in cached.files if k not in stamp}
+
+    index = build_index(pd.read_csv(rain_file, encoding='utf-8'))
+    np.savez(index_file, **index, **stamp)
+    return index
+
+def to_days(date):
+    return None if date is None else pd.Timestamp(date).to_datetime64().astype('datetime64[D]').astype(np.int64)
+
+def select_stations(index, regions=None):
+    """Station positions for the given region names or station codes (all stations if None)."""
+    if not regions:
+        return np.arange(len(index['codes']))
+    regions = {str(r) for r in regions}
+    return np.flatnonzero([name in regions or str(code) in regions
+                           for code, name in zip(index['codes'], index['names'])])
+
+def query_thresholds(index, thresholds, start=None, end=None, regions=None):
+    """
+    All days with rainfall >= each threshold, for many thresholds in one pass.
+    Per station the date range is found by binary search and the precomputed rainfall
+    order is filtered to it (rows are sorted by date, so the window is a row range).
+    Every threshold is then one searchsorted into that sorted rainfall.
+    Returns a DataFrame (threshold, 지점, 지역명, 일시, 일강수량(mm)).
+    """
+    thresholds = np.sort(np.asarray(thresholds, dtype=float))
+    start_day, end_day = to_days(start), to_days(end)
+    frames = []
+
+    for s in select_stations(index, regions):
+        lo, hi = index['offsets'][s], index['offsets'][s + 1]
+        dates = index['dates'][lo:hi]
+        a = lo if start_day is None else lo + np.searchsorted(dates, start_day, side='left')
+        b = hi if end_day is None else lo + np.searchsorted(dates, end_day, side='right')
+        if a >= b:
+            continue
+
+        # The station's rows are already ordered by rainfall; a date window only filters them
+        rows = index['by_rain'][lo:hi]
+        if a != lo or b != hi:
+            rows = rows[(rows >= a) & (rows < b)]
+        sorted_rain = index['rain'][rows]
+
+        cut = np.searchsorted(sorted_rain, thresholds, side='left')
+        for t, c in zip(thresholds, cut):
+            hit = np.sort(rows[c:])
+            if len(hit):
+                frames.append(pd.DataFrame({
+                    'threshold': t,
+                    '지점': index['codes'][s],
+                    '지역명': index['names'][s],
+                    '일시': index['dates'][hit],
+                    '일강수량(mm)': index['rain'][hit],
+                }))
+
+    if not frames:
+        return pd.DataFrame({
+            'threshold': pd.Series(dtype=float),
+            '지점': pd.Series(dtype=np.int64),
+            '지역명': pd.Series(dtype=object),
+            '일시': pd.Series(dtype='datetime64[ns]'),
+            '일강수량(mm)': pd.Series(dtype=float),
+        })
+    result = pd.concat(frames, ignore_index=True)
+    result['일시'] = result['일시'].to_numpy().astype('datetime64[D]')
+    return result
+
+def count_thresholds(index, thresholds, start=None, end=None, regions=None, by_year=False):
+    """Number of days >= each threshold per region (and year), as a wide table."""
+    hits = query_thresholds(index, thresholds, start, end, regions)
+    keys = ['지역명'] + (['year'] if by_year else [])
+    if by_year:
+        hits['year'] = hits['일시'].dt.year
+    counts = hits.groupby(keys + ['threshold']).size().unstack('threshold', fill_value=0)
+    return counts.reindex(columns=np.sort(np.asarray(thresholds, dtype=float)), fill_value=0)
+
+def top_n(index, n=10, per_year=True, start=None, end=None, regions=None):
+    """Top-N rainfall days per station (and year), in one sort over all rows."""
+    stations = select_stations(index, regions)
+    lengths = np.diff(index['offsets'])[stations]
+    rows = np.concatenate([np.arange(index['offsets'][s], index['offsets'][s + 1]) for s in stations]
+                          or [np.array([], dtype=np.int64)])
+    station_pos = np.repeat(stations, lengths)
+
+    dates = index['dates'][rows]
+    keep = np.ones(len(rows), dtype=bool)
+    if start is not None:
+        keep &= dates >= to_days(start)
+    if end is not None:
+        keep &= dates <= to_days(end)
+    rows, station_pos, dates = rows[keep], station_pos[keep], dates[keep]
+
+    year = dates.astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64) + 1970 if per_year \
+        else np.zeros(len(rows), dtype=np.int64)
+    rain = index['rain'][rows]
+
+    # Sort by group, then rainfall descending; rank = position within group
+    order = np.lexsort((-rain, year, station_pos))
+    group = np.stack([station_pos[order], year[order]], axis=1)
+    new_group = np.r_[True, (group[1:] != group[:-1]).any(axis=1)]
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(len(order)), 0))
+    rank = np.arange(len(order)) - group_start + 1
+    top = order[rank <= n]
+
+    result = pd.DataFrame({
+        '지점': index['codes'][station_pos[top]],
+        '지역명': index['names'][station_pos[top]],
+        '일시': dates[top].astype('datetime64[D]'),
+        '일강수량(mm)': rain[top],
+        'rank': rank[rank <= n],
+    })
+    if per_year:
+        result.insert(2, 'year', year[top])
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description='Heavy rainfall day queries over rain_data.csv')
+    parser.add_argument('--input', default=RAIN_DATA_FILE)
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[100.0], help='daily rainfall thresholds (mm)')
+    parser.add_argument('--start', default=None, help='YYYY-MM-DD')
+    parser.add_argument('--end', default=None, help='YYYY-MM-DD')
+    parser.add_argument('--region', nargs='+', default=None, help='region names (지역명) or station codes')
+    parser.add_argument('--counts', action='store_true', help='print day counts per region instead of dates')
+    parser.add_argument('--by-year', action='store_true', help='with --counts, count per year')
+    parser.add_argument('--top', type=int, default=None, help='top-N rainfall days per station and year')
+    parser.add_argument('--output', default=None, help='write the result to CSV instead of printing')
+    args = parser.parse_args()
 
-# Load the data
-df = pd.read_csv(RAIN_DATA_FILE, encoding='utf-8')
+    try:
+        index = load_index(args.input)
+    except FileNotFoundError:
+        print(f"Error: {args.input} not found.")
+        return
 
-# Filter for daily rainfall of 100mm or more
-heavy_rainfall_df = df[df['일강수량(mm)'] >= 100]
+    if args.top:
+        result = top_n(index, args.top, True, args.start, args.end, args.region)
+    elif args.counts:
+        result = count_thresholds(index, args.thresholds, args.start, args.end, args.region, args.by_year)
+    else:
+        result = query_thresholds(index, args.thresholds, args.start, args.end, args.region)
+        if not args.output:
+            # Dates per region, as before
+            for (threshold, region), dates in result.groupby(['threshold', '지역명'])['일시']:
+                print(f"지역: {region} (>= {threshold:g}mm)")
+                for date in dates:
+                    print(f"  - {date:%Y-%m-%d}")
+                print("-" * 30)
+            return
 
-# Group by region and collect the dates
-heavy_rainfall_by_region = heavy_rainfall_df.groupby('지역명')['일시'].apply(list)
+    if args.output:
+        result.to_csv(args.output, index=bool(args.counts and not args.top), encoding='utf-8')
+        print(f"Successfully created {args.output}")
+    else:
+        print(result.to_string())
 
-# Print the results
-for region, dates in heavy_rainfall_by_region.items():
-    print(f"지역: {region}")
-    for date in dates:
-        print(f"  - {date}")
-    print("-" * 30)
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import pandas as pd
+
+from combine_csv import REGION_MAP
+from aws_loader import read_chunks, report
+
+# Define file paths
+OBS_AWS_FILE = 'obs_aws_utf8.csv'
+OUTPUT_FILE = 'rain_intensity_daily.csv'
+CHUNK_SIZE = 500_000
+
+# Rolling accumulation windows and their output columns
+WINDOWS = {
+    '1h': '1시간 최다강수량(mm)',
+    '3h': '3시간 최다강수량(mm)',
+    '6h': '6시간 최다강수량(mm)',
+    '24h': '24시간 최다강수량(mm)',
+}
+CONTEXT = pd.Timedelta('24h')  # longest window; rows kept from the previous chunk
+
+def add_rolling_sums(work):
+    """Adds per-station rolling rainfall sums ending at each observation. `work` must be sorted by station and time."""
+    grouped = work.set_index('일시').groupby('지점', sort=False)['강수량(mm)']
+    for window, column in WINDOWS.items():
+        work[column] = grouped.rolling(window).sum().to_numpy()
+    return work
+
+def summarize_chunk(work):
+    """Daily total and rolling maxima of the rows that belong to this chunk (carried rows are context only)."""
+    new_rows = work[work['_new']]
+    day = new_rows['일시'].dt.normalize().rename('일시')
+    agg = {'지점명': 'first', '강수량(mm)': 'sum'}
+    agg.update({column: 'max' for column in WINDOWS.values()})
+    return new_rows.groupby([new_rows['지점'], day]).agg(agg)
+
+def compute_daily_intensity(input_file=OBS_AWS_FILE, chunksize=CHUNK_SIZE):
+    """
+    Streams high-frequency AWS observations (hourly or 10-minute) in chunks and builds a
+    per-station, per-day table of total rainfall and max 1h/3h/6h/24h accumulations.
+
+    Rows are expected in time order within each station, as KMA exports are. The last
+    24 hours of every station are carried into the next chunk so windows spanning a chunk
+    boundary are complete, and partial days are merged at the end.
+    """
+    carry = None
+    partials = []
+
+    stats = {}
+    for chunk in read_chunks(input_file, chunksize, usecols=['지점', '지점명', '일시', '강수량(mm)'], stats=stats):
+        # read_chunks already returns 지점 as int32, 일시 as datetime and drops rows without either
+        chunk['강수량(mm)'] = chunk['강수량(mm)'].fillna(0.0)
+        chunk['_new'] = True
+
+        work = chunk if carry is None else pd.concat([carry, chunk], ignore_index=True)
+        work = work.sort_values(['지점', '일시'], kind='stable').reset_index(drop=True)
+        work = add_rolling_sums(work)
+        partials.append(summarize_chunk(work))
+
+        # Keep the last 24 hours of every station as context for the next chunk
+        last_time = work.groupby('지점')['일시'].transform('max')
+        carry = work.loc[work['일시'] > last_time - CONTEXT, ['지점', '지점명', '일시', '강수량(mm)']]
+        carry = carry.assign(_new=False)
+
+    print(report(stats))
+    if not partials:
+        return pd.DataFrame()
+
+    # Merge days split across chunks
+    agg = {'지점명': 'first', '강수량(mm)': 'sum'}
+    agg.update({column: 'max' for column in WINDOWS.values()})
+    daily = pd.concat(partials).groupby(level=['지점', '일시']).agg(agg).reset_index()
+
+    daily['지역명'] = [REGION_MAP.get(str(code), name) for code, name in zip(daily['지점'], daily['지점명'])]
+    daily['일시'] = daily['일시'].dt.strftime('%Y-%m-%d')
+    daily = daily.rename(columns={'강수량(mm)': '일강수량(mm)'})
+    # float32 sums: round to the 0.1 mm precision of the source so the CSV has no float noise
+    value_cols = ['일강수량(mm)'] + list(WINDOWS.values())
+    daily[value_cols] = daily[value_cols].round(1)
+    return daily[['지점', '지역명', '일시', '일강수량(mm)'] + list(WINDOWS.values())]
+
+def main():
+    parser = argparse.ArgumentParser(description='Daily rainfall intensity features from hourly/10-minute AWS data')
+    parser.add_argument('--input', default=OBS_AWS_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--chunksize', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    try:
+        daily = compute_daily_intensity(args.input, args.chunksize)
+    except FileNotFoundError:
+        print(f"Error: {args.input} not found.")
+        return
+
+    daily.to_csv(args.output, index=False, encoding='utf-8')
+    print(f"Successfully created {args.output} ({len(daily)} station-days)")
+
+if __name__ == '__main__':
+    main()
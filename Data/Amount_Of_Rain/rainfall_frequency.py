@@ -0,0 +1,199 @@
+import math
+import warnings
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+RAIN_DATA_FILE = 'rain_data.csv'
+OUTPUT_FILE = 'rainfall_frequency.csv'
+
+RETURN_PERIODS = [2, 5, 10, 30, 50, 100]
+DISTRIBUTIONS = ('gev', 'gumbel')
+
+MIN_DAYS_PER_YEAR = 300   # years with fewer observed days are left out of the annual maxima
+MIN_YEARS = 10            # stations with fewer annual maxima are not fitted
+N_BOOTSTRAP = 1000
+BOOTSTRAP_BATCH = 100     # resamples per worker task
+CONFIDENCE = 0.95
+
+EULER = 0.5772156649015329
+
+def _gamma(x):
+    try:
+        return math.gamma(x)
+    except (ValueError, OverflowError):
+        return np.nan
+
+gamma = np.vectorize(_gamma, otypes=[float])
+
+def annual_maxima(df, min_days=MIN_DAYS_PER_YEAR):
+    """
+    (station × year) matrix of annual maximum daily rainfall, NaN for incomplete years.
+    Returns (maxima, station codes, station names, years).
+    """
+    df = df.dropna(subset=['일시'])
+    rain = pd.to_numeric(df['일강수량(mm)'], errors='coerce')
+    keys = pd.DataFrame({
+        '지점': df['지점'].astype(int).to_numpy(),
+        'year': pd.to_datetime(df['일시']).dt.year.to_numpy(),
+        'rain': rain.to_numpy(dtype=float),
+    })
+    stats = keys.groupby(['지점', 'year'])['rain'].agg(['max', 'count'])
+    stats.loc[stats['count'] < min_days, 'max'] = np.nan
+    maxima = stats['max'].unstack('year')
+
+    names = df.assign(지점=df['지점'].astype(int)).groupby('지점')['지역명'].last().reindex(maxima.index)
+    return maxima.to_numpy(), maxima.index.to_numpy(), names.to_numpy(), maxima.columns.to_numpy()
+
+def l_moments(samples):
+    """
+    Sample L-moments (l1, l2, t3) of every row at once; NaN entries are ignored.
+    Uses unbiased probability-weighted moments b0, b1, b2 of the ascending sample.
+    """
+    x = np.sort(samples, axis=-1)  # NaNs sort to the end
+    n = np.isfinite(x).sum(axis=-1, keepdims=True).astype(float)
+    i = np.arange(x.shape[-1], dtype=float)  # i = rank - 1
+    valid = i < n
+    x = np.where(valid, x, 0.0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        b0 = x.sum(axis=-1) / n[..., 0]
+        b1 = (x * i / (n - 1)).sum(axis=-1) / n[..., 0]
+        b2 = (x * i * (i - 1) / ((n - 1) * (n - 2))).sum(axis=-1) / n[..., 0]
+        l1 = b0
+        l2 = 2 * b1 - b0
+        t3 = (6 * b2 - 6 * b1 + b0) / l2
+    return l1, l2, t3, n[..., 0]
+
+def fit_gev(l1, l2, t3):
+    """GEV location, scale, shape (Hosking's k; k < 0 is heavy-tailed) from L-moments."""
+    c = 2.0 / (3.0 + t3) - math.log(2) / math.log(3)
+    k = 7.8590 * c + 2.9554 * c ** 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        g = gamma(np.where(np.isfinite(k), 1 + k, np.nan))
+        scale = l2 * k / ((1 - 2.0 ** -k) * g)
+        loc = l1 - scale * (1 - g) / k
+    return loc, scale, k
+
+def fit_gumbel(l1, l2):
+    scale = l2 / math.log(2)
+    return l1 - EULER * scale, scale
+
+def return_levels(samples, distribution, periods=RETURN_PERIODS, min_years=MIN_YEARS):
+    """
+    Return levels (..., len(periods)) for every row of samples (annual maxima), plus the
+    fitted parameters. Rows with fewer than min_years values are NaN.
+    """
+    l1, l2, t3, n = l_moments(samples)
+    y = -np.log(1.0 - 1.0 / np.asarray(periods, dtype=float))  # -ln F
+
+    if distribution == 'gev':
+        loc, scale, k = fit_gev(l1, l2, t3)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            levels = loc[..., None] + scale[..., None] / k[..., None] * (1 - y ** k[..., None])
+        params = {'loc': loc, 'scale': scale, 'shape': k}
+    else:
+        loc, scale = fit_gumbel(l1, l2)
+        levels = loc[..., None] - scale[..., None] * np.log(y)
+        params = {'loc': loc, 'scale': scale, 'shape': np.zeros_like(loc)}
+
+    levels[n < min_years] = np.nan
+    return levels, params
+
+def _bootstrap_batch(args):
+    """[worker] Return levels of `size` resamples of every station's annual maxima."""
+    maxima, distribution, periods, size, seed = args
+    rng = np.random.default_rng(seed)
+
+    # Compact each row so the first n entries are the observed maxima
+    compact = np.sort(maxima, axis=1)
+    n = np.isfinite(compact).sum(axis=1)
+
+    pick = (rng.random((size,) + compact.shape) * n[:, None]).astype(np.int64)
+    resampled = np.take_along_axis(np.broadcast_to(compact, (size,) + compact.shape), pick, axis=2)
+    resampled[:, np.arange(compact.shape[1])[None, :] >= n[:, None]] = np.nan
+
+    levels, _ = return_levels(resampled, distribution, periods)
+    return levels
+
+def bootstrap_intervals(maxima, distribution, periods=RETURN_PERIODS, n_bootstrap=N_BOOTSTRAP,
+                        confidence=CONFIDENCE, seed=0, max_workers=None):
+    """
+    Percentile bootstrap confidence intervals of the return levels, all stations at once.
+    Resamples are split into batches run in a process pool with independent seeds.
+    Returns (low, high) arrays of shape (stations, periods).
+    """
+    sizes = [min(BOOTSTRAP_BATCH, n_bootstrap - start) for start in range(0, n_bootstrap, BOOTSTRAP_BATCH)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(maxima, distribution, periods, size, s) for size, s in zip(sizes, seeds)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        levels = np.concatenate(list(executor.map(_bootstrap_batch, tasks)), axis=0)
+
+    alpha = (1 - confidence) / 2
+    with warnings.catch_warnings():
+        # Stations without enough years are all-NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        low, high = np.nanquantile(levels, [alpha, 1 - alpha], axis=0)
+    return low, high
+
+def frequency_table(df, distributions=DISTRIBUTIONS, periods=RETURN_PERIODS, n_bootstrap=N_BOOTSTRAP,
+                    confidence=CONFIDENCE, max_workers=None):
+    """Long table: one row per (station, distribution, return period) with CI and fitted parameters."""
+    maxima, codes, names, years = annual_maxima(df)
+    n_years = np.isfinite(maxima).sum(axis=1)
+
+    frames = []
+    for distribution in distributions:
+        levels, params = return_levels(maxima, distribution, periods)
+        if n_bootstrap:
+            low, high = bootstrap_intervals(maxima, distribution, periods, n_bootstrap, confidence,
+                                            max_workers=max_workers)
+        else:
+            low = high = np.full_like(levels, np.nan)
+
+        s, p = np.divmod(np.arange(levels.size), len(periods))
+        frames.append(pd.DataFrame({
+            '지점': codes[s],
+            '지역명': names[s],
+            'distribution': distribution,
+            'return_period': np.asarray(periods)[p],
+            'return_level_mm': levels.ravel(),
+            'ci_low_mm': low.ravel(),
+            'ci_high_mm': high.ravel(),
+            'n_years': n_years[s],
+            'loc': params['loc'][s],
+            'scale': params['scale'][s],
+            'shape': params['shape'][s],
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='Return-period daily rainfall per station (GEV/Gumbel by L-moments)')
+    parser.add_argument('--input', default=RAIN_DATA_FILE)
+    parser.add_argument('--store', default=None, help='read from an aws_store directory instead of --input')
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument('--periods', type=int, nargs='+', default=RETURN_PERIODS, help='return periods (years)')
+    parser.add_argument('--bootstrap', type=int, default=N_BOOTSTRAP, help='bootstrap resamples, 0 to skip')
+    parser.add_argument('--confidence', type=float, default=CONFIDENCE)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        if args.store:
+            from aws_store import load_aws
+            df = load_aws(columns=['지역명', '일강수량(mm)'], store_dir=args.store)
+        else:
+            df = pd.read_csv(args.input, encoding='utf-8')
+    except FileNotFoundError:
+        print(f"Error: {args.store or args.input} not found.")
+        return
+
+    table = frequency_table(df, args.distributions, args.periods, args.bootstrap, args.confidence, args.workers)
+    table.to_csv(args.output, index=False, encoding='utf-8')
+    print(f"Saved {table['지점'].nunique()} stations × {len(args.periods)} return periods to {args.output}")
+
+if __name__ == '__main__':
+    main()
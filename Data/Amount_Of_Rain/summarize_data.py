@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from aws_loader import read_chunks, report
+
 # Define file paths
 COMBINED_DATA_FILE = 'combined_data.csv'
 OBS_AWS_FILE = 'obs_aws_utf8.csv'
@@ -29,26 +31,31 @@ def append_obs_aws_data():
         print(f"Warning: {OBS_AWS_FILE} not found. Skipping append step.")
         return
 
-    # Read the data, handling potential parsing errors
+    # Stream the data in chunks; undecodable or malformed lines go to the quarantine folder
+    stats = {}
+    partials = []
     try:
-        df = pd.read_csv(OBS_AWS_FILE, encoding='utf-8', on_bad_lines='skip')
+        for chunk in read_chunks(OBS_AWS_FILE, usecols=['지점', '지점명', '일시', '강수량(mm)'], stats=stats):
+            # Group by day and aggregate (days split across chunks are merged below)
+            partials.append(chunk.groupby(chunk['일시'].dt.date).agg({
+                '지점': 'first',
+                '지점명': 'first',
+                '강수량(mm)': 'sum'
+            }))
     except Exception as e:
         print(f"Error reading {OBS_AWS_FILE}: {e}")
         return
+    print(report(stats))
+    if not partials:
+        print(f"Warning: no valid rows in {OBS_AWS_FILE}. Skipping append step.")
+        return
 
-    # Rename columns for consistency
-    df = df.rename(columns={'강수량(mm)': '일강수량(mm)'})
-
-    # Convert '일시' to datetime objects
-    df['일시'] = pd.to_datetime(df['일시'], errors='coerce')
-    df = df.dropna(subset=['일시'])  # Remove rows where date conversion failed
-
-    # Group by day and aggregate
-    daily_rain = df.groupby(df['일시'].dt.date).agg({
+    daily_rain = pd.concat(partials).groupby(level=0).agg({
         '지점': 'first',
         '지점명': 'first',
-        '일강수량(mm)': 'sum'
+        '강수량(mm)': 'sum'
     }).reset_index()
+    daily_rain = daily_rain.rename(columns={'강수량(mm)': '일강수량(mm)'})
 
     # Rename '일시' back to the original name for consistency
     daily_rain = daily_rain.rename(columns={'일시': '일시_date'})
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import aws_store
+
+HEADER = '지점,일시,일강수량(mm),평균기온(°C)\n'
+
+
+def write_download(input_dir, station, first, last, vintage, rain):
+    """One KMA daily export covering first..last, every day with the same rainfall."""
+    dates = pd.date_range(f'{first}-01-01', f'{last}-12-31', freq='D')
+    path = os.path.join(input_dir, f'SURFACE_AWS_{station}_DAY_{first}_{last}_{vintage}.csv')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.writelines(f'{station},{d:%Y-%m-%d},{rain},1.5\n' for d in dates)
+    return path
+
+
+def stored(store_dir):
+    return aws_store.load_aws(store_dir=store_dir)[['지점', '일시', '일강수량(mm)']]
+
+
+def test_ingest_refills_when_newest_vintage_disappears(tmp_path):
+    input_dir, store_dir, fresh_dir = str(tmp_path / 'in'), str(tmp_path / 'store'), str(tmp_path / 'fresh')
+    os.makedirs(input_dir)
+    write_download(input_dir, 400, 2019, 2020, 2021, rain=1.0)
+    newer = write_download(input_dir, 400, 2020, 2021, 2023, rain=2.0)
+    aws_store.build_store(input_dir, store_dir)
+    assert set(stored(store_dir).groupby(stored(store_dir)['일시'].dt.year)['일강수량(mm)'].first()) == {1.0, 2.0}
+
+    # The 2023 download is withdrawn: 2020 falls back to the 2021 vintage, 2021 keeps its stored rows
+    os.remove(newer)
+    assert aws_store.ingest(input_dir, store_dir) == 1
+
+    df = stored(store_dir)
+    by_year = df.groupby(df['일시'].dt.year)['일강수량(mm)'].agg(['min', 'max'])
+    assert by_year.loc[2019].tolist() == [1.0, 1.0]
+    assert by_year.loc[2020].tolist() == [1.0, 1.0]
+    assert by_year.loc[2021].tolist() == [2.0, 2.0]
+
+    # Apart from the uncovered year, the store matches a rebuild from the remaining files
+    aws_store.build_store(input_dir, fresh_dir)
+    pd.testing.assert_frame_equal(df[df['일시'].dt.year < 2021].reset_index(drop=True), stored(fresh_dir))
+
+
+def test_ingest_adds_newer_vintage(tmp_path):
+    input_dir, store_dir = str(tmp_path / 'in'), str(tmp_path / 'store')
+    os.makedirs(input_dir)
+    write_download(input_dir, 400, 2019, 2020, 2021, rain=1.0)
+    aws_store.build_store(input_dir, store_dir)
+
+    write_download(input_dir, 400, 2020, 2020, 2023, rain=3.0)
+    assert aws_store.ingest(input_dir, store_dir) == 1
+    df = stored(store_dir)
+    assert df.groupby(df['일시'].dt.year)['일강수량(mm)'].max().to_dict() == {2019: 1.0, 2020: 3.0}
+    assert aws_store.ingest(input_dir, store_dir) == 0
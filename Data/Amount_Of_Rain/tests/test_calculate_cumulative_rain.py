@@ -0,0 +1,75 @@
+import os
+import sys
+import csv
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from calculate_cumulative_rain import find_rain_events, HEADER
+
+
+def old_events(path):
+    """The row-by-row csv loop find_rain_events replaced (one event per run of rain > 0)."""
+    with open(path, 'r', newline='', encoding='utf-8') as infile:
+        data = sorted(csv.DictReader(infile), key=lambda row: (row['지점'], row['일시']))
+
+    def close(period):
+        return [period[0]['지점'], period[0]['지역명'], period[0]['일시'], period[-1]['일시'], len(period),
+                sum(float(row['일강수량(mm)']) for row in period)]
+
+    results, current_period, current_station = [], [], None
+    for row in data:
+        if row['지점'] != current_station:
+            if current_period:
+                results.append(close(current_period))
+            current_period, current_station = [], row['지점']
+        try:
+            rainfall = float(row['일강수량(mm)']) if row['일강수량(mm)'] else 0.0
+        except (ValueError, TypeError):
+            rainfall = 0.0
+        if rainfall > 0:
+            current_period.append(row)
+        elif current_period:
+            results.append(close(current_period))
+            current_period = []
+    if current_period:
+        results.append(close(current_period))
+    return pd.DataFrame(results, columns=HEADER[:-1])
+
+
+@pytest.fixture
+def rain_file(tmp_path):
+    """Daily rainfall for three stations, shuffled, with blanks and non-numeric values; wet on the last day."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for code, name in [('108', '서울'), ('400', '강남'), ('510', '영등포')]:
+        dates = pd.date_range('2020-01-01', '2021-12-31', freq='D')
+        rain = np.where(rng.random(len(dates)) < 0.35, np.round(rng.gamma(0.8, 12.0, len(dates)), 1), 0.0)
+        rain[-1] = 3.5
+        values = rain.astype(object)
+        values[rng.random(len(dates)) < 0.03] = ''
+        values[rng.random(len(dates)) < 0.01] = '-'
+        frames.append(pd.DataFrame({'지점': code, '지역명': name, '일시': dates.strftime('%Y-%m-%d'),
+                                    '일강수량(mm)': values}))
+    path = tmp_path / 'rain_data.csv'
+    pd.concat(frames).sample(frac=1, random_state=0).to_csv(path, index=False, encoding='utf-8')
+    return path
+
+
+def test_matches_old_loop(rain_file):
+    expected = old_events(rain_file)
+    df = pd.read_csv(rain_file, encoding='utf-8', dtype={'지점': str, '지역명': str, '일시': str})
+    result = find_rain_events(df)
+
+    assert len(result) == len(expected) > 100
+    pd.testing.assert_frame_equal(result[HEADER[:-1]].reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_dry_gap_merges_adjacent_events(rain_file):
+    df = pd.read_csv(rain_file, encoding='utf-8', dtype={'지점': str, '지역명': str, '일시': str})
+    events, merged = find_rain_events(df), find_rain_events(df, max_dry_gap=1)
+
+    assert len(merged) < len(events)
+    np.testing.assert_allclose(merged['기간 누적 강수량'].sum(), events['기간 누적 강수량'].sum())
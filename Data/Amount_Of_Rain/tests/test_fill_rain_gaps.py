@@ -0,0 +1,87 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fill_rain_gaps as fill
+
+
+def make_values(n_stations=6, n_days=900, missing=0.2, seed=0):
+    """Correlated stations: a shared storm signal plus station noise, with random gaps."""
+    rng = np.random.default_rng(seed)
+    common = rng.gamma(0.4, 20.0, n_days)
+    values = common * rng.uniform(0.6, 1.4, (n_stations, 1)) + rng.gamma(0.2, 3.0, (n_stations, n_days))
+    values[rng.random(values.shape) < missing] = np.nan
+    return np.round(values, 1)
+
+
+def reference_correlation_weights(values, n_neighbors, min_overlap):
+    """Pairwise np.corrcoef on co-observed days, one pair at a time."""
+    n = len(values)
+    weights = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            both = np.isfinite(values[i]) & np.isfinite(values[j])
+            if i != j and both.sum() >= min_overlap:
+                r = np.corrcoef(values[i, both], values[j, both])[0, 1]
+                weights[i, j] = max(r, 0.0) ** 2 if np.isfinite(r) else 0.0
+    return fill.top_neighbors(weights, n_neighbors)
+
+
+def reference_fill(values, in_record, weights):
+    """Normal-ratio weighted average of the observed neighbours, one missing cell at a time."""
+    filled, imputed = values.copy(), np.zeros(values.shape, dtype=bool)
+    for i, d in zip(*np.nonzero(~np.isfinite(values) & in_record)):
+        num = den = 0.0
+        for j in np.flatnonzero(weights[i]):
+            if np.isfinite(values[j, d]):
+                both = np.isfinite(values[i]) & np.isfinite(values[j])
+                ratio = values[i, both].sum() / values[j, both].sum() if values[j, both].sum() else 1.0
+                num += weights[i, j] * ratio * values[j, d]
+                den += weights[i, j]
+        if den > 0:
+            filled[i, d], imputed[i, d] = num / den, True
+    return filled, imputed
+
+
+def test_correlation_weights_match_pairwise_corrcoef():
+    values = make_values()
+    np.testing.assert_allclose(fill.correlation_weights(values, n_neighbors=3, min_overlap=100),
+                               reference_correlation_weights(values, 3, 100), atol=1e-9)
+
+
+def test_fill_gaps_matches_cell_by_cell_reference():
+    values = make_values()
+    in_record = np.ones(values.shape, dtype=bool)
+    in_record[0, :50] = False
+    weights = fill.correlation_weights(values, n_neighbors=3, min_overlap=100)
+
+    filled, imputed = fill.fill_gaps(values, in_record, weights)
+    expected, expected_imputed = reference_fill(values, in_record, weights)
+    np.testing.assert_array_equal(imputed, expected_imputed)
+    np.testing.assert_allclose(filled, expected, rtol=1e-9, equal_nan=True)
+    assert not imputed[0, :50].any()
+
+
+def test_fill_rain_data_keeps_observed_rows():
+    values = make_values(n_stations=3)
+    calendar = pd.date_range('2020-01-01', periods=values.shape[1], freq='D')
+    rows = [(400 + i, f'station{i}', day.strftime('%Y-%m-%d'), v)
+            for i in range(len(values)) for day, v in zip(calendar, values[i])]
+    df = pd.DataFrame(rows, columns=['지점', '지역명', '일시', '일강수량(mm)'])
+    # A missing row is a gap too, like an empty field
+    df = df.drop(index=[5, 6]).reset_index(drop=True)
+
+    result = fill.fill_rain_data(df, n_neighbors=2)
+    assert len(result) == values.size
+    merged = result.merge(df, on=['지점', '일시'], suffixes=('', '_raw'))
+    observed = merged['일강수량(mm)_raw'].notna()
+    np.testing.assert_array_equal(merged.loc[observed, '일강수량(mm)'], merged.loc[observed, '일강수량(mm)_raw'])
+    assert (merged.loc[observed, fill.IMPUTED_COL] == 0).all()
+    # Every gap is either imputed or left empty when no neighbour observed that day
+    imputed = result[fill.IMPUTED_COL] == 1
+    assert result.loc[imputed, '일강수량(mm)'].notna().all()
+    assert imputed.sum() + result['일강수량(mm)'].isna().sum() == (~observed).sum() + 2
+    assert imputed.sum() > 0
@@ -0,0 +1,76 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import find_heavy_rainfall_dates as heavy
+
+THRESHOLDS = [0.0, 30.0, 50.0, 80.0, 100.0, 150.0]
+
+
+def make_rain(seed=0, stations=((108, '서울'), (116, '관악'), (400, '강남'))):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2001-01-01', '2005-12-31', freq='D')
+    frames = []
+    for code, name in stations:
+        rain = np.round(rng.gamma(0.3, 30.0, len(dates)), 1)
+        frames.append(pd.DataFrame({'지점': code, '지역명': name, '일시': dates.strftime('%Y-%m-%d'),
+                                    '일강수량(mm)': rain}))
+    # Unsorted input, like a concatenated CSV
+    return pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=seed)
+
+
+def pandas_filter(df, threshold, start=None, end=None, regions=None):
+    """Reference: the pandas filter the original script used."""
+    dates = pd.to_datetime(df['일시'])
+    mask = df['일강수량(mm)'] >= threshold
+    if start is not None:
+        mask &= dates >= pd.Timestamp(start)
+    if end is not None:
+        mask &= dates <= pd.Timestamp(end)
+    if regions is not None:
+        mask &= df['지역명'].isin(regions)
+    hits = df[mask]
+    return sorted(zip(hits['지점'], pd.to_datetime(hits['일시']).dt.strftime('%Y-%m-%d'), hits['일강수량(mm)']))
+
+
+@pytest.mark.parametrize('start,end,regions', [
+    (None, None, None),
+    ('2002-03-15', '2004-07-01', None),
+    ('2003-01-01', None, ['관악']),
+    (None, '2001-12-31', ['서울', '강남']),
+])
+def test_query_thresholds_matches_pandas_filter(start, end, regions):
+    df = make_rain()
+    result = heavy.query_thresholds(heavy.build_index(df), THRESHOLDS, start, end, regions)
+    for t in THRESHOLDS:
+        hits = result[result['threshold'] == t]
+        got = sorted(zip(hits['지점'], hits['일시'].dt.strftime('%Y-%m-%d'), hits['일강수량(mm)']))
+        assert got == pandas_filter(df, t, start, end, regions)
+
+
+def test_index_cache_is_per_input(tmp_path):
+    first, second = str(tmp_path / 'first.csv'), str(tmp_path / 'second.csv')
+    make_rain(seed=1).to_csv(first, index=False)
+    make_rain(seed=2, stations=((510, '영등포'),)).to_csv(second, index=False)
+
+    heavy.load_index(first)
+    assert os.path.exists(str(tmp_path / 'first_index.npz'))
+    index = heavy.load_index(second)
+    assert list(index['names']) == ['영등포']
+    assert sorted(heavy.load_index(first)['names']) == ['강남', '관악', '서울']
+
+
+def test_index_cache_rebuilt_when_source_changes(tmp_path):
+    path = str(tmp_path / 'rain.csv')
+    make_rain(seed=1).to_csv(path, index=False)
+    heavy.load_index(path)
+
+    make_rain(seed=2, stations=((510, '영등포'),)).to_csv(path, index=False)
+    # Same mtime as the cached index, but a different size
+    stat = os.stat(str(tmp_path / 'rain_index.npz'))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert list(heavy.load_index(path)['names']) == ['영등포']
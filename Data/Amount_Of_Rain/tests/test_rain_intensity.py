@@ -0,0 +1,57 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import rain_intensity
+
+
+@pytest.fixture
+def obs_file(tmp_path):
+    """Hourly observations for two stations, in time order within each station, with a few gaps."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for code, name in [(400, '강남'), (510, '영등포')]:
+        times = pd.date_range('2022-08-07', '2022-08-12 23:00', freq='h')
+        times = times[rng.random(len(times)) > 0.05]
+        rain = np.round(rng.gamma(0.3, 8.0, len(times)), 1)
+        frames.append(pd.DataFrame({'지점': code, '지점명': name, '일시': times.strftime('%Y-%m-%d %H:%M'),
+                                    '강수량(mm)': rain}))
+    path = str(tmp_path / 'obs.csv')
+    pd.concat(frames).to_csv(path, index=False, encoding='utf-8')
+    return path
+
+
+def reference_daily(path):
+    """Unchunked float64 rolling sums over the whole file."""
+    df = pd.read_csv(path, encoding='utf-8', parse_dates=['일시']).sort_values(['지점', '일시'])
+    rolled = df.set_index('일시').groupby('지점')['강수량(mm)']
+    for window, column in rain_intensity.WINDOWS.items():
+        df[column] = rolled.rolling(window).sum().to_numpy()
+    agg = {'강수량(mm)': 'sum', **{c: 'max' for c in rain_intensity.WINDOWS.values()}}
+    return df.groupby(['지점', df['일시'].dt.strftime('%Y-%m-%d')]).agg(agg).reset_index()
+
+
+@pytest.mark.parametrize('chunksize', [7, 50, 1000])
+def test_chunked_matches_unchunked(obs_file, chunksize, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    chunked = rain_intensity.compute_daily_intensity(obs_file, chunksize)
+    whole = rain_intensity.compute_daily_intensity(obs_file, 10 ** 6)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+    expected = reference_daily(obs_file)
+    assert chunked[['지점', '일시']].values.tolist() == expected[['지점', '일시']].values.tolist()
+    np.testing.assert_allclose(chunked['일강수량(mm)'], expected['강수량(mm)'], atol=0.051)
+    for column in rain_intensity.WINDOWS.values():
+        np.testing.assert_allclose(chunked[column], expected[column], atol=0.051)
+
+
+def test_output_is_rounded(obs_file, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    daily = rain_intensity.compute_daily_intensity(obs_file, 50)
+    daily.to_csv('out.csv', index=False)
+    for value in pd.read_csv('out.csv', dtype=str)[list(rain_intensity.WINDOWS.values())].to_numpy().ravel():
+        assert len(value.split('.')[-1]) <= 1, value
@@ -0,0 +1,148 @@
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+# Station table and header layout of the real AWS exports
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Amount_Of_Rain'))
+from combine_csv import REGION_MAP
+
+AWS_HEADER = ['지점', '일시', '평균기온(°C)', '최저기온(°C)', '최저기온 시각(hhmi)', '최고기온(°C)',
+              '최고기온 시각(hhmi)', '일강수량(mm)', '최대 순간 풍속(m/s)', '평균 풍속(m/s)', '최대 순간 풍속 풍향(deg)']
+
+SEOUL_DISTRICTS = ['강남구', '강동구', '강북구', '강서구', '관악구', '광진구', '구로구', '금천구', '노원구',
+                   '도봉구', '동대문구', '동작구', '마포구', '서대문구', '서초구', '성동구', '성북구', '송파구',
+                   '양천구', '영등포구', '용산구', '은평구', '종로구', '중구', '중랑구']
+
+SURVEY_YEARS = [2000, 2007, 2009, 2013, 2014, 2018, 2019, 2020, 2021, 2022, 2023, 2024]
+
+# Fine (L3) codes as they appear in *_summary.csv
+L3_CODES = [111, 112, 121, 131, 132, 141, 151, 152, 153, 154, 155, 156, 161,
+            211, 212, 221, 222, 231, 241, 251, 252, 311, 321, 331, 411, 421,
+            511, 521, 611, 612, 621, 622, 623, 711, 712]
+
+def district_names(scale):
+    """The 25 Seoul districts, replicated (강남구, 강남구_2, ...) for scale > 1."""
+    names = list(SEOUL_DISTRICTS)
+    for copy in range(2, int(scale) + 1):
+        names += [f'{name}_{copy}' for name in SEOUL_DISTRICTS]
+    return names
+
+def station_codes(scale):
+    """REGION_MAP stations plus synthetic codes from 1000 upward for scale > 1."""
+    codes = [int(code) for code in REGION_MAP]
+    extra = len(codes) * (int(scale) - 1)
+    return codes + list(range(1000, 1000 + extra))
+
+def make_aws_daily(out_dir, scale=1, start_year=1997, end_year=2024, seed=0):
+    """One SURFACE_AWS_<station>_DAY_<year>_<year>_<vintage>.csv per station-year, like converted_data/."""
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+
+    for code in station_codes(scale):
+        for year in range(start_year, end_year + 1):
+            days = pd.date_range(f'{year}-01-01', f'{year}-12-31', freq='D')
+            n = len(days)
+            temp = 12 - 14 * np.cos(2 * np.pi * days.dayofyear / 365) + rng.normal(0, 3, n)
+            rain = np.where(rng.random(n) < 0.3, rng.gamma(0.6, 15, n), 0.0)
+
+            df = pd.DataFrame({
+                '지점': code,
+                '일시': days.strftime('%Y-%m-%d'),
+                '평균기온(°C)': temp.round(1),
+                '최저기온(°C)': (temp - rng.uniform(2, 8, n)).round(1),
+                '최저기온 시각(hhmi)': rng.integers(0, 2400, n),
+                '최고기온(°C)': (temp + rng.uniform(2, 8, n)).round(1),
+                '최고기온 시각(hhmi)': rng.integers(0, 2400, n),
+                '일강수량(mm)': rain.round(1),
+                '최대 순간 풍속(m/s)': rng.uniform(2, 20, n).round(1),
+                '평균 풍속(m/s)': rng.uniform(0.5, 6, n).round(1),
+                '최대 순간 풍속 풍향(deg)': rng.uniform(0, 360, n).round(1),
+            }, columns=AWS_HEADER)
+
+            # Empty fields as in the raw exports
+            for col in AWS_HEADER[2:]:
+                df[col] = df[col].astype(object).where(rng.random(n) > 0.03, '')
+
+            df.to_csv(os.path.join(out_dir, f'SURFACE_AWS_{code}_DAY_{year}_{year}_2024.csv'),
+                      index=False, encoding='utf-8')
+
+def make_rain_data(path, scale=1, start_year=1997, end_year=2024, seed=0):
+    """rain_data.csv (지점, 지역명, 일시, 일강수량(mm)) as written by summarize_data.py."""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(f'{start_year}-01-01', f'{end_year}-12-31', freq='D')
+    codes = station_codes(scale)
+
+    rain = np.where(rng.random((len(codes), len(days))) < 0.3, rng.gamma(0.6, 15, (len(codes), len(days))), 0.0)
+    df = pd.DataFrame({
+        '지점': np.repeat(codes, len(days)),
+        '지역명': np.repeat([REGION_MAP.get(str(c), f'가상{c}') for c in codes], len(days)),
+        '일시': np.tile(days.strftime('%Y-%m-%d'), len(codes)),
+        '일강수량(mm)': rain.ravel().round(1),
+    })
+    df.to_csv(path, index=False, encoding='utf-8')
+    return len(df)
+
+def make_land_summaries(base_dir, scale=1, years=SURVEY_YEARS, seed=0):
+    """
+    Per-year <year>/<year>_summary.csv (L3_CODE) and <year>/<year>_lv2_summary.csv (L2_CODE),
+    as produced by intersect_sigungu.py. Districts drift slowly from year to year.
+    """
+    rng = np.random.default_rng(seed)
+    names = district_names(scale)
+    base_area = rng.uniform(1e4, 5e6, (len(names), len(L3_CODES)))
+
+    for i, year in enumerate(years):
+        area = base_area * (1 + 0.01 * i * rng.normal(0, 1, base_area.shape)).clip(0.5)
+        summary = pd.DataFrame({
+            'SIGUNGU_NM': np.repeat(names, len(L3_CODES)),
+            'L3_CODE': np.tile(L3_CODES, len(names)),
+            'AREA_M2': area.ravel(),
+        })
+        year_dir = os.path.join(base_dir, str(year))
+        os.makedirs(year_dir, exist_ok=True)
+        summary.to_csv(os.path.join(year_dir, f'{year}_summary.csv'), index=False, encoding='utf-8-sig')
+
+        lv2 = summary.assign(L2_CODE=summary['L3_CODE'] // 10 * 10)
+        lv2 = lv2.groupby(['SIGUNGU_NM', 'L2_CODE'], as_index=False)['AREA_M2'].sum()
+        lv2.to_csv(os.path.join(year_dir, f'{year}_lv2_summary.csv'), index=False, encoding='utf-8-sig')
+
+def make_land_polygons(out_dir, scale=1, cells_per_district=400, district_size=4000.0, seed=0):
+    """
+    Square district boundaries (SIGUNGU_CD, SIGUNGU_NM) and a land-cover layer of square parcels
+    with L3_CODE/AREA_M2 in EPSG:5179. The parcel grid is offset from the district grid so a
+    share of parcels crosses district boundaries. Returns (land_path, sigungu_path, parcel count).
+    """
+    import geopandas as gpd
+    import shapely
+
+    rng = np.random.default_rng(seed)
+    os.makedirs(out_dir, exist_ok=True)
+    names = district_names(scale)
+
+    # Districts on a near-square grid
+    cols = int(np.ceil(np.sqrt(len(names))))
+    origin_x, origin_y = 950_000.0, 1_940_000.0
+    dx = origin_x + (np.arange(len(names)) % cols) * district_size
+    dy = origin_y + (np.arange(len(names)) // cols) * district_size
+    sigungu = gpd.GeoDataFrame({
+        'SIGUNGU_CD': [str(11010 + i) for i in range(len(names))],
+        'SIGUNGU_NM': names,
+    }, geometry=shapely.box(dx, dy, dx + district_size, dy + district_size), crs='EPSG:5179')
+
+    # Parcels over the same extent
+    per_side = int(np.sqrt(cells_per_district))
+    size = district_size / per_side
+    rows = int(np.ceil(len(names) / cols))
+    px, py = np.meshgrid(origin_x + size / 2 + np.arange(cols * per_side - 1) * size,
+                         origin_y + size / 2 + np.arange(rows * per_side - 1) * size)
+    px, py = px.ravel(), py.ravel()
+    land = gpd.GeoDataFrame({'L3_CODE': rng.choice(L3_CODES, len(px))},
+                            geometry=shapely.box(px, py, px + size, py + size), crs='EPSG:5179')
+    land['AREA_M2'] = land.geometry.area
+
+    land_path = os.path.join(out_dir, 'synthetic_add_area.shp')
+    sigungu_path = os.path.join(out_dir, 'synthetic_sigungu.shp')
+    land.to_file(land_path, encoding='utf-8')
+    sigungu.to_file(sigungu_path, encoding='utf-8')
+    return land_path, sigungu_path, len(land)
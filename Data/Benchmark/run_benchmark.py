@@ -0,0 +1,214 @@
+import os
+import sys
+import json
+import glob
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+import multiprocessing as mp
+
+import pandas as pd
+
+import generate_synthetic as synth
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.dirname(SCRIPT_DIR)
+# Written to --work-dir if given, otherwise next to this script
+OUTPUT_NAME = 'benchmark_results.json'
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, OUTPUT_NAME)
+
+# Stage -> folder (relative to Data/) of the script it exercises, in pipeline order
+STAGES = {
+    'combine_csv': 'Amount_Of_Rain',
+    'calculate_cumulative_rain': 'Amount_Of_Rain',
+    'intersect_sigungu': 'Land_Cover_Info/Origin',
+    'calc_impervious_consistent': 'Land_Cover_Info/ImperviousData',
+    'mapping_land_cover': 'Land_Cover_Info/Seoul_Land_Cover',
+    'interpolate_impervious': 'Land_Cover_Info/ImperviousData',
+    'merge_land_info': 'Land_Cover_Info/Seoul_Land_Cover',
+}
+
+# Stage -> stages whose outputs it reads; those inputs are not generated synthetically
+PREREQUISITES = {
+    'interpolate_impervious': ['calc_impervious_consistent'],
+    'merge_land_info': ['mapping_land_cover', 'interpolate_impervious'],
+}
+
+def with_prerequisites(stages):
+    """The given stages plus every stage they depend on, in pipeline order."""
+    selected = set()
+    stack = list(stages)
+    while stack:
+        stage = stack.pop()
+        if stage not in selected:
+            selected.add(stage)
+            stack.extend(PREREQUISITES.get(stage, []))
+    return [s for s in STAGES if s in selected]
+
+# --- Stage runners (executed inside the child process) ---
+
+def run_combine_csv(work):
+    import combine_csv
+    os.chdir(os.path.join(work, 'aws'))
+    combine_csv.main()
+
+def run_calculate_cumulative_rain(work):
+    from calculate_cumulative_rain import find_rain_events
+    df = pd.read_csv(os.path.join(work, 'aws', 'rain_data.csv'), encoding='utf-8',
+                     dtype={'지점': str, '지역명': str, '일시': str})
+    find_rain_events(df).to_csv(os.path.join(work, 'aws', 'cumulative_rain_data.csv'), index=False, encoding='utf-8')
+
+def run_intersect_sigungu(work):
+    from intersect_sigungu import process_target
+    polygons = os.path.join(work, 'polygons')
+    process_target(os.path.join(polygons, 'synthetic_add_area.shp'),
+                   os.path.join(polygons, 'synthetic_sigungu.shp'), polygons)
+
+def run_calc_impervious_consistent(work):
+    from calc_impervious_consistent import calculate_impervious_consistent
+    land_cover = os.path.join(work, 'land', 'Seoul_Land_Cover')
+    for path in sorted(glob.glob(os.path.join(land_cover, '*', '[0-9][0-9][0-9][0-9]_summary.csv'))):
+        calculate_impervious_consistent(path)
+
+    # interpolate_impervious reads the results from ImperviousData/
+    impervious_dir = os.path.join(work, 'land', 'ImperviousData')
+    os.makedirs(impervious_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(land_cover, '*', '*_impervious_summary.csv')):
+        shutil.move(path, os.path.join(impervious_dir, os.path.basename(path)))
+
+def run_mapping_land_cover(work):
+    from mapping_land_cover import process_mixed_land_cover
+    process_mixed_land_cover(base_folder=os.path.join(work, 'land', 'Seoul_Land_Cover'))
+
+def run_interpolate_impervious(work):
+    from interpolate_impervious import interpolate_impervious_data
+    interpolate_impervious_data(folder_path=os.path.join(work, 'land', 'ImperviousData'))
+
+def run_merge_land_info(work):
+    from merge_land_info import merge_land_info
+    from interpolate_impervious import find_output
+    merge_land_info(land_cover_path=os.path.join(work, 'land', 'Seoul_Land_Cover', 'Seoul_LandCover_Mapping.csv'),
+                    impervious_path=find_output(os.path.join(work, 'land', 'ImperviousData')),
+                    output_path=os.path.join(work, 'land', 'Seoul_Land_info.csv'))
+
+def max_rss_mb():
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)."""
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def stage_worker(stage, work, queue):
+    """Runs one stage in a fresh process so timings and peak memory are not shared between stages."""
+    sys.path.insert(0, os.path.join(DATA_DIR, STAGES[stage]))
+    sys.path.insert(1, os.path.join(DATA_DIR, 'Land_Cover_Info', 'ImperviousData'))
+    runner = globals()[f'run_{stage}']
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            # Import the module first so its import cost is not part of the timing
+            __import__(stage)
+            baseline = max_rss_mb()
+            start = time.perf_counter()
+            runner(work)
+            seconds = time.perf_counter() - start
+        queue.put({'status': 'ok', 'seconds': round(seconds, 4),
+                   'peak_rss_mb': round(max_rss_mb(), 1), 'baseline_rss_mb': round(baseline, 1)})
+    except ImportError as e:
+        queue.put({'status': 'skipped', 'error': str(e)})
+    except Exception as e:
+        queue.put({'status': 'error', 'error': f'{type(e).__name__}: {e}'})
+
+def run_stage(stage, work):
+    ctx = mp.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=stage_worker, args=(stage, work, queue))
+    process.start()
+    process.join()
+    if queue.empty():
+        return {'status': 'error', 'error': f'child exited with code {process.exitcode}'}
+    return queue.get()
+
+# --- Input generation (not timed) ---
+
+def prepare_inputs(work, scale, stages, start_year, end_year):
+    """Generates only the inputs the selected stages start from."""
+    sizes = {}
+    if 'combine_csv' in stages:
+        synth.make_aws_daily(os.path.join(work, 'aws', 'converted_data'), scale, start_year, end_year)
+        sizes['aws_files'] = len(os.listdir(os.path.join(work, 'aws', 'converted_data')))
+    if 'calculate_cumulative_rain' in stages:
+        os.makedirs(os.path.join(work, 'aws'), exist_ok=True)
+        sizes['rain_rows'] = synth.make_rain_data(os.path.join(work, 'aws', 'rain_data.csv'), scale, start_year, end_year)
+    if stages & {'calc_impervious_consistent', 'mapping_land_cover', 'interpolate_impervious', 'merge_land_info'}:
+        synth.make_land_summaries(os.path.join(work, 'land', 'Seoul_Land_Cover'), scale)
+        sizes['districts'] = len(synth.district_names(scale))
+    if 'intersect_sigungu' in stages:
+        try:
+            _, _, sizes['polygons'] = synth.make_land_polygons(os.path.join(work, 'polygons'), scale)
+        except ImportError as e:
+            print(f"  intersect_sigungu inputs not generated: {e}")
+    return sizes
+
+def run_benchmark(scales, stages, work_dir=None, output=None, start_year=1997, end_year=2024, keep=False):
+    selected = with_prerequisites(stages)
+    added = [s for s in selected if s not in stages]
+    if added:
+        print(f"Adding prerequisite stages: {', '.join(added)}")
+    output = output or (os.path.join(work_dir, OUTPUT_NAME) if work_dir else OUTPUT_FILE)
+    run = {
+        'timestamp': pd.Timestamp.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': [],
+    }
+
+    for scale in scales:
+        work = tempfile.mkdtemp(prefix=f'bench_{scale}x_', dir=work_dir)
+        print(f"[scale {scale}x] generating inputs in {work}")
+        sizes = prepare_inputs(work, scale, set(selected), start_year, end_year)
+
+        for stage in selected:
+            result = {'scale': scale, 'stage': stage, 'inputs': sizes, **run_stage(stage, work)}
+            run['results'].append(result)
+            if result['status'] == 'ok':
+                print(f"  {stage:<28} {result['seconds']:>9.3f} s  peak {result['peak_rss_mb']:>8.1f} MB")
+            else:
+                print(f"  {stage:<28} {result['status']}: {result.get('error')}")
+
+        if not keep:
+            shutil.rmtree(work, ignore_errors=True)
+
+    # Results accumulate across runs so regressions show up against earlier entries
+    history = []
+    if os.path.exists(output):
+        with open(output, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    history.append(run)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+    print(f"Results appended to {output}")
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pipeline stages on synthetic Seoul-shaped data')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1], help='scale factors, e.g. 1 10 100')
+    parser.add_argument('--stages', nargs='+', default=list(STAGES),
+                        help=f'subset of: {", ".join(STAGES)} (prerequisite stages are added)')
+    parser.add_argument('--start-year', type=int, default=1997)
+    parser.add_argument('--end-year', type=int, default=2024)
+    parser.add_argument('--work-dir', default=None, help='where synthetic inputs are generated (default: temp dir)')
+    parser.add_argument('--output', default=None, help=f'results JSON (default: {OUTPUT_NAME} in --work-dir or {SCRIPT_DIR})')
+    parser.add_argument('--keep', action='store_true', help='keep generated inputs and outputs')
+    args = parser.parse_args()
+
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    run_benchmark(args.scale, args.stages, args.work_dir, args.output, args.start_year, args.end_year, args.keep)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.dirname(SCRIPT_DIR)
+
+sys.path.append(os.path.join(DATA_DIR, 'Amount_Of_Rain'))
+from combine_csv import REGION_MAP
+
+INUNDATION_FILE = os.path.join(SCRIPT_DIR, 'Merged_Inundation_Data.csv')
+LAND_INFO_FILE = os.path.join(DATA_DIR, 'Land_Cover_Info', 'Seoul_Land_info.csv')
+RAIN_EVENT_FILE = os.path.join(DATA_DIR, 'Amount_Of_Rain', 'cumulative_rain_data.csv')
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, 'inundation_features.npz')
+
+TARGET = '피해액'
+KEY_COLS = ['year', 'month', 'region_name']
+
+# Stations whose REGION_MAP name is not '<district>' + '구'
+STATION_DISTRICT = {'410': '동작구', '889': '동작구', '425': '관악구'}
+
+HEAVY_EVENT_MM = 80.0
+
+def station_districts():
+    """Station code -> district name ('강남' -> '강남구'); stations outside any district are left out."""
+    mapping = {}
+    for code, name in REGION_MAP.items():
+        if code in STATION_DISTRICT:
+            mapping[int(code)] = STATION_DISTRICT[code]
+        elif name in ('기상청', '한강', '북한산', '북악산', '남현', '현충원'):
+            continue
+        else:
+            mapping[int(code)] = name if name.endswith('구') else name + '구'
+    return mapping
+
+def encode_keys(years, districts, district_index):
+    """(year, district) -> one int64 key for hash lookups (pd.Index.get_indexer)."""
+    return np.asarray(years, dtype=np.int64) * 1000 + district_index.get_indexer(districts)
+
+def monthly_rain_features(events, district_index, years):
+    """
+    Per (district, month) rain-event aggregates over a full monthly calendar, with lags.
+    Events are assigned to the month they start in; district values are the max over its stations.
+    """
+    events = events.copy()
+    events['district'] = events['지점'].astype(int).map(station_districts())
+    events = events.dropna(subset=['district'])
+    start = pd.to_datetime(events['강수 시작일'])
+    events['period'] = start.dt.year * 12 + start.dt.month - 1
+
+    total = events['기간 누적 강수량'].astype(float)
+    per_station = events.assign(heavy=(total >= HEAVY_EVENT_MM).astype(float)).groupby(['district', '지점', 'period']).agg(
+        event_count=('기간 누적 강수량', 'size'),
+        event_total_sum=('기간 누적 강수량', 'sum'),
+        event_total_max=('기간 누적 강수량', 'max'),
+        event_duration_max=('강수 기간', 'max'),
+        heavy_event_count=('heavy', 'sum'),
+    )
+    per_district = per_station.groupby(level=['district', 'period']).max()
+
+    # Dense (district × month) grid so lags and rolling windows are positional
+    first, last = (min(years) - 1) * 12, max(years) * 12 + 11
+    periods = np.arange(first, last + 1)
+    names = list(per_district.columns)
+    grid = np.zeros((len(district_index), len(periods), len(names)), dtype=np.float64)
+    d_pos = district_index.get_indexer(per_district.index.get_level_values('district'))
+    p_pos = per_district.index.get_level_values('period').to_numpy() - first
+    ok = (d_pos >= 0) & (p_pos >= 0) & (p_pos < len(periods))
+    grid[d_pos[ok], p_pos[ok]] = per_district.to_numpy()[ok]
+    # Districts without a station have no rain information rather than zero rain
+    grid[~district_index.isin(list(station_districts().values()))] = np.nan
+
+    # Lagged / rolling features on the monthly event total
+    total_idx = names.index('event_total_sum')
+    monthly = grid[:, :, total_idx]
+    lag1 = np.concatenate([np.zeros((len(district_index), 1)), monthly[:, :-1]], axis=1)
+    csum = np.concatenate([np.zeros((len(district_index), 1)), np.cumsum(monthly, axis=1)], axis=1)
+    roll3 = csum[:, 1:] - csum[:, np.maximum(np.arange(len(periods)) - 2, 0)]
+
+    grid = np.concatenate([grid, lag1[:, :, None], roll3[:, :, None]], axis=2)
+    names += ['event_total_sum_lag1', 'event_total_sum_roll3']
+    return grid, first, ['rain_' + n for n in names]
+
+def build_features(inundation_file=INUNDATION_FILE, land_info_file=LAND_INFO_FILE, rain_event_file=RAIN_EVENT_FILE):
+    """
+    Joins damage records with land cover (year, district) and rain-event features (year, month, district).
+    Returns (X float32, y float32, feature_names, keys DataFrame).
+    """
+    damage = pd.read_csv(inundation_file)
+    land = pd.read_csv(land_info_file)
+    events = pd.read_csv(rain_event_file, dtype={'지점': str})
+
+    district_index = pd.Index(np.sort(pd.unique(np.concatenate([damage['region_name'], land['SIGUNGU_NM']]))))
+
+    # Base features: numeric columns of the damage table except keys/target
+    base_cols = [c for c in damage.columns if c not in KEY_COLS + ['region_code', TARGET]]
+    blocks = [damage[base_cols].to_numpy(dtype=np.float64)]
+    names = list(base_cols)
+
+    # Land cover by (year, district) with year-over-year change of the impervious ratio
+    land = land.sort_values(['SIGUNGU_NM', 'YEAR'])
+    land['IMPERVIOUS_RATIO_DIFF1'] = land.groupby('SIGUNGU_NM')['IMPERVIOUS_RATIO'].diff()
+    land_cols = [c for c in land.columns if c not in ('YEAR', 'SIGUNGU_NM')]
+    land_index = pd.Index(encode_keys(land['YEAR'], land['SIGUNGU_NM'], district_index))
+    pos = land_index.get_indexer(encode_keys(damage['year'], damage['region_name'], district_index))
+    land_values = land[land_cols].to_numpy(dtype=np.float64)
+    blocks.append(np.where((pos >= 0)[:, None], land_values[np.maximum(pos, 0)], np.nan))
+    names += ['land_' + c for c in land_cols]
+
+    # Rain events by (year, month, district)
+    grid, first_period, rain_names = monthly_rain_features(events, district_index, damage['year'].unique())
+    d_pos = district_index.get_indexer(damage['region_name'])
+    p_pos = damage['year'].to_numpy() * 12 + damage['month'].to_numpy() - 1 - first_period
+    blocks.append(grid[d_pos, p_pos])
+    names += rain_names
+
+    X = np.hstack(blocks).astype(np.float32)
+    y = damage[TARGET].to_numpy(dtype=np.float32)
+    return X, y, names, damage[KEY_COLS].reset_index(drop=True)
+
+def save_features(X, y, names, keys, output_file):
+    if output_file.endswith('.parquet'):
+        df = pd.concat([keys, pd.DataFrame(X, columns=names), pd.Series(y, name=TARGET)], axis=1)
+        df.to_parquet(output_file, index=False)
+    else:
+        np.savez(output_file, X=X, y=y, feature_names=np.array(names),
+                 year=keys['year'].to_numpy(), month=keys['month'].to_numpy(),
+                 region_name=keys['region_name'].to_numpy().astype(str))
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the flood-damage feature matrix')
+    parser.add_argument('--inundation', default=INUNDATION_FILE)
+    parser.add_argument('--land-info', default=LAND_INFO_FILE)
+    parser.add_argument('--rain-events', default=RAIN_EVENT_FILE)
+    parser.add_argument('--output', default=OUTPUT_FILE, help='.npz or .parquet')
+    args = parser.parse_args()
+
+    X, y, names, keys = build_features(args.inundation, args.land_info, args.rain_events)
+    save_features(X, y, names, keys, args.output)
+    print(f"Saved {X.shape[0]} rows × {X.shape[1]} features to {args.output}")
+
+if __name__ == '__main__':
+    main()
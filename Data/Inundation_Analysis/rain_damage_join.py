@@ -0,0 +1,123 @@
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+from build_features import station_districts, INUNDATION_FILE, RAIN_EVENT_FILE, SCRIPT_DIR
+
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, 'rain_damage_events.csv')
+
+THRESHOLDS = [50.0, 80.0, 100.0, 150.0]
+
+# Station position * STRIDE + day keeps (station, day) keys ordered in one int64 array
+STRIDE = np.int64(1 << 32)
+
+def to_days(values):
+    return pd.to_datetime(values).to_numpy().astype('datetime64[D]').astype(np.int64)
+
+def interval_join(query_station, query_start, query_end, event_station, event_start, event_end):
+    """
+    All (query, event) pairs on the same station whose day intervals overlap
+    (event_start <= query_end and event_end >= query_start), by a sorted sweep:
+    events are sorted by (station, start) once and each query becomes two searchsorted calls.
+    Station arguments are small non-negative ints (positions). Returns (query index, event index).
+    """
+    order = np.lexsort((event_start, event_station))
+    start_key = event_station[order] * STRIDE + event_start[order]
+    # Running max of the end keeps the key monotone even if a station's events overlap;
+    # the few extra candidates this admits are filtered below
+    end_key = np.maximum.accumulate(event_station[order] * STRIDE + event_end[order])
+
+    lo = np.searchsorted(end_key, query_station * STRIDE + query_start, side='left')
+    hi = np.searchsorted(start_key, query_station * STRIDE + query_end, side='right')
+    counts = np.maximum(hi - lo, 0)
+
+    query_idx = np.repeat(np.arange(len(query_station)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    event_idx = order[np.repeat(lo, counts) + offsets]
+
+    keep = event_end[event_idx] >= query_start[query_idx]
+    return query_idx[keep], event_idx[keep]
+
+def damage_intervals(damage):
+    """Day interval of each damage record: the given date, or the whole (year, month)."""
+    if 'date' in damage.columns:
+        start = end = to_days(damage['date'])
+    else:
+        first = pd.to_datetime(dict(year=damage['year'], month=damage['month'], day=1))
+        start = to_days(first)
+        end = to_days(first + pd.offsets.MonthEnd(0))
+    return start, end
+
+def join_events(damage, events, thresholds=THRESHOLDS):
+    """
+    Matches every damage record with the rain events overlapping it at its district's stations.
+    Returns (per-record aggregates aligned with damage, matched pairs table).
+    """
+    mapping = station_districts()
+    events = events.copy()
+    events['district'] = events['지점'].astype(int).map(mapping)
+    events = events.dropna(subset=['district']).reset_index(drop=True)
+
+    stations = np.unique(events['지점'].astype(int))
+    station_pos = np.searchsorted(stations, events['지점'].astype(int).to_numpy()).astype(np.int64)
+    ev_start, ev_end = to_days(events['강수 시작일']), to_days(events['강수 종료일'])
+    total = events['기간 누적 강수량'].to_numpy(dtype=float)
+    duration = events['강수 기간'].to_numpy(dtype=float)
+
+    # One query per (damage record, station in its district)
+    queries = pd.DataFrame({'record': np.arange(len(damage)), 'district': damage['region_name'].to_numpy()}).merge(
+        pd.DataFrame({'district': [mapping[s] for s in stations], 'station': np.arange(len(stations))}), on='district')
+    record_of_query = queries['record'].to_numpy()
+    query_station = queries['station'].to_numpy(dtype=np.int64)
+    q_start, q_end = damage_intervals(damage)
+
+    q_idx, e_idx = interval_join(query_station, q_start[record_of_query], q_end[record_of_query],
+                                 station_pos, ev_start, ev_end)
+    record = record_of_query[q_idx]
+
+    n = len(damage)
+    result = pd.DataFrame(index=damage.index)
+    result['event_count'] = np.bincount(record, minlength=n)
+    result['event_total_sum'] = np.bincount(record, weights=total[e_idx], minlength=n)
+    event_max = np.full(n, np.nan)
+    longest = np.full(n, np.nan)
+    np.fmax.at(event_max, record, total[e_idx])
+    np.fmax.at(longest, record, duration[e_idx])
+    result['event_total_max'] = event_max
+    result['event_duration_max'] = longest
+    for t in thresholds:
+        result[f'events_over_{t:g}mm'] = np.bincount(record, weights=(total[e_idx] >= t), minlength=n)
+    # Districts without a station have no rain information rather than zero events
+    result.loc[~np.isin(np.arange(n), record_of_query)] = np.nan
+
+    pairs = pd.DataFrame({
+        'record': damage.index.to_numpy()[record],
+        '지점': events['지점'].to_numpy()[e_idx],
+        '강수 시작일': events['강수 시작일'].to_numpy()[e_idx],
+        '강수 종료일': events['강수 종료일'].to_numpy()[e_idx],
+        '강수 기간': duration[e_idx],
+        '기간 누적 강수량': total[e_idx],
+    })
+    return result, pairs
+
+def main():
+    parser = argparse.ArgumentParser(description='Join flood damage records with overlapping rain events')
+    parser.add_argument('--inundation', default=INUNDATION_FILE)
+    parser.add_argument('--rain-events', default=RAIN_EVENT_FILE)
+    parser.add_argument('--thresholds', type=float, nargs='+', default=THRESHOLDS, help='event totals to count (mm)')
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--pairs', default=None, help='also write every matched (record, event) pair to this CSV')
+    args = parser.parse_args()
+
+    damage = pd.read_csv(args.inundation, encoding='utf-8-sig')
+    events = pd.read_csv(args.rain_events, encoding='utf-8')
+
+    aggregates, pairs = join_events(damage, events, args.thresholds)
+    pd.concat([damage, aggregates], axis=1).to_csv(args.output, index=False, encoding='utf-8-sig')
+    print(f"Joined {len(damage)} damage records with {len(pairs)} rain events -> {args.output}")
+    if args.pairs:
+        pairs.to_csv(args.pairs, index=False, encoding='utf-8-sig')
+
+if __name__ == '__main__':
+    main()
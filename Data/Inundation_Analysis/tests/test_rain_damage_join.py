@@ -0,0 +1,55 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rain_damage_join import interval_join
+
+
+def brute_force(query_station, query_start, query_end, event_station, event_start, event_end):
+    """Every (query, event) pair on the same station with overlapping day intervals."""
+    return sorted((q, e) for q in range(len(query_station)) for e in range(len(event_station))
+                  if query_station[q] == event_station[e]
+                  and event_start[e] <= query_end[q] and event_end[e] >= query_start[q])
+
+
+def random_intervals(rng, n, n_stations, max_length):
+    station = rng.integers(0, n_stations, n).astype(np.int64)
+    start = rng.integers(18000, 18400, n).astype(np.int64)
+    return station, start, start + rng.integers(0, max_length, n)
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('event_length', [1, 5, 60])
+def test_matches_brute_force(seed, event_length):
+    """Long events overlap within a station, which the running max of the end key has to handle."""
+    rng = np.random.default_rng(seed)
+    events = random_intervals(rng, 300, 6, event_length)
+    # Station 7 has queries but no events
+    queries = random_intervals(rng, 200, 8, 31)
+
+    q_idx, e_idx = interval_join(*queries, *events)
+    assert sorted(zip(q_idx.tolist(), e_idx.tolist())) == brute_force(*queries, *events)
+
+
+def test_nested_and_touching_intervals():
+    event_station = np.array([0, 0, 0, 1], dtype=np.int64)
+    event_start = np.array([10, 12, 20, 10], dtype=np.int64)
+    event_end = np.array([40, 13, 20, 40], dtype=np.int64)
+    query_station = np.array([0, 0, 0, 1], dtype=np.int64)
+    query_start = np.array([14, 20, 41, 5], dtype=np.int64)
+    query_end = np.array([19, 20, 50, 10], dtype=np.int64)
+
+    args = (query_station, query_start, query_end, event_station, event_start, event_end)
+    q_idx, e_idx = interval_join(*args)
+    assert sorted(zip(q_idx.tolist(), e_idx.tolist())) == brute_force(*args) == [(0, 0), (1, 0), (1, 2), (3, 3)]
+
+
+def test_no_queries_or_events():
+    empty = np.array([], dtype=np.int64)
+    one = np.array([0], dtype=np.int64)
+    for args in [(empty, empty, empty, one, one, one), (one, one, one, empty, empty, empty)]:
+        q_idx, e_idx = interval_join(*args)
+        assert len(q_idx) == len(e_idx) == 0
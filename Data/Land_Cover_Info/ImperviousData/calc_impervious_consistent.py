@@ -1,8 +1,16 @@
 import pandas as pd
 import os
+import sys
 import glob
+import argparse
 
-def calculate_impervious_consistent(file_path):
+# 공용 분류 모듈 (Land_Cover_Info/land_cover_codes.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from land_cover_codes import classify_codes
+
+FOLDER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Seoul_Land_Cover')
+
+def calculate_impervious_consistent(file_path, output_dir=None):
     """
     모든 연도의 데이터를 Level 2 분류 체계 기준으로 일관되게 불투수 면적을 계산합니다.
     기준: 110, 120, 130, 140, 150, 160, 230 -> 불투수
@@ -29,26 +37,12 @@ def calculate_impervious_consistent(file_path):
         print(f"  Skipping {file_path}: No code column found.")
         return
 
-    # 3. 일관된 LV2 코드 생성
-    # L3_CODE인 경우 앞 2자리에 '0'을 붙여 110 형태의 LV2로 변환하거나, 
-    # 기존 LV2 코드(110 등)를 정수형으로 처리
-    def get_lv2_standard(code):
-        try:
-            code_str = str(int(code))
-            if len(code_str) == 3:
-                # 111, 112 같은 세분류면 110으로, 110 같은 중분류면 그대로 유지
-                return int(code_str[:2] + '0')
-            return int(code)
-        except:
-            return None
-
-    df['LV2_CONSISTENT'] = df[code_col].apply(get_lv2_standard)
-
-    # 4. 불투수 판별 (Level 2 기준 일괄 적용)
+    # 3. 일관된 LV2 코드 생성 및 4. 불투수 판별 (Level 2 기준 일괄 적용)
+    # L3_CODE인 경우 111, 112 같은 세분류는 110으로, 110 같은 중분류는 그대로 유지
     # 110(주거), 120(공업), 130(상업), 140(문화체육), 150(교통), 160(공공), 230(시설재배)
-    impervious_lv2 = {110, 120, 130, 140, 150, 160, 230}
-    
-    df['IS_IMPERVIOUS'] = df['LV2_CONSISTENT'].apply(lambda x: x in impervious_lv2 if x is not None else False)
+    lv2, _, is_impervious = classify_codes(df[code_col])
+    df['LV2_CONSISTENT'] = pd.Series(lv2, index=df.index).where(lv2 >= 0)
+    df['IS_IMPERVIOUS'] = is_impervious
 
     # 5. 시군구별 집계
     result = df.groupby(['SIGUNGU_NM', 'IS_IMPERVIOUS'])['AREA_M2'].sum().unstack(fill_value=0)
@@ -67,18 +61,16 @@ def calculate_impervious_consistent(file_path):
     
     # 7. 파일 저장
     year = os.path.basename(file_path).split('_')[0]
-    output_path = os.path.join(os.path.dirname(file_path), f"{year}_impervious_summary.csv")
+    output_path = os.path.join(output_dir or os.path.dirname(file_path), f"{year}_impervious_summary.csv")
     
     # 결과 저장 (BOM 포함하여 엑셀 가독성 유지)
     result.to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"  Successfully saved to {output_path}")
 
-def main():
-    folder_path = '/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info/Seoul_Land_Cover'
-    
+def main(folder_path=FOLDER_PATH, output_dir=None):
     # 처리할 원본 파일 리스트 추출 (이미 생성된 impervious_summary는 제외)
-    # _lv2_가 붙은 파일이든 아니든, 최신 가공된 요약본을 사용
-    all_files = glob.glob(os.path.join(folder_path, '*_summary.csv'))
+    # _lv2_가 붙은 파일이든 아니든, 최신 가공된 요약본을 사용 (연도별 하위 폴더 포함)
+    all_files = glob.glob(os.path.join(folder_path, '**', '*_summary.csv'), recursive=True)
     
     # 연도별로 가장 적합한 파일 하나만 선택 (세분류가 있는 일반 summary 우선)
     year_to_file = {}
@@ -93,7 +85,12 @@ def main():
             year_to_file[year] = f
             
     for year in sorted(year_to_file.keys()):
-        calculate_impervious_consistent(year_to_file[year])
+        calculate_impervious_consistent(year_to_file[year], output_dir)
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--folder', default=FOLDER_PATH, help='*_summary.csv 폴더')
+    parser.add_argument('--output-dir', default=None, help='결과 저장 폴더 (기본: 입력 파일과 같은 폴더)')
+    args = parser.parse_args()
+
+    main(args.folder, args.output_dir)
@@ -1,82 +1,139 @@
 import pandas as pd
 import os
+import sys
+import re
 import glob
+import argparse
 import numpy as np
 
-def interpolate_impervious_data():
-    folder_path = '/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info/ImperviousData'
+# 공용 보간 모듈 (Land_Cover_Info/interpolation.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from interpolation import interpolate_frame, segment_update_matches, METHODS, EXTRAPOLATIONS
+
+FOLDER_PATH = os.path.dirname(os.path.abspath(__file__))
+# 결과 파일명에는 실제 보간 범위(첫 조사 연도 ~ 마지막 연도)가 들어감
+OUTPUT_NAME = 'Seoul_ImperviousData_{start}_{end}.csv'
+OUTPUT_PATTERN = re.compile(r'Seoul_ImperviousData_(\d{4})_(\d{4})\.csv$')
+
+def find_summary_files(folder_path):
+    """연도 -> *_impervious_summary.csv 경로"""
     files = glob.glob(os.path.join(folder_path, '*_impervious_summary.csv'))
-    
-    if not files:
-        print("No impervious summary files found.")
-        return
+    return {int(os.path.basename(f).split('_')[0]): f for f in files}
+
+def find_output(folder_path):
+    """기존 보간 결과 파일 경로 (여러 개면 마지막 연도가 가장 늦은 것), 없으면 None"""
+    outputs = {}
+    for f in glob.glob(os.path.join(folder_path, 'Seoul_ImperviousData_*.csv')):
+        match = OUTPUT_PATTERN.search(os.path.basename(f))
+        if match:
+            outputs[(int(match.group(2)), int(match.group(1)))] = f
+    return outputs[max(outputs)] if outputs else None
+
+def output_name(df):
+    return OUTPUT_NAME.format(start=int(df['YEAR'].min()), end=int(df['YEAR'].max()))
 
-    # 1. Load Data
+def load_summaries(files_by_year):
     df_list = []
-    for f in files:
-        year = int(os.path.basename(f).split('_')[0])
+    for year, f in sorted(files_by_year.items()):
         temp_df = pd.read_csv(f)
         temp_df['YEAR'] = year
         df_list.append(temp_df)
-    
-    full_df = pd.concat(df_list, ignore_index=True)
-    
+    return pd.concat(df_list, ignore_index=True)
+
+def interpolate_years(full_df, years, method='linear', extrapolate='forward'):
+    """
+    조사 연도 데이터를 years 범위의 연속 시계열로 보간합니다.
+    """
     # 2. Select Columns and Prepare for Interpolation
     # We mainly need Year, Sigungu, Impervious_Area, Total_Area
     # Pervious and Ratio can be recalculated later
     cols = ['YEAR', 'SIGUNGU_NM', 'IMPERVIOUS_AREA_M2', 'TOTAL_AREA_M2']
     data = full_df[cols].copy()
-    
-    # Get all unique Sigungus
-    sigungus = data['SIGUNGU_NM'].unique()
-    years = np.arange(2000, 2025) # 2000 to 2024
-    
-    # Create the complete index (Year x Sigungu)
-    # Using MultiIndex to easily reindex
-    idx = pd.MultiIndex.from_product([sigungus, years], names=['SIGUNGU_NM', 'YEAR'])
-    
-    # Reindex the data dataframe
-    data = data.set_index(['SIGUNGU_NM', 'YEAR']).reindex(idx).reset_index()
-    
-    # 3. Perform Linear Interpolation Group-wise
-    # Since we reindexed, missing years have NaN values now.
-    # We group by Sigungu and interpolate within each group.
-    
-    # Sort to ensure time order before interpolation
-    data = data.sort_values(by=['SIGUNGU_NM', 'YEAR'])
-    
-    # Helper function to apply to each group
-    def interpolate_group(group):
-        # Interpolate linear
-        group['IMPERVIOUS_AREA_M2'] = group['IMPERVIOUS_AREA_M2'].interpolate(method='linear')
-        group['TOTAL_AREA_M2'] = group['TOTAL_AREA_M2'].interpolate(method='linear')
-        
-        # Optional: Backfill/Forwardfill if limits are NaN (e.g. if 2000 was missing, but it is present)
-        # But here 2000 is present. If 2025 is missing, extrapolation might be needed or just ffill.
-        # Our data has 2025, so straightforward interpolation should work for 2000-2025.
-        return group
-
-    interpolated_df = data.groupby('SIGUNGU_NM').apply(interpolate_group).reset_index(drop=True)
-    
+
+    # 3. Interpolate all Sigungus and columns at once
+    # (Sigungu × Year × column) array; missing years are filled per series
+    interpolated_df = interpolate_frame(data, 'SIGUNGU_NM', 'YEAR', ['IMPERVIOUS_AREA_M2', 'TOTAL_AREA_M2'],
+                                        years, method=method, extrapolate=extrapolate)
+
     # 4. Recalculate Calculated Fields
     # PERVIOUS = TOTAL - IMPERVIOUS
     interpolated_df['PERVIOUS_AREA_M2'] = interpolated_df['TOTAL_AREA_M2'] - interpolated_df['IMPERVIOUS_AREA_M2']
-    
+
     # RATIO = IMPERVIOUS / TOTAL * 100
     interpolated_df['IMPERVIOUS_RATIO'] = (interpolated_df['IMPERVIOUS_AREA_M2'] / interpolated_df['TOTAL_AREA_M2'] * 100)
-    
+
     # Organize columns
     final_cols = ['YEAR', 'SIGUNGU_NM', 'PERVIOUS_AREA_M2', 'IMPERVIOUS_AREA_M2', 'TOTAL_AREA_M2', 'IMPERVIOUS_RATIO']
     final_df = interpolated_df[final_cols]
-    
+
     # Round areas to 2 decimal places, Ratio to 4
-    final_df = final_df.round({'PERVIOUS_AREA_M2': 2, 'IMPERVIOUS_AREA_M2': 2, 'TOTAL_AREA_M2': 2, 'IMPERVIOUS_RATIO': 4})
-    
-    # 5. Save Combined CSV
-    output_path = os.path.join(folder_path, 'Seoul_ImperviousData_2000_2024.csv')
+    return final_df.round({'PERVIOUS_AREA_M2': 2, 'IMPERVIOUS_AREA_M2': 2, 'TOTAL_AREA_M2': 2, 'IMPERVIOUS_RATIO': 4})
+
+def update_segment(existing_df, files_by_year, update_year, method='linear', extrapolate='forward'):
+    """
+    새 조사 연도(update_year)를 감싸는 보간 구간(이전 조사 연도 ~ 다음 조사 연도)만 다시 계산하여
+    기존 결과의 해당 행을 교체하거나 추가합니다. 선형 보간에서만 전체 재계산과 같습니다 (segment_update_matches).
+    """
+    survey_years = sorted(files_by_year)
+    prev_years = [y for y in survey_years if y < update_year]
+    next_years = [y for y in survey_years if y > update_year]
+    start = prev_years[-1] if prev_years else update_year
+    end = next_years[0] if next_years else update_year
+
+    bracket = {y: files_by_year[y] for y in (start, update_year, end)}
+    segment_df = interpolate_years(load_summaries(bracket), np.arange(start, end + 1), method, extrapolate)
+
+    kept = existing_df[(existing_df['YEAR'] < start) | (existing_df['YEAR'] > end)]
+    updated = pd.concat([kept, segment_df], ignore_index=True)
+    print(f"Recomputed years {start}-{end} for new survey year {update_year}")
+    return updated.sort_values(by=['SIGUNGU_NM', 'YEAR']).reset_index(drop=True)
+
+def interpolate_impervious_data(folder_path=FOLDER_PATH, update_year=None, method='linear', extrapolate='forward'):
+    files_by_year = find_summary_files(folder_path)
+
+    if not files_by_year:
+        print("No impervious summary files found.")
+        return
+
+    existing_path = find_output(folder_path)
+
+    if update_year is not None:
+        # 증분 모드: 새 연도를 감싸는 구간만 재계산
+        if update_year not in files_by_year:
+            print(f"No impervious summary file found for {update_year}.")
+            return
+        if existing_path is None:
+            print(f"No Seoul_ImperviousData_*.csv in {folder_path}. Running full interpolation instead.")
+            update_year = None
+        elif not segment_update_matches(method, extrapolate):
+            print(f"--update only recomputes one segment, which matches a full run for linear interpolation only "
+                  f"(method={method}, extrapolate={extrapolate}). Running full interpolation instead.")
+            update_year = None
+
+    if update_year is not None:
+        final_df = update_segment(pd.read_csv(existing_path), files_by_year, update_year, method, extrapolate)
+    else:
+        # 1. Load Data
+        full_df = load_summaries(files_by_year)
+        # 조사 연도 범위 전체 (첫 조사 연도 ~ 마지막 조사 연도)
+        years = np.arange(min(files_by_year), max(files_by_year) + 1)
+        final_df = interpolate_years(full_df, years, method, extrapolate)
+
+    # 5. Save Combined CSV (범위가 바뀌면 이전 범위의 파일은 삭제)
+    output_path = os.path.join(folder_path, output_name(final_df))
     final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved complete interpolated data to {output_path}")
+    if existing_path is not None and os.path.abspath(existing_path) != os.path.abspath(output_path):
+        os.remove(existing_path)
+        print(f"Removed previous output {os.path.basename(existing_path)}")
     print(final_df.head(10))
 
 if __name__ == "__main__":
-    interpolate_impervious_data()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--update', type=int, default=None, help='새로 추가된 조사 연도만 반영 (예: 2025)')
+    parser.add_argument('--folder', default=FOLDER_PATH)
+    parser.add_argument('--method', choices=METHODS, default='linear', help='보간 방법')
+    parser.add_argument('--extrapolate', choices=EXTRAPOLATIONS, default='forward', help='조사 연도 범위 밖 처리')
+    args = parser.parse_args()
+
+    interpolate_impervious_data(args.folder, update_year=args.update, method=args.method, extrapolate=args.extrapolate)
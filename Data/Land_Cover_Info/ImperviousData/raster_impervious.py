@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import argparse
+import numpy as np
+import pandas as pd
+
+# 공용 분류 모듈 (Land_Cover_Info/land_cover_codes.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from land_cover_codes import classify_codes, SIGUNGU_PATH
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RASTER_DIR = os.path.join(BASE_DIR, 'raster')
+
+CODE_COLUMNS = ['L3_CODE', 'L2_CODE', 'LV2_CODE', 'CODE']
+NODATA = 0
+CHUNK_ROWS = 2048
+
+# uint16 코드 -> 불투수 여부 룩업 (classify_codes와 같은 분류, 4자리 이상 코드 포함)
+CODE_IMPERVIOUS = classify_codes(np.arange(np.iinfo(np.uint16).max + 1))[2]
+CODE_IMPERVIOUS[NODATA] = False
+
+def grid_for(bounds, resolution):
+    """범위를 해상도 단위로 맞춘 격자: (transform, height, width)"""
+    from rasterio.transform import from_origin
+
+    minx, miny, maxx, maxy = bounds
+    minx, miny = np.floor(minx / resolution) * resolution, np.floor(miny / resolution) * resolution
+    maxx, maxy = np.ceil(maxx / resolution) * resolution, np.ceil(maxy / resolution) * resolution
+    width, height = int(round((maxx - minx) / resolution)), int(round((maxy - miny) / resolution))
+    return from_origin(minx, maxy, resolution, resolution), height, width
+
+def save_meta(npy_path, transform, crs, **extra):
+    meta = {'transform': list(transform)[:6], 'crs': str(crs), **extra}
+    with open(npy_path.replace('.npy', '.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+def load_grid(npy_path):
+    """메모리 매핑된 격자와 메타데이터"""
+    from affine import Affine
+
+    with open(npy_path.replace('.npy', '.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    meta['transform'] = Affine(*meta['transform'])
+    return np.load(npy_path, mmap_mode='r'), meta
+
+def rasterize_chunked(gdf, values, out_path, transform, height, width, dtype, chunk_rows=CHUNK_ROWS):
+    """
+    폴리곤을 행 단위 청크로 나누어 래스터화합니다. 청크마다 공간 인덱스로 겹치는 폴리곤만 골라
+    디스크의 메모리 매핑 배열(.npy)에 씁니다. (셀 중심이 폴리곤 안에 있으면 해당 값)
+    """
+    from rasterio import features, windows
+    import shapely
+
+    grid = np.lib.format.open_memmap(out_path, mode='w+', dtype=dtype, shape=(height, width))
+    geoms = gdf.geometry.values
+    sindex = gdf.sindex
+
+    for row in range(0, height, chunk_rows):
+        rows = min(chunk_rows, height - row)
+        window = windows.Window(0, row, width, rows)
+        chunk_transform = windows.transform(window, transform)
+        chunk_bounds = windows.bounds(window, transform)
+
+        hits = sindex.query(shapely.box(*chunk_bounds), predicate='intersects')
+        if len(hits) == 0:
+            grid[row:row + rows] = NODATA
+            continue
+        grid[row:row + rows] = features.rasterize(
+            zip(geoms[hits], values[hits]), out_shape=(rows, width), transform=chunk_transform,
+            fill=NODATA, dtype=dtype)
+
+    grid.flush()
+    return grid
+
+def rasterize_land_cover(src_path, out_path, resolution=5.0, sigungu_path=SIGUNGU_PATH, chunk_rows=CHUNK_ROWS):
+    """
+    토지피복 폴리곤(shp/GeoParquet)을 uint16 코드 격자로, 시군구 경계를 같은 격자의 uint8 구역 번호로
+    래스터화합니다. 래스터 토지피복(GeoTIFF)은 같은 격자로 재투영해 읽습니다.
+    반환: (토지피복 격자 경로, 구역 격자 경로)
+    """
+    import geopandas as gpd
+
+    sigungu_gdf = gpd.read_file(sigungu_path)
+    sigungu_gdf.geometry = sigungu_gdf.geometry.make_valid()
+    sigungu_gdf = sigungu_gdf.sort_values('SIGUNGU_NM').reset_index(drop=True)
+    transform, height, width = grid_for(sigungu_gdf.total_bounds, resolution)
+
+    # 구역 번호: 0 = 시군구 밖, 1..N = SIGUNGU_NM 정렬 순서
+    zone_path = out_path.replace('.npy', '_zones.npy')
+    rasterize_chunked(sigungu_gdf, np.arange(1, len(sigungu_gdf) + 1), zone_path, transform, height, width,
+                      np.uint8 if len(sigungu_gdf) < 255 else np.uint16, chunk_rows)
+    save_meta(zone_path, transform, sigungu_gdf.crs, zones=sigungu_gdf['SIGUNGU_NM'].tolist())
+
+    if src_path.lower().endswith(('.tif', '.tiff')):
+        read_raster_land_cover(src_path, out_path, transform, height, width, sigungu_gdf.crs, chunk_rows)
+    else:
+        land_gdf = gpd.read_parquet(src_path) if src_path.endswith('.parquet') else gpd.read_file(src_path)
+        if land_gdf.crs != sigungu_gdf.crs:
+            land_gdf = land_gdf.to_crs(sigungu_gdf.crs)
+        code_col = next(c for c in CODE_COLUMNS if c in land_gdf.columns)
+        codes = pd.to_numeric(land_gdf[code_col], errors='coerce').fillna(NODATA).astype(np.uint16).to_numpy()
+        rasterize_chunked(land_gdf, codes, out_path, transform, height, width, np.uint16, chunk_rows)
+    save_meta(out_path, transform, sigungu_gdf.crs, resolution=resolution, source=os.path.basename(src_path))
+
+    print(f"  래스터화 완료: {out_path} ({height} x {width}, {resolution}m)")
+    return out_path, zone_path
+
+def read_raster_land_cover(src_path, out_path, transform, height, width, crs, chunk_rows=CHUNK_ROWS):
+    """GeoTIFF 토지피복을 최근린 재투영으로 격자에 맞춰 청크 단위로 읽습니다."""
+    import rasterio
+    from rasterio import windows
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+
+    grid = np.lib.format.open_memmap(out_path, mode='w+', dtype=np.uint16, shape=(height, width))
+    with rasterio.open(src_path) as src, WarpedVRT(src, crs=crs, transform=transform, height=height, width=width,
+                                                  resampling=Resampling.nearest, nodata=NODATA) as vrt:
+        for row in range(0, height, chunk_rows):
+            rows = min(chunk_rows, height - row)
+            grid[row:row + rows] = vrt.read(1, window=windows.Window(0, row, width, rows)).astype(np.uint16)
+    grid.flush()
+
+def zonal_impervious(land_path, zone_path, chunk_rows=CHUNK_ROWS):
+    """
+    시군구별 불투수/투수 면적. 청크마다 구역 번호로 np.bincount 하여 합산합니다.
+    결과 컬럼은 calc_impervious_consistent.py의 요약과 같습니다.
+    """
+    land, land_meta = load_grid(land_path)
+    zones, zone_meta = load_grid(zone_path)
+    n_zones = len(zone_meta['zones']) + 1
+    cell_area = abs(land_meta['transform'].a * land_meta['transform'].e)
+
+    impervious = np.zeros(n_zones)
+    total = np.zeros(n_zones)
+    for row in range(0, land.shape[0], chunk_rows):
+        codes = np.asarray(land[row:row + chunk_rows])
+        zone = np.asarray(zones[row:row + chunk_rows]).ravel()
+        valid = (codes != NODATA).ravel()
+        is_imp = CODE_IMPERVIOUS[codes].ravel()
+        total += np.bincount(zone[valid], minlength=n_zones)
+        impervious += np.bincount(zone[valid & is_imp], minlength=n_zones)
+
+    result = pd.DataFrame({
+        'SIGUNGU_NM': zone_meta['zones'],
+        'IMPERVIOUS_AREA_M2': impervious[1:] * cell_area,
+        'TOTAL_AREA_M2': total[1:] * cell_area,
+    })
+    result['PERVIOUS_AREA_M2'] = result['TOTAL_AREA_M2'] - result['IMPERVIOUS_AREA_M2']
+    result['IMPERVIOUS_RATIO'] = (result['IMPERVIOUS_AREA_M2'] / result['TOTAL_AREA_M2'] * 100).fillna(0)
+    return result[['SIGUNGU_NM', 'PERVIOUS_AREA_M2', 'IMPERVIOUS_AREA_M2', 'TOTAL_AREA_M2', 'IMPERVIOUS_RATIO']]
+
+def grid_impervious_fraction(land_path, out_path, cell_size=100.0):
+    """
+    cell_size(m) 격자 셀별 불투수 비율(float32, 자료 없는 셀은 NaN)을 계산해 GeoTIFF로 저장합니다.
+    토지피복 격자를 factor x factor 블록으로 묶어 청크 단위로 합산합니다.
+    가장자리의 모자란 블록은 NODATA로 채워 포함합니다 (격자 크기는 올림).
+    """
+    import rasterio
+
+    land, meta = load_grid(land_path)
+    factor = int(round(cell_size / abs(meta['transform'].a)))
+    height, width = -(-land.shape[0] // factor), -(-land.shape[1] // factor)
+
+    fraction = np.full((height, width), np.nan, dtype=np.float32)
+    chunk_rows = max(1, CHUNK_ROWS // factor) * factor
+    for row in range(0, land.shape[0], chunk_rows):
+        chunk = np.asarray(land[row:row + chunk_rows])
+        codes = np.full((-(-chunk.shape[0] // factor) * factor, width * factor), NODATA, dtype=chunk.dtype)
+        codes[:chunk.shape[0], :chunk.shape[1]] = chunk
+        valid = codes != NODATA
+        is_imp = CODE_IMPERVIOUS[codes]
+        block = (codes.shape[0] // factor, factor, width, factor)
+        n_valid = valid.reshape(block).sum(axis=(1, 3))
+        n_imp = (valid & is_imp).reshape(block).sum(axis=(1, 3))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fraction[row // factor:row // factor + block[0]] = np.where(n_valid > 0, n_imp / n_valid, np.nan)
+
+    transform = meta['transform'] * meta['transform'].scale(factor, factor)
+    with rasterio.open(out_path, 'w', driver='GTiff', height=height, width=width, count=1, dtype='float32',
+                       crs=meta['crs'], transform=transform, nodata=np.nan, compress='deflate') as dst:
+        dst.write(fraction, 1)
+    print(f"  격자 불투수 비율 저장: {out_path} ({height} x {width}, {cell_size}m)")
+    return fraction
+
+def process_year(src_path, year, resolution=5.0, cell_size=100.0, output_dir=None, raster_dir=RASTER_DIR):
+    output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    os.makedirs(raster_dir, exist_ok=True)
+
+    land_path, zone_path = rasterize_land_cover(src_path, os.path.join(raster_dir, f"{year}_landcover.npy"), resolution)
+
+    summary = zonal_impervious(land_path, zone_path)
+    output_path = os.path.join(output_dir, f"{year}_impervious_raster_summary.csv")
+    summary.to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f"  Successfully saved to {output_path}")
+
+    if cell_size:
+        grid_impervious_fraction(land_path, os.path.join(raster_dir, f"{year}_impervious_{int(cell_size)}m.tif"), cell_size)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='래스터 기반 불투수 면적/비율 계산')
+    parser.add_argument('source', help='토지피복 폴리곤(shp/parquet) 또는 래스터(tif)')
+    parser.add_argument('year', type=int)
+    parser.add_argument('--resolution', type=float, default=5.0, help='래스터 해상도(m)')
+    parser.add_argument('--cell-size', type=float, default=100.0, help='격자 불투수 비율 셀 크기(m), 0이면 생략')
+    parser.add_argument('--output-dir', default=None, help='요약 CSV 저장 폴더 (기본: 이 폴더)')
+    parser.add_argument('--raster-dir', default=RASTER_DIR, help='래스터 격자/GeoTIFF 저장 폴더')
+    args = parser.parse_args()
+
+    process_year(args.source, args.year, args.resolution, args.cell_size, args.output_dir, args.raster_dir)
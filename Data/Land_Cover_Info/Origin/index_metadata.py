@@ -0,0 +1,271 @@
+import os
+import re
+import glob
+import sqlite3
+import argparse
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+ORIGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(ORIGIN_DIR, 'tile_catalog.sqlite')
+
+# 필요한 태그 (환경부 토지피복지도 메타데이터 / ESRI shp.xml)
+WANTED_TAGS = {
+    '도엽번호': 'mapsheet',
+    '메타데이터적용계층대상명': 'layer_name',
+    '메타데이터생성일자': 'created',
+    'CreaDate': 'created',
+    '제목': 'title',
+    '서쪽경계경도': 'min_lon',
+    '동쪽경계경도': 'max_lon',
+    '남쪽경계위도': 'min_lat',
+    '북쪽경계위도': 'max_lat',
+}
+LEVEL_NAMES = {'세분류': 3, '중분류': 2, '대분류': 1}
+
+# 2025년부터 메타데이터 파일명에만 붙는 '_meta' (2025_meta_37608030.xml -> 2025_37608030.shp)
+META_SUFFIX = re.compile(r'_meta(?=_|$)', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tiles (
+    id INTEGER PRIMARY KEY,
+    xml_path TEXT UNIQUE NOT NULL,
+    data_stem TEXT NOT NULL,
+    year INTEGER,
+    mapsheet TEXT,
+    level INTEGER,
+    title TEXT,
+    created TEXT,
+    min_lon REAL, max_lon REAL, min_lat REAL, max_lat REAL,
+    mtime_ns INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_tiles_year_level ON tiles (year, level);
+CREATE VIRTUAL TABLE IF NOT EXISTS tiles_rtree USING rtree (id, min_lon, max_lon, min_lat, max_lat);
+"""
+
+def mapsheet_bbox(mapsheet):
+    """
+    국토지리정보원 도엽번호로부터 경위도 범위를 계산합니다.
+    - 5자리 (1:50,000): 위도 2자리 + 경도 1자리(12x) + 1°를 4x4로 나눈 15' 도엽 번호(01~16)
+    - 6자리 (1:25,000): 1:50,000 도엽을 2x2로 나눈 번호(1~4)
+    - 8자리 (1:5,000): 1:50,000 도엽을 10x10으로 나눈 번호(001~100)
+    (min_lon, max_lon, min_lat, max_lat) 또는 알 수 없는 형식이면 None
+    """
+    if not mapsheet or not mapsheet.isdigit() or len(mapsheet) not in (5, 6, 8):
+        return None
+
+    lat, lon, cell = int(mapsheet[:2]), 120 + int(mapsheet[2]), int(mapsheet[3:5]) - 1
+    size = 0.25
+    west = lon + (cell % 4) * size
+    north = lat + 1 - (cell // 4) * size
+
+    sub = mapsheet[5:]
+    if sub:
+        parts = 2 if len(sub) == 1 else 10
+        cell = int(sub) - 1
+        size = size / parts
+        west += (cell % parts) * size
+        north -= (cell // parts) * size
+
+    return west, west + size, north - size, north
+
+def level_from_folder(folder):
+    """폴더명 규칙: *_lv2 -> 중분류, *말_대 -> 대분류, 그 외 -> 세분류"""
+    if folder.endswith('_lv2'):
+        return 2
+    if folder.endswith('_대'):
+        return 1
+    return 3
+
+def data_stem(xml_path):
+    """
+    메타데이터 XML에 대응하는 데이터 파일 경로 (확장자 제외).
+    37608056.shp.xml -> 37608056, 9차피복_37608030.xml -> 9차피복_37608030, 2025_meta_37608030.xml -> 2025_37608030
+    """
+    folder, name = os.path.split(re.sub(r'(\.shp)?\.xml$', '', xml_path))
+    return os.path.join(folder, META_SUFFIX.sub('', name))
+
+def resolve_data_stem(xml_path, mapsheet):
+    """data_stem의 .shp가 없으면 같은 폴더에서 도엽번호로 끝나는 shp가 하나뿐일 때 그것을 사용합니다."""
+    stem = data_stem(xml_path)
+    if os.path.exists(stem + '.shp') or not mapsheet:
+        return stem
+    folder = glob.escape(os.path.dirname(xml_path))
+    matches = glob.glob(os.path.join(folder, f'{mapsheet}.shp')) + glob.glob(os.path.join(folder, f'*_{mapsheet}.shp'))
+    return os.path.splitext(matches[0])[0] if len(matches) == 1 else stem
+
+def parse_metadata(xml_path):
+    """iterparse로 필요한 태그만 읽고, 모두 찾으면 나머지 문서는 읽지 않습니다."""
+    record = {}
+    try:
+        for _, elem in ET.iterparse(xml_path, events=('end',)):
+            key = WANTED_TAGS.get(elem.tag)
+            if key and key not in record and elem.text and elem.text.strip():
+                record[key] = elem.text.strip()
+                if len(record) == len(set(WANTED_TAGS.values())):
+                    break
+            elem.clear()
+    except ET.ParseError as e:
+        print(f"  - XML 파싱 실패: {xml_path} ({e})")
+
+    folder = os.path.basename(os.path.dirname(xml_path))
+    filename = os.path.basename(xml_path)
+
+    # 도엽번호: 태그가 없으면 파일명 끝의 숫자
+    mapsheet = record.get('mapsheet')
+    if not mapsheet:
+        match = re.search(r'(\d{5,8})(?:\.shp)?\.xml$', filename)
+        mapsheet = match.group(1) if match else None
+
+    # 연도: 폴더명 우선 (원본 XML 제목에 잘못된 연도가 있음), 없으면 제목의 'YYYY년'
+    match = re.match(r'(\d{4})', folder) or re.search(r'(\d{4})년', record.get('title', ''))
+    year = int(match.group(1)) if match else None
+
+    level = None
+    for name, lv in LEVEL_NAMES.items():
+        if name in record.get('layer_name', '') or name in record.get('title', ''):
+            level = lv
+            break
+    if level is None:
+        level = level_from_folder(folder)
+
+    # 경위도 범위: 태그가 없으면 도엽번호로 계산
+    try:
+        bbox = tuple(float(record[k]) for k in ('min_lon', 'max_lon', 'min_lat', 'max_lat'))
+    except (KeyError, ValueError):
+        bbox = mapsheet_bbox(mapsheet)
+
+    return {
+        'xml_path': xml_path,
+        'data_stem': data_stem(xml_path),
+        'year': year,
+        'mapsheet': mapsheet,
+        'level': level,
+        'title': record.get('title'),
+        'created': record.get('created'),
+        'bbox': bbox,
+        'mtime_ns': os.stat(xml_path).st_mtime_ns,
+    }
+
+def find_metadata_files(origin_dir=ORIGIN_DIR):
+    files = glob.glob(os.path.join(origin_dir, '*', '*.xml'))
+    # 연도 폴더 안의 타일 메타데이터만 대상
+    return sorted(f for f in files if re.match(r'\d{4}', os.path.basename(os.path.dirname(f))))
+
+def connect(catalog_path=CATALOG_PATH):
+    conn = sqlite3.connect(catalog_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def build_catalog(origin_dir=ORIGIN_DIR, catalog_path=CATALOG_PATH, max_workers=None, rebuild=False):
+    """
+    Origin/<연도> 폴더의 XML 메타데이터를 병렬로 파싱해 SQLite 카탈로그에 저장합니다.
+    이미 색인된 파일은 수정 시각이 바뀐 경우에만 다시 읽습니다.
+    """
+    conn = connect(catalog_path)
+    if rebuild:
+        conn.execute("DELETE FROM tiles")
+        conn.execute("DELETE FROM tiles_rtree")
+
+    known = dict(conn.execute("SELECT xml_path, mtime_ns FROM tiles"))
+    xml_files = find_metadata_files(origin_dir)
+    targets = [f for f in xml_files if known.get(f) != os.stat(f).st_mtime_ns]
+
+    # 사라진 파일 정리
+    removed = set(known) - set(xml_files)
+    for path in removed:
+        row_id = conn.execute("SELECT id FROM tiles WHERE xml_path = ?", (path,)).fetchone()[0]
+        conn.execute("DELETE FROM tiles_rtree WHERE id = ?", (row_id,))
+        conn.execute("DELETE FROM tiles WHERE id = ?", (row_id,))
+
+    print(f"메타데이터 XML {len(xml_files)}개 중 새로 색인할 파일: {len(targets)}개")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        records = list(executor.map(parse_metadata, targets, chunksize=16))
+
+    for rec in records:
+        bbox = rec['bbox'] or (None, None, None, None)
+        old = conn.execute("SELECT id FROM tiles WHERE xml_path = ?", (rec['xml_path'],)).fetchone()
+        if old:
+            conn.execute("DELETE FROM tiles_rtree WHERE id = ?", (old[0],))
+            conn.execute("DELETE FROM tiles WHERE id = ?", (old[0],))
+
+        cur = conn.execute(
+            "INSERT INTO tiles (xml_path, data_stem, year, mapsheet, level, title, created,"
+            " min_lon, max_lon, min_lat, max_lat, mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (rec['xml_path'], rec['data_stem'], rec['year'], rec['mapsheet'], rec['level'],
+             rec['title'], rec['created'], *bbox, rec['mtime_ns']))
+        if rec['bbox']:
+            conn.execute("INSERT INTO tiles_rtree VALUES (?, ?, ?, ?, ?)", (cur.lastrowid, *rec['bbox']))
+
+    # data_stem이 실제 .shp를 가리키는지 확인 (ZIP이 나중에 풀린 경우를 위해 기존 행도 다시 확인)
+    missing = []
+    for row_id, xml_path, mapsheet, stem in conn.execute("SELECT id, xml_path, mapsheet, data_stem FROM tiles").fetchall():
+        resolved = resolve_data_stem(xml_path, mapsheet)
+        if resolved != stem:
+            conn.execute("UPDATE tiles SET data_stem = ? WHERE id = ?", (resolved, row_id))
+        if not os.path.exists(resolved + '.shp'):
+            missing.append(resolved)
+
+    conn.commit()
+    total = conn.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+    conn.close()
+    print(f"✅ 카탈로그 저장 완료: {catalog_path} (타일 {total}개)")
+    if missing:
+        print(f"⚠️ 데이터(.shp)를 찾지 못한 타일 {len(missing)}개 (ZIP 압축 해제 전이거나 파일명이 다름), 예: {missing[0]}.shp")
+    return missing
+
+def query_tiles(bbox=None, year=None, level=None, catalog_path=CATALOG_PATH):
+    """
+    bbox (min_lon, min_lat, max_lon, max_lat, EPSG:4326)와 겹치는 타일을 R*Tree 색인으로 찾습니다.
+    반환: [{'mapsheet', 'year', 'level', 'data_stem', 'xml_path'}, ...]
+    """
+    sql = "SELECT t.mapsheet, t.year, t.level, t.data_stem, t.xml_path FROM tiles t"
+    conditions, params = [], []
+    if bbox is not None:
+        min_lon, min_lat, max_lon, max_lat = bbox
+        sql += " JOIN tiles_rtree r ON r.id = t.id"
+        conditions += ["r.max_lon >= ?", "r.min_lon <= ?", "r.max_lat >= ?", "r.min_lat <= ?"]
+        params += [min_lon, max_lon, min_lat, max_lat]
+    if year is not None:
+        conditions.append("t.year = ?")
+        params.append(year)
+    if level is not None:
+        conditions.append("t.level = ?")
+        params.append(level)
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY t.year, t.mapsheet"
+
+    conn = sqlite3.connect(catalog_path)
+    conn.row_factory = sqlite3.Row
+    rows = [dict(r) for r in conn.execute(sql, params)]
+    conn.close()
+    return rows
+
+def district_bbox(sigungu_path, sigungu_names=None):
+    """시군구 경계(전체 또는 지정 시군구)의 EPSG:4326 범위 (min_lon, min_lat, max_lon, max_lat)"""
+    import geopandas as gpd
+
+    sigungu_gdf = gpd.read_file(sigungu_path)
+    if sigungu_names:
+        sigungu_gdf = sigungu_gdf[sigungu_gdf['SIGUNGU_NM'].isin(sigungu_names)]
+    return tuple(sigungu_gdf.to_crs('EPSG:4326').total_bounds)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Origin 타일 XML 메타데이터 카탈로그')
+    parser.add_argument('--origin-dir', default=ORIGIN_DIR, help='연도별 타일 폴더가 있는 폴더 (기본: Origin)')
+    parser.add_argument('--catalog', default=CATALOG_PATH)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--rebuild', action='store_true', help='카탈로그를 비우고 전부 다시 색인')
+    parser.add_argument('--query', nargs=4, type=float, metavar=('MIN_LON', 'MIN_LAT', 'MAX_LON', 'MAX_LAT'),
+                        help='색인 대신 범위와 겹치는 타일 조회')
+    parser.add_argument('--year', type=int, default=None)
+    parser.add_argument('--level', type=int, choices=[1, 2, 3], default=None)
+    args = parser.parse_args()
+
+    if args.query:
+        for tile in query_tiles(tuple(args.query), args.year, args.level, args.catalog):
+            print(f"{tile['year']}\t{tile['mapsheet']}\tlv{tile['level']}\t{tile['data_stem']}")
+    else:
+        build_catalog(args.origin_dir, catalog_path=args.catalog, max_workers=args.workers, rebuild=args.rebuild)
@@ -1,98 +1,309 @@
 import geopandas as gpd
+import pandas as pd
+import numpy as np
 import os
+import re
 import glob
+import zipfile
+import argparse
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-def main():
-    # 1. 경로 설정
-    base_dir = "/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info"
-    input_dir = os.path.join(base_dir, "temp")
-    sigungu_path = os.path.join(base_dir, "서울_시군구/bnd_sigungu_11_2025_2Q.shp")
-    output_dir = os.path.join(base_dir, "Seoul_Land_Cover_Final")
+from process_zips import CODE_COLUMNS, ORIGIN_DIR, BASE_DIR
+from land_cover_codes import SIGUNGU_PATH
 
-    # 결과 저장 폴더 생성
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"폴더 생성 완료: {output_dir}")
+INPUT_DIR = os.path.join(BASE_DIR, "temp")
+# process_zips.py --parquet 결과 (<연도>.parquet)
+PARQUET_DIR = os.path.join(BASE_DIR, "parquet")
+OUTPUT_DIR = os.path.join(BASE_DIR, "Seoul_Land_Cover")
+
+
+def intersect_with_sigungu(land_gdf, sigungu_gdf):
+    """
+    land_gdf의 폴리곤을 시군구 경계로 자릅니다. (gpd.overlay(..., how='intersection')와 동일한 결과)
+    공간 인덱스(STRtree)로 먼저 한 시군구 안에 완전히 포함되는 폴리곤을 골라내어
+    잘라내기 없이 그대로 사용하고, 경계에 걸친 폴리곤만 overlay로 자릅니다.
+    """
+    land_gdf = land_gdf.reset_index(drop=True)
+    sigungu_attrs = sigungu_gdf.drop(columns=sigungu_gdf.geometry.name).reset_index(drop=True)
+
+    # 1. 포함(within) 관계 판별: (land 인덱스, sigungu 인덱스) 쌍
+    land_idx, sigungu_idx = sigungu_gdf.sindex.query(land_gdf.geometry, predicate='within')
+    # 시군구끼리는 겹치지 않으므로 한 폴리곤은 최대 한 시군구에만 포함됨
+    land_idx, first = np.unique(land_idx, return_index=True)
+    sigungu_idx = sigungu_idx[first]
+
+    # 2. 완전 포함 폴리곤: 도형은 그대로 두고 시군구 속성만 붙임
+    inside_gdf = land_gdf.iloc[land_idx].reset_index(drop=True)
+    inside_attrs = sigungu_attrs.iloc[sigungu_idx].reset_index(drop=True)
+    # gpd.overlay와 같은 스키마: 양쪽에 모두 있는 컬럼은 land 쪽에 _1, 시군구 쪽에 _2를 붙임
+    shared = [c for c in inside_attrs.columns if c in inside_gdf.columns]
+    inside_gdf = inside_gdf.rename(columns={c: f'{c}_1' for c in shared})
+    inside_attrs = inside_attrs.rename(columns={c: f'{c}_2' for c in shared})
+    inside_gdf = gpd.GeoDataFrame(
+        pd.concat([inside_gdf.drop(columns=inside_gdf.geometry.name), inside_attrs], axis=1),
+        geometry=inside_gdf.geometry.values,
+        crs=land_gdf.crs,
+    )
+
+    # 3. 경계에 걸친 폴리곤만 실제로 잘라냄
+    crossing_mask = np.ones(len(land_gdf), dtype=bool)
+    crossing_mask[land_idx] = False
+    crossing_gdf = land_gdf[crossing_mask]
+    if crossing_gdf.empty:
+        return inside_gdf
+
+    clipped_gdf = gpd.overlay(crossing_gdf, sigungu_gdf, how='intersection')
+    return pd.concat([inside_gdf, clipped_gdf], ignore_index=True)
+
+
+def summarize_intersection(intersected_gdf):
+    """잘려진 결과를 시군구 × 분류코드 기준으로 면적 합계를 구합니다."""
+    group_cols = ['SIGUNGU_NM']
+
+    # 체크할 분류 단계 정의 (상세한 순서대로)
+    lv3_candidates = ['L3_CODE', 'L3_NAME']
+    lv2_candidates = ['L2_CODE', 'L2_NAME', 'LV2_CODE', 'LV2_NAME', 'CODE']
+    lv1_candidates = ['L1_CODE', 'L1_NAME']
+    # 1. 세분류(Level 3) 컬럼이 하나라도 있는지 확인
+    found_l3 = [c for c in lv3_candidates if c in intersected_gdf.columns]
+    if found_l3:
+        group_cols.extend(found_l3)
+    else:
+        # 2. 세분류가 없으면 중분류(Level 2) 확인
+        found_l2 = [c for c in lv2_candidates if c in intersected_gdf.columns]
+        if found_l2:
+            group_cols.extend(found_l2)
+        else:
+            # 3. 그마저도 없으면 대분류(Level 1) 확인
+            found_l1 = [c for c in lv1_candidates if c in intersected_gdf.columns]
+            group_cols.extend(found_l1)
+
+    # 필터링된 컬럼으로 그룹화
+    summary = intersected_gdf.groupby(group_cols)['AREA_M2'].sum().reset_index()
+    return summary, group_cols
+
+
+def year_output_dir(output_dir, target_name):
+    """대상의 연도별 저장 폴더 (예: 2000_2004_lv2 -> <output_dir>/2000), mapping_land_cover 등이 읽는 구조"""
+    match = re.match(r'(\d{4})', target_name)
+    year_dir = os.path.join(output_dir, match.group(1)) if match else output_dir
+    os.makedirs(year_dir, exist_ok=True)
+    return year_dir
+
+def load_target(path):
+    """
+    연도별 병합 shp 또는 process_zips.py --parquet의 연도별 GeoParquet을 읽습니다.
+    GeoParquet의 대표점 기준 SIGUNGU_CD/SIGUNGU_NM은 교차 결과의 시군구 속성과 겹치므로 버립니다.
+    """
+    if path.endswith('.parquet'):
+        land_gdf = gpd.read_parquet(path)
+        return land_gdf.drop(columns=[c for c in ['SIGUNGU_CD', 'SIGUNGU_NM'] if c in land_gdf.columns])
+    return gpd.read_file(path)
+
+def target_name_of(path):
+    """예: temp/2019_add_area.shp -> 2019, parquet/2019.parquet -> 2019"""
+    name = os.path.basename(path)
+    return name[:-len(".parquet")] if name.endswith(".parquet") else name.replace("_add_area.shp", "")
+
+def process_target(shp_path, sigungu_path, output_dir):
+    """연도별 병합 shp(또는 GeoParquet) 하나를 시군구 경계와 교차시키고 결과/요약 파일을 <output_dir>/<연도>/에 저장합니다."""
+    target_name = target_name_of(shp_path)
+    output_dir = year_output_dir(output_dir, target_name)
+    output_path = os.path.join(output_dir, f"{target_name}_intersected.shp")
+
+    print(f"[교차 연산 시작] 대상: {target_name}")
+
+    try:
+        # 시군구 경계 데이터 로드 (작업 프로세스마다 개별 로드)
+        sigungu_gdf = gpd.read_file(sigungu_path)
+        # 시군구 데이터의 geometry 유효성 검사
+        sigungu_gdf.geometry = sigungu_gdf.geometry.make_valid()
+
+        # 땅피복 데이터 로드
+        land_gdf = load_target(shp_path)
+        if land_gdf.empty:
+            print(f"  - {target_name}: 데이터가 비어 있어 건너뜁니다.")
+            return
+
+        # 좌표계 일치 확인 (EPSG:5179)
+        if land_gdf.crs != sigungu_gdf.crs:
+            land_gdf = land_gdf.to_crs(sigungu_gdf.crs)
+
+        # 4. 교차 연산 (공간 인덱스 사전 필터 + 경계 폴리곤만 Intersection)
+        print(f"  - {target_name}: 공간 중첩(Intersection) 계산 중...")
+        intersected_gdf = intersect_with_sigungu(land_gdf, sigungu_gdf)
+
+        if intersected_gdf.empty:
+            print(f"  - {target_name}: 교차 영역 결과가 없습니다.")
+            return
+
+        # 5. 잘려진 도형에 맞게 면적 재계산
+        # 중첩되어 잘린 후의 실제 면적을 AREA_M2에 업데이트
+        intersected_gdf['AREA_M2'] = intersected_gdf.geometry.area
+
+        # 6. 결과 저장
+        print(f"  - 결과 저장 중: {os.path.basename(output_path)}")
+        intersected_gdf.to_file(output_path, encoding='utf-8')
+        print(f"✅ 완료: {output_path}")
+
+        # --- 요약 파일 생성  ---
+        summary, group_cols = summarize_intersection(intersected_gdf)
+        summary.to_csv(os.path.join(output_dir, f"{target_name}_summary.csv"), index=False, encoding='utf-8-sig')
+        print(f"📊 요약 완료 ({len(group_cols)-1}단계 기준): {target_name}_summary.csv")
 
-    # 2. 시군구 경계 데이터 로드
-    print(f"시군구 경계 데이터를 불러오는 중: {os.path.basename(sigungu_path)}")
+    except Exception as e:
+        print(f"  - [에러 발생] {target_name}: {e}")
+
+
+# --- 타일 단위 map-reduce 모드 ---
+# 연도 전체를 병합한 shp 대신 도엽(타일)별로 교차/집계한 부분 합계만 모아서 합칩니다.
+# 한 번에 메모리에 올라가는 것은 타일 하나와 시군구 경계뿐입니다.
+
+_worker_sigungu = None
+
+def _init_tile_worker(sigungu_path, sigungu_names=None):
+    """작업 프로세스마다 시군구 경계를 한 번만 로드합니다."""
+    global _worker_sigungu
     sigungu_gdf = gpd.read_file(sigungu_path)
-    # 시군구 데이터의 geometry 유효성 검사
+    if sigungu_names:
+        sigungu_gdf = sigungu_gdf[sigungu_gdf['SIGUNGU_NM'].isin(sigungu_names)].reset_index(drop=True)
     sigungu_gdf.geometry = sigungu_gdf.geometry.make_valid()
-    
-    # 3. temp 폴더 내의 병합된 shp 파일들 리스트업
-    target_shps = glob.glob(os.path.join(input_dir, "*_add_area.shp"))
-    # target_shps = glob.glob(os.path.join(input_dir, "*_lv2_add_area.shp"))
-    print(f"교차 연산 대상 파일 수: {len(target_shps)}개")
+    _worker_sigungu = sigungu_gdf
 
-    for shp_path in target_shps:
-        target_name = os.path.basename(shp_path).replace("_add_area.shp", "")
-        output_path = os.path.join(output_dir, f"{target_name}_intersected.shp")
+def find_year_tiles(year_dir, catalog_path=None, sigungu_path=None, sigungu_names=None):
+    """
+    연도 폴더의 타일 목록 (압축 해제된 .shp 또는 .zip 내부 shp 경로).
+    catalog_path가 주어지면 타일 카탈로그(index_metadata.py)에서 대상 시군구 범위와 겹치는 도엽만 고릅니다.
+    """
+    tiles = sorted(glob.glob(os.path.join(year_dir, '*.shp')))
+    for zip_path in sorted(glob.glob(os.path.join(year_dir, '*.zip'))):
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            tiles += [f"zip://{zip_path}!{m}" for m in zip_ref.namelist() if m.lower().endswith('.shp')]
 
-        print(f"\n{'='*50}")
-        print(f"[교차 연산 시작] 대상: {target_name}")
+    if catalog_path and sigungu_path:
+        from index_metadata import query_tiles, district_bbox
 
-        try:
-            # 땅피복 데이터 로드
-            land_gdf = gpd.read_file(shp_path)
-            if land_gdf.empty:
-                print(f"  - {target_name}: 데이터가 비어 있어 건너뜁니다.")
-                continue
+        year = int(re.match(r'(\d{4})', os.path.basename(os.path.normpath(year_dir))).group(1))
+        bbox = district_bbox(sigungu_path, sigungu_names)
+        mapsheets = {t['mapsheet'] for t in query_tiles(bbox, year=year, catalog_path=catalog_path)}
+        tiles = [t for t in tiles if tile_mapsheet(t) in mapsheets]
 
-            # 좌표계 일치 확인 (EPSG:5179)
-            if land_gdf.crs != sigungu_gdf.crs:
-                land_gdf = land_gdf.to_crs(sigungu_gdf.crs)
+    return tiles
 
-            # 4. 교차 연산 (Overlay Intersection)
-            # land_gdf의 각 폴리곤을 sigungu_gdf 경계로 자름
-            print(f"  - 공간 중첩(Intersection) 계산 중...")
-            intersected_gdf = gpd.overlay(land_gdf, sigungu_gdf, how='intersection')
+def tile_mapsheet(tile_path):
+    """타일 경로의 도엽번호 (예: .../9차피복_37608030.shp -> 37608030)"""
+    stem = unicodedata.normalize('NFC', os.path.splitext(os.path.basename(tile_path))[0])
+    return stem.split('_')[-1]
 
-            if intersected_gdf.empty:
-                print(f"  - {target_name}: 교차 영역 결과가 없습니다.")
+def summarize_tile(tile_path):
+    """[map] 타일 하나를 시군구로 자르고 시군구 × 분류코드 부분 면적 합계를 반환합니다."""
+    land_gdf = gpd.read_file(tile_path)
+    if land_gdf.empty:
+        return None
+
+    # 컬럼명/코드 정규화 (process_zips.read_zip_shapefiles와 동일)
+    land_gdf = land_gdf.rename(columns={c: unicodedata.normalize('NFC', c).upper()
+                                        for c in land_gdf.columns if c != land_gdf.geometry.name})
+    for col in CODE_COLUMNS:
+        if col in land_gdf.columns:
+            land_gdf[col] = pd.to_numeric(land_gdf[col], errors='coerce').astype('Int32')
+    if land_gdf.crs is not None and land_gdf.crs != _worker_sigungu.crs:
+        land_gdf = land_gdf.to_crs(_worker_sigungu.crs)
+
+    # 타일 범위와 겹치는 시군구만 사용
+    sigungu_gdf = _worker_sigungu.cx[slice(*land_gdf.total_bounds[[0, 2]]), slice(*land_gdf.total_bounds[[1, 3]])]
+    if sigungu_gdf.empty:
+        return None
+
+    intersected_gdf = intersect_with_sigungu(land_gdf, sigungu_gdf)
+    if intersected_gdf.empty:
+        return None
+    intersected_gdf['AREA_M2'] = intersected_gdf.geometry.area
+
+    summary, _ = summarize_intersection(intersected_gdf)
+    return summary
+
+def process_year_tiles(year_dir, sigungu_path, output_dir, max_workers=None, catalog_path=None, sigungu_names=None):
+    """
+    [reduce] 타일별 부분 합계를 병합해 {연도}_summary.csv를 만듭니다.
+    결과는 연도 병합 shp로 process_target을 돌린 요약과 같습니다. (교차 shp는 저장하지 않음)
+    """
+    target_name = os.path.basename(os.path.normpath(year_dir))
+    tiles = find_year_tiles(year_dir, catalog_path, sigungu_path, sigungu_names)
+    print(f"[타일 집계 시작] 대상: {target_name} (타일 {len(tiles)}개)")
+    if not tiles:
+        return
+
+    partials = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_tile_worker,
+                             initargs=(sigungu_path, sigungu_names)) as executor:
+        futures = {executor.submit(summarize_tile, tile): tile for tile in tiles}
+        for future in as_completed(futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                print(f"  - [에러 발생] {os.path.basename(futures[future])}: {e}")
                 continue
+            if summary is not None:
+                partials.append(summary)
+
+    if not partials:
+        print(f"  - {target_name}: 교차 영역 결과가 없습니다.")
+        return
 
-            # 5. 잘려진 도형에 맞게 면적 재계산
-            # 중첩되어 잘린 후의 실제 면적을 AREA_M2에 업데이트
-            intersected_gdf['AREA_M2'] = intersected_gdf.geometry.area
-            
-            # 6. 결과 저장
-            print(f"  - 결과 저장 중: {os.path.basename(output_path)}")
-            intersected_gdf.to_file(output_path, encoding='utf-8')
-            print(f"✅ 완료: {output_path}")
-
-            # --- 요약 파일 생성  ---
-            group_cols = ['SIGUNGU_NM']
-            
-            # 체크할 분류 단계 정의 (상세한 순서대로)
-            lv3_candidates = ['L3_CODE', 'L3_NAME']
-            lv2_candidates = ['L2_CODE', 'L2_NAME', 'LV2_CODE', 'LV2_NAME', 'CODE']
-            lv1_candidates = ['L1_CODE', 'L1_NAME']
-            # 1. 세분류(Level 3) 컬럼이 하나라도 있는지 확인
-            found_l3 = [c for c in lv3_candidates if c in intersected_gdf.columns]
-            if found_l3:
-                group_cols.extend(found_l3)
-            else:
-                # 2. 세분류가 없으면 중분류(Level 2) 확인
-                found_l2 = [c for c in lv2_candidates if c in intersected_gdf.columns]
-                if found_l2:
-                    group_cols.extend(found_l2)
-                else:
-                    # 3. 그마저도 없으면 대분류(Level 1) 확인
-                    found_l1 = [c for c in lv1_candidates if c in intersected_gdf.columns]
-                    group_cols.extend(found_l1)
-                    
-            # 필터링된 컬럼으로 그룹화
-            summary = intersected_gdf.groupby(group_cols)['AREA_M2'].sum().reset_index()
-            summary.to_csv(os.path.join(output_dir, f"{target_name}_summary.csv"), index=False, encoding='utf-8-sig')
-            print(f"📊 요약 완료 ({len(group_cols)-1}단계 기준): {target_name}_summary.csv")
-
-
-        except Exception as e:
-            print(f"  - [에러 발생] {target_name}: {e}")
+    # 부분 합계 병합 (같은 시군구 × 코드가 여러 타일에 걸쳐 있음)
+    combined = pd.concat(partials, ignore_index=True)
+    group_cols = [c for c in combined.columns if c != 'AREA_M2']
+    summary = combined.groupby(group_cols, dropna=False)['AREA_M2'].sum().reset_index()
+
+    output_path = os.path.join(year_output_dir(output_dir, target_name), f"{target_name}_summary.csv")
+    summary.to_csv(output_path, index=False, encoding='utf-8-sig')
+    print(f"📊 요약 완료 ({len(group_cols)-1}단계 기준): {output_path}")
+
+
+def main(max_workers=None, output_dir=OUTPUT_DIR, input_dir=INPUT_DIR, sigungu_path=SIGUNGU_PATH, parquet=False):
+
+    # 결과 저장 폴더 생성
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        print(f"폴더 생성 완료: {output_dir}")
+
+    # 3. temp 폴더 내의 병합된 shp 파일들 (parquet이면 연도별 GeoParquet) 리스트업
+    target_shps = glob.glob(os.path.join(input_dir, "*.parquet" if parquet else "*_add_area.shp"))
+    # target_shps = glob.glob(os.path.join(input_dir, "*_lv2_add_area.shp"))
+    print(f"교차 연산 대상 파일 수: {len(target_shps)}개")
+
+    # 연도별 파일을 프로세스 풀에서 병렬 처리
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(process_target, shp_path, sigungu_path, output_dir) for shp_path in target_shps]
+        for future in as_completed(futures):
+            future.result()
 
     print(f"\n{'='*50}")
     print("모든 공간 중첩 작업이 종료되었습니다.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tiles', nargs='+', metavar='YEAR_DIR', default=None,
+                        help='연도 병합 shp 대신 Origin/<연도> 폴더의 타일별로 집계 (예: 2019 2020)')
+    parser.add_argument('--catalog', default=None, help='타일 카탈로그(index_metadata.py)로 대상 타일 선별')
+    parser.add_argument('--sigungu', nargs='+', default=None, help='대상 시군구명 (기본: 전체)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--parquet', action='store_true',
+                        help='연도 병합 shp 대신 process_zips.py --parquet의 <연도>.parquet을 입력으로 사용')
+    parser.add_argument('--input-dir', default=None,
+                        help='연도 병합 *_add_area.shp 폴더 (기본: temp, --parquet이면 parquet)')
+    parser.add_argument('--boundary', default=SIGUNGU_PATH, help='시군구 경계 shp')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR,
+                        help='요약 CSV 저장 폴더, <연도> 하위 폴더에 저장 (기본: Seoul_Land_Cover)')
+    args = parser.parse_args()
+
+    if args.tiles:
+        for year_dir in args.tiles:
+            if not os.path.isdir(year_dir):
+                year_dir = os.path.join(ORIGIN_DIR, year_dir)
+            process_year_tiles(year_dir, args.boundary, args.output_dir, args.workers, args.catalog, args.sigungu)
+    else:
+        input_dir = args.input_dir or (PARQUET_DIR if args.parquet else INPUT_DIR)
+        main(args.workers, args.output_dir, input_dir, args.boundary, args.parquet)
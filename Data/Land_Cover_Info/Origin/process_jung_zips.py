@@ -2,6 +2,10 @@ import os
 import shutil
 import zipfile
 import unicodedata
+import argparse
+
+from process_zips import ingest_year_to_parquet, ORIGIN_DIR, BASE_DIR
+from land_cover_codes import SIGUNGU_PATH
 
 def normalize_string(s):
     # Normalize unicode characters to NFC to handle Hangul properly
@@ -81,6 +85,30 @@ def process_jung_zips_and_flatten(base_path):
             # 2. Flatten the directory
             flatten_directory(year_path)
 
+def process_jung_zips_to_parquet(base_path, output_dir, sigungu_path=None, max_workers=None):
+    # '중'으로 끝나는 폴더의 ZIP을 풀지 않고 폴더별 GeoParquet으로 저장
+    os.makedirs(output_dir, exist_ok=True)
+    for item in sorted(os.listdir(base_path)):
+        normalized_item = normalize_string(item)
+        year_path = os.path.join(base_path, item)
+        if not normalized_item.endswith('중') or not os.path.isdir(year_path):
+            continue
+
+        print(f"Processing Directory: {item}")
+        ingest_year_to_parquet(year_path, os.path.join(output_dir, f"{normalized_item}.parquet"),
+                               sigungu_path, max_workers)
+
 if __name__ == "__main__":
-    base_dir = "/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info"
-    process_jung_zips_and_flatten(base_dir)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--origin-dir', default=ORIGIN_DIR, help="'중'으로 끝나는 폴더가 있는 폴더 (기본: Origin)")
+    parser.add_argument('--parquet', action='store_true', help='ZIP을 풀지 않고 GeoParquet으로 저장')
+    parser.add_argument('--output-dir', default=os.path.join(BASE_DIR, "parquet"), help='--parquet 저장 폴더')
+    parser.add_argument('--boundary', default=SIGUNGU_PATH, help='--parquet에서 SIGUNGU_CD/SIGUNGU_NM을 붙일 시군구 경계 shp')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.parquet:
+        process_jung_zips_to_parquet(args.origin_dir, args.output_dir, sigungu_path=args.boundary,
+                                     max_workers=args.workers)
+    else:
+        process_jung_zips_and_flatten(args.origin_dir)
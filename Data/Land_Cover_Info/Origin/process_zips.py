@@ -1,7 +1,25 @@
 import os
+import sys
 import shutil
 import zipfile
 import re
+import unicodedata
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import geopandas as gpd
+import pandas as pd
+
+# 코드 컬럼 후보 (정수형으로 정규화)
+CODE_COLUMNS = ['L1_CODE', 'L2_CODE', 'L3_CODE', 'LV2_CODE', 'CODE']
+TARGET_CRS = 'EPSG:5179'
+
+ORIGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(ORIGIN_DIR)
+
+# 공용 경로 (Land_Cover_Info/land_cover_codes.py)
+sys.path.append(BASE_DIR)
+from land_cover_codes import SIGUNGU_PATH
 
 def flatten_directory(year_path):
     print(f"  Flattening directory: {year_path}")
@@ -87,6 +105,112 @@ def process_zips_and_flatten(base_path):
         # 2. Flatten the directory (handle any folders created by unzipping)
         flatten_directory(year_path)
 
+def read_zip_shapefiles(zip_path, sigungu_path=None):
+    """
+    ZIP 파일을 디스크에 풀지 않고 내부의 shp 멤버를 직접 읽어 하나의 GeoDataFrame으로 반환합니다.
+    sigungu_path가 주어지면 각 폴리곤의 대표점 기준으로 SIGUNGU_CD/SIGUNGU_NM을 붙입니다.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = [m for m in zip_ref.namelist() if m.lower().endswith('.shp')]
+
+    gdf_list = []
+    for member in members:
+        gdf = gpd.read_file(f"zip://{zip_path}!{member}")
+        if gdf.empty:
+            continue
+
+        # 컬럼명 정규화 (대문자, NFC)
+        gdf = gdf.rename(columns={c: unicodedata.normalize('NFC', c).upper()
+                                  for c in gdf.columns if c != gdf.geometry.name})
+        for col in CODE_COLUMNS:
+            if col in gdf.columns:
+                gdf[col] = pd.to_numeric(gdf[col], errors='coerce').astype('Int32')
+
+        if gdf.crs is not None and gdf.crs != TARGET_CRS:
+            gdf = gdf.to_crs(TARGET_CRS)
+
+        # 도엽번호는 shp 파일명에서 추출 (예: 9차피복_37608030.shp -> 37608030)
+        stem = unicodedata.normalize('NFC', os.path.splitext(os.path.basename(member))[0])
+        gdf['MAPSHEET'] = stem.split('_')[-1]
+        gdf['AREA_M2'] = gdf.geometry.area
+        gdf_list.append(gdf)
+
+    if not gdf_list:
+        return None
+
+    gdf = pd.concat(gdf_list, ignore_index=True)
+
+    if sigungu_path:
+        sigungu_gdf = gpd.read_file(sigungu_path).to_crs(gdf.crs)
+        points = gpd.GeoDataFrame(geometry=gdf.geometry.representative_point(), crs=gdf.crs)
+        joined = gpd.sjoin(points, sigungu_gdf[['SIGUNGU_CD', 'SIGUNGU_NM', 'geometry']],
+                           how='left', predicate='within')
+        joined = joined[~joined.index.duplicated(keep='first')]
+        gdf['SIGUNGU_CD'] = joined['SIGUNGU_CD']
+        gdf['SIGUNGU_NM'] = joined['SIGUNGU_NM']
+
+    return gdf
+
+def ingest_year_to_parquet(year_path, output_path, sigungu_path=None, max_workers=None):
+    """한 연도 폴더의 ZIP들을 병렬로 읽어 연도별 GeoParquet 파일 하나로 저장합니다. (intersect_sigungu.py --parquet의 입력)"""
+    zip_files = sorted(os.path.join(year_path, f) for f in os.listdir(year_path) if f.lower().endswith('.zip'))
+    if not zip_files:
+        print("  No zip files found.")
+        return
+
+    print(f"  Found {len(zip_files)} zip files.")
+    gdf_list = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(read_zip_shapefiles, z, sigungu_path): z for z in zip_files}
+        for future, zip_path in futures.items():
+            try:
+                gdf = future.result()
+            except zipfile.BadZipFile:
+                print(f"    Error: Bad zip file {os.path.basename(zip_path)}")
+                continue
+            except Exception as e:
+                print(f"    Error reading {os.path.basename(zip_path)}: {e}")
+                continue
+            if gdf is not None:
+                gdf_list.append(gdf)
+
+    if not gdf_list:
+        print("  No shapefiles found in zip files.")
+        return
+
+    year_gdf = pd.concat(gdf_list, ignore_index=True)
+    year_gdf.to_parquet(output_path, index=False)
+    print(f"  Saved {len(year_gdf)} polygons to {output_path}")
+
+def process_zips_to_parquet(base_path, output_dir, sigungu_path=None, max_workers=None):
+    """process_zips_and_flatten의 압축 해제/평탄화 대신 연도별 GeoParquet을 만듭니다. (ZIP은 삭제하지 않음)"""
+    year_pattern = re.compile(r'^\d{4}$')
+    years = sorted(item for item in os.listdir(base_path) if year_pattern.match(item))
+
+    os.makedirs(output_dir, exist_ok=True)
+    for year in years:
+        if int(year) < 2019:
+            continue
+
+        year_path = os.path.join(base_path, year)
+        if not os.path.isdir(year_path):
+            continue
+
+        print(f"Processing Year: {year}")
+        ingest_year_to_parquet(year_path, os.path.join(output_dir, f"{year}.parquet"), sigungu_path, max_workers)
+
 if __name__ == "__main__":
-    base_dir = "/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info"
-    process_zips_and_flatten(base_dir)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--origin-dir', default=ORIGIN_DIR, help='연도 폴더(<YYYY>)가 있는 폴더 (기본: Origin)')
+    parser.add_argument('--parquet', action='store_true', help='ZIP을 풀지 않고 연도별 GeoParquet으로 저장')
+    parser.add_argument('--output-dir', default=os.path.join(BASE_DIR, "parquet"), help='--parquet 저장 폴더')
+    parser.add_argument('--boundary', default=SIGUNGU_PATH,
+                        help='--parquet에서 SIGUNGU_CD/SIGUNGU_NM을 붙일 시군구 경계 shp')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.parquet:
+        process_zips_to_parquet(args.origin_dir, args.output_dir, sigungu_path=args.boundary,
+                                max_workers=args.workers)
+    else:
+        process_zips_and_flatten(args.origin_dir)
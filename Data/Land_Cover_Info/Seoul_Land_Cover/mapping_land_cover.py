@@ -1,37 +1,23 @@
 import pandas as pd
 import os
+import sys
 import glob
+import argparse
 import numpy as np
 
-def process_mixed_land_cover():
-    base_folder = '.'
-    
-    # 1. 대상 파일 찾기
+# 공용 분류/보간 모듈 (Land_Cover_Info/land_cover_codes.py, interpolation.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from land_cover_codes import classify_codes
+from interpolation import interpolate_frame, segment_update_matches, METHODS, EXTRAPOLATIONS
+
+OUTPUT_NAME = 'Seoul_LandCover_Mapping.csv'
+
+def find_lv2_files(base_folder):
+    """연도 -> *_lv2_summary.csv 경로 (연도별 첫 번째 파일 사용)"""
     all_files = glob.glob(os.path.join(base_folder, '**', '*_lv2_summary.csv'), recursive=True)
     print(f"Found {len(all_files)} LV2 summary files.")
-    
-    df_list = []
-    processed_years = set()
-
-    # 분류 맵핑 정의
-    code_map = {
-        '110': '주거지역',
-        '120': '공업지역',
-        '130': '상업지역',
-        '140': '문화체육휴양지역',
-        '150': '교통지역',
-        '160': '공공시설지역'
-    }
-    # 200~700번대 대분류 맵핑
-    major_map = {
-        '2': '농업지역',
-        '3': '산림지역',
-        '4': '초지',
-        '5': '습지',
-        '6': '나지',
-        '7': '수역'
-    }
 
+    files_by_year = {}
     for file_path in all_files:
         filename = os.path.basename(file_path)
         try:
@@ -39,117 +25,149 @@ def process_mixed_land_cover():
             year = int(year_str)
         except:
             continue
-            
-        if year in processed_years: continue
-        processed_years.add(year)
-        
-        print(f"Processing {filename} (Year: {year})...")
-        df = pd.read_csv(file_path)
-        
-        # 컬럼 찾기
-        code_col = None
-        for col in ['L2_CODE', 'LV2_CODE', 'CODE', 'L3_CODE']:
-            if col in df.columns:
-                code_col = col
-                break
-        if not code_col: continue
-            
-        # 분류 로직 함수
-        def categorize(code):
-            code_str = str(code)
-            # 숫자형 변환 시도 (float string 대응)
-            try:
-                code_str = str(int(float(code_str)))
-            except:
-                return 'Unknown'
-            
-            # 길이 보정 (2자리인 경우 등)
-            if len(code_str) == 2:
-                # 11 -> 110
-                if code_str.startswith('1'):
-                    code_str = code_str + '0'
-                else:
-                    pass # 21, 22 등... 
-            
-            first_digit = code_str[0]
-            
-            if first_digit == '1':
-                # 시가화지역: 중분류 코드 그대로 사용
-                if len(code_str) >= 2:
-                    norm_code = code_str[:2] + '0'
-                    if norm_code in code_map:
-                        return code_map[norm_code]
-                return '기타시가화'
-                
-            elif first_digit in major_map:
-                # 2~7번대: 대분류로 통합
-                return major_map[first_digit]
-            else:
-                return '기타'
-
-        df['CATEGORY'] = df[code_col].apply(categorize)
-        
-        # 집계
-        grouped = df.groupby(['SIGUNGU_NM', 'CATEGORY'])['AREA_M2'].sum().reset_index()
-        grouped['YEAR'] = year
-        df_list.append(grouped)
+
+        if year in files_by_year: continue
+        files_by_year[year] = file_path
+    return files_by_year
+
+def load_year_mapping(file_path, year):
+    """한 연도 요약 파일을 시군구 × 카테고리 면적으로 집계합니다."""
+    print(f"Processing {os.path.basename(file_path)} (Year: {year})...")
+    df = pd.read_csv(file_path)
+
+    # 컬럼 찾기
+    code_col = None
+    for col in ['L2_CODE', 'LV2_CODE', 'CODE', 'L3_CODE']:
+        if col in df.columns:
+            code_col = col
+            break
+    if not code_col: return None
+
+    # 분류 (시가화지역은 중분류, 2~7번대는 대분류로 통합)
+    _, categories, _ = classify_codes(df[code_col])
+    df['CATEGORY'] = categories
+
+    # 집계
+    grouped = df.groupby(['SIGUNGU_NM', 'CATEGORY'])['AREA_M2'].sum().reset_index()
+    grouped['YEAR'] = year
+    return grouped
+
+def build_mapping(files_by_year, years_range, method='linear', extrapolate='forward'):
+    """연도별 집계를 피벗하고 years_range 범위로 보간합니다."""
+    df_list = []
+    for year, file_path in sorted(files_by_year.items()):
+        grouped = load_year_mapping(file_path, year)
+        if grouped is not None:
+            df_list.append(grouped)
 
     # 통합
     if not df_list:
-        print("No data found.")
-        return
+        return None
 
     full_df = pd.concat(df_list, ignore_index=True)
-    
+
     # 피벗 (컬럼으로 변환)
     pivoted = full_df.pivot_table(index=['YEAR', 'SIGUNGU_NM'], columns='CATEGORY', values='AREA_M2', fill_value=0)
     pivoted = pivoted.reset_index()
-    
+
     # 컬럼 순서 정렬 (보기 좋게)
-    desired_order = ['YEAR', 'SIGUNGU_NM', 
+    desired_order = ['YEAR', 'SIGUNGU_NM',
                      '주거지역', '공업지역', '상업지역', '문화체육휴양지역', '교통지역', '공공시설지역',
                      '농업지역', '산림지역', '초지', '습지', '나지', '수역']
-    
+
     # 실제 존재하는 컬럼만 선택
     existing_cols = [c for c in desired_order if c in pivoted.columns]
     # 혹시 기타 등이 있으면 추가
     remaining = [c for c in pivoted.columns if c not in existing_cols]
     final_cols = ['YEAR', 'SIGUNGU_NM'] + [c for c in existing_cols if c not in ['YEAR', 'SIGUNGU_NM']] + remaining
-    
+
     pivoted = pivoted[final_cols]
 
-    # 보간 (2000-2024)
-    years_range = np.arange(2000, 2025)
-    sigungus = pivoted['SIGUNGU_NM'].unique()
-    idx = pd.MultiIndex.from_product([sigungus, years_range], names=['SIGUNGU_NM', 'YEAR'])
-    
-    pivoted = pivoted.set_index(['SIGUNGU_NM', 'YEAR']).reindex(idx).reset_index()
-    pivoted = pivoted.sort_values(by=['SIGUNGU_NM', 'YEAR'])
-    
-    def interpolate_group(group):
-        numeric_cols = group.select_dtypes(include=[np.number]).columns
-        # YEAR 제외
-        cols_to_interp = [c for c in numeric_cols if c != 'YEAR']
-        group[cols_to_interp] = group[cols_to_interp].interpolate(method='linear')
-        return group
-
-    final_df = pivoted.groupby('SIGUNGU_NM').apply(interpolate_group).reset_index(drop=True)
+    # 보간 (시군구 × 연도 × 카테고리 배열로 한 번에 처리)
+    cols_to_interp = [c for c in final_cols if c not in ['YEAR', 'SIGUNGU_NM']]
+    final_df = interpolate_frame(pivoted, 'SIGUNGU_NM', 'YEAR', cols_to_interp, years_range,
+                                 method=method, extrapolate=extrapolate)
+    final_df = final_df[['SIGUNGU_NM', 'YEAR'] + cols_to_interp]
     final_df = final_df.fillna(0)
-    
+
     # 반올림 및 총면적 계산 (검증용)
     area_cols = [c for c in final_df.columns if c not in ['YEAR', 'SIGUNGU_NM']]
     final_df[area_cols] = final_df[area_cols].round(2)
     final_df['TOTAL_CHECK'] = final_df[area_cols].sum(axis=1)
-    
+    return final_df
+
+def update_segment(existing_df, files_by_year, update_year, method='linear', extrapolate='forward'):
+    """
+    새 조사 연도(update_year)를 감싸는 보간 구간(이전 조사 연도 ~ 다음 조사 연도)만 다시 계산하여
+    기존 결과의 해당 행을 교체하거나 추가합니다. 선형 보간에서만 전체 재계산과 같습니다 (segment_update_matches).
+    """
+    survey_years = sorted(files_by_year)
+    prev_years = [y for y in survey_years if y < update_year]
+    next_years = [y for y in survey_years if y > update_year]
+    start = prev_years[-1] if prev_years else update_year
+    end = next_years[0] if next_years else update_year
+
+    bracket = {y: files_by_year[y] for y in (start, update_year, end)}
+    segment_df = build_mapping(bracket, np.arange(start, end + 1), method, extrapolate)
+
+    kept = existing_df[(existing_df['YEAR'] < start) | (existing_df['YEAR'] > end)]
+    updated = pd.concat([kept, segment_df], ignore_index=True)
+
+    # 한쪽에만 있는 카테고리는 0으로 채우고 TOTAL_CHECK는 맨 뒤로 (전체 실행 build_mapping과 같은 SIGUNGU_NM, YEAR 순서)
+    area_cols = [c for c in updated.columns if c not in ['YEAR', 'SIGUNGU_NM', 'TOTAL_CHECK']]
+    updated[area_cols] = updated[area_cols].fillna(0)
+    updated['TOTAL_CHECK'] = updated[area_cols].sum(axis=1)
+    updated = updated[['SIGUNGU_NM', 'YEAR'] + area_cols + ['TOTAL_CHECK']]
+
+    print(f"Recomputed years {start}-{end} for new survey year {update_year}")
+    return updated.sort_values(by=['SIGUNGU_NM', 'YEAR']).reset_index(drop=True)
+
+def process_mixed_land_cover(base_folder='.', update_year=None, method='linear', extrapolate='forward'):
+    # 1. 대상 파일 찾기
+    files_by_year = find_lv2_files(base_folder)
+    output_path = os.path.join(base_folder, OUTPUT_NAME)
+
+    if update_year is not None:
+        # 증분 모드: 새 연도를 감싸는 구간만 재계산
+        if update_year not in files_by_year:
+            print(f"No LV2 summary file found for {update_year}.")
+            return
+        if not os.path.exists(output_path):
+            print(f"{output_path} not found. Running full mapping instead.")
+            update_year = None
+        elif not segment_update_matches(method, extrapolate):
+            print(f"--update only recomputes one segment, which matches a full run for linear interpolation only "
+                  f"(method={method}, extrapolate={extrapolate}). Running full mapping instead.")
+            update_year = None
+
+    if update_year is not None:
+        final_df = update_segment(pd.read_csv(output_path), files_by_year, update_year, method, extrapolate)
+    else:
+        if not files_by_year:
+            print("No data found.")
+            return
+        # 보간 범위: 첫 조사 연도 ~ 마지막 조사 연도
+        years_range = np.arange(min(files_by_year), max(files_by_year) + 1)
+        final_df = build_mapping(files_by_year, years_range, method, extrapolate)
+        if final_df is None:
+            print("No data found.")
+            return
+
     # 저장
-    output_path = os.path.join(base_folder, 'Seoul_LandCover_Mapping.csv')
     final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
     print(f"Saved to {output_path}")
-    
+
     # 검증 출력 (강남구 2000년 데이터 확인)
     check = final_df[(final_df['SIGUNGU_NM'] == '강남구') & (final_df['YEAR'] == 2000)]
     print("\nVerification (Gangnam-gu 2000):")
     print(check.T)
 
 if __name__ == "__main__":
-    process_mixed_land_cover()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--folder', default=os.path.dirname(os.path.abspath(__file__)), help='*_lv2_summary.csv 폴더 (결과도 여기에 저장)')
+    parser.add_argument('--update', type=int, default=None, help='새로 추가된 조사 연도만 반영 (예: 2025)')
+    parser.add_argument('--method', choices=METHODS, default='linear', help='보간 방법')
+    parser.add_argument('--extrapolate', choices=EXTRAPOLATIONS, default='forward', help='조사 연도 범위 밖 처리')
+    args = parser.parse_args()
+
+    process_mixed_land_cover(args.folder, update_year=args.update, method=args.method, extrapolate=args.extrapolate)
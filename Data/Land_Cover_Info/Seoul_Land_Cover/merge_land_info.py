@@ -1,7 +1,13 @@
 import pandas as pd
 import os
+import sys
+import argparse
 
-def merge_land_info():
+# 불투수 보간 결과 파일명 규칙 (ImperviousData/interpolate_impervious.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ImperviousData'))
+from interpolate_impervious import find_output
+
+def merge_land_info(land_cover_path=None, impervious_path=None, output_path=None, impervious_folder=None):
     # 스크립트 파일의 절대 경로를 구함
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -9,19 +15,19 @@ def merge_land_info():
     parent_dir = os.path.dirname(script_dir)
 
     base_folder = script_dir  # Seoul_Land_Cover 폴더
-    impervious_folder = os.path.join(parent_dir, 'ImperviousData')
+    impervious_folder = impervious_folder or os.path.join(parent_dir, 'ImperviousData')
     
-    # 1. 파일 경로 설정
-    land_cover_path = os.path.join(base_folder, 'Seoul_LandCover_Mapping.csv')
-    impervious_path = os.path.join(impervious_folder, 'Seoul_ImperviousData_2000_2024.csv')
+    # 1. 파일 경로 설정 (인자로 주어지지 않으면 기본 위치 사용)
+    land_cover_path = land_cover_path or os.path.join(base_folder, 'Seoul_LandCover_Mapping.csv')
+    impervious_path = impervious_path or find_output(impervious_folder)
     
-    output_path = os.path.join(parent_dir, 'Seoul_Land_info.csv')
+    output_path = output_path or os.path.join(parent_dir, 'Seoul_Land_info.csv')
     
     if not os.path.exists(land_cover_path):
         print(f"Error: Land cover file not found at {land_cover_path}")
         return
-    if not os.path.exists(impervious_path):
-        print(f"Error: Impervious data file not found at {impervious_path}")
+    if impervious_path is None or not os.path.exists(impervious_path):
+        print(f"Error: Impervious data file not found at {impervious_path or impervious_folder}")
         return
         
     # 2. 데이터 로드
@@ -72,4 +78,10 @@ def merge_land_info():
     print(final_df.head())
 
 if __name__ == "__main__":
-    merge_land_info()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--land-cover', default=None, help='Seoul_LandCover_Mapping.csv (기본: 이 폴더)')
+    parser.add_argument('--impervious-dir', default=None, help='Seoul_ImperviousData_*.csv 폴더 (기본: ../ImperviousData)')
+    parser.add_argument('--output', default=None, help='결과 CSV (기본: ../Seoul_Land_info.csv)')
+    args = parser.parse_args()
+
+    merge_land_info(args.land_cover, output_path=args.output, impervious_folder=args.impervious_dir)
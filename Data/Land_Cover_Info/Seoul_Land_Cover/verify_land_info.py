@@ -1,38 +1,183 @@
 import pandas as pd
 import numpy as np
+import os
+import sys
+import glob
+import argparse
 
-def verify_data():
-    file_path = '/Users/eoseungyun/Desktop/project/DB_IFC/Data/Land_Cover_Info/Seoul_Land_Cover/Seoul_Land_info.csv'
-    df = pd.read_csv(file_path)
+# 공용 분류/큐브 모듈 (Land_Cover_Info/land_cover_codes.py, area_cube.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from land_cover_codes import classify_codes
+from area_cube import find_year_summaries, CODE_COLUMNS
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PARENT_DIR = os.path.dirname(SCRIPT_DIR)
+
+LAND_INFO_PATH = os.path.join(PARENT_DIR, 'Seoul_Land_info.csv')
+IMPERVIOUS_DIR = os.path.join(PARENT_DIR, 'ImperviousData')
+VIOLATIONS_PATH = os.path.join(PARENT_DIR, 'Seoul_Land_info_violations.csv')
+
+# 토지피복 관련 컬럼들 (주거~수역)
+LAND_COLS = ['주거지역', '공업지역', '상업지역', '문화체육휴양지역', '교통지역', '공공시설지역',
+             '농업지역', '산림지역', '초지', '습지', '나지', '수역']
+IMPERVIOUS_COLS = ['IMPERVIOUS_AREA_M2', 'PERVIOUS_AREA_M2', 'TOTAL_AREA_M2']
+
+# --- 규칙 ---
+# 각 규칙은 표 전체를 한 번에 검사하여 (위반 여부 mask, 실제값, 기대값) 배열을 반환합니다.
+# 'table': 'land_info' (Seoul_Land_info.csv) 또는 'survey' (조사 연도 요약 파일)
+# 'severity': 'error'는 검증 실패(종료 코드 1), 'warning'은 보고만 함
+
+def rule_area_sum(df, tolerance=0.1):
+    """12개 토지피복 면적 합계 = TOTAL_AREA_M2 (각 컬럼이 소수 둘째 자리로 반올림되어 있으므로 0.1 허용)"""
+    cols = [c for c in LAND_COLS if c in df.columns]
+    value = df[cols].to_numpy().sum(axis=1)
+    expected = df['TOTAL_AREA_M2'].to_numpy()
+    return np.abs(value - expected) > tolerance, value, expected
+
+def rule_impervious_split(df, tolerance=0.02):
+    """IMPERVIOUS_AREA_M2 + PERVIOUS_AREA_M2 = TOTAL_AREA_M2"""
+    value = df['IMPERVIOUS_AREA_M2'].to_numpy() + df['PERVIOUS_AREA_M2'].to_numpy()
+    expected = df['TOTAL_AREA_M2'].to_numpy()
+    return np.abs(value - expected) > tolerance, value, expected
+
+def rule_impervious_ratio(df, tolerance=1e-3):
+    """0 <= IMPERVIOUS_RATIO <= 100 이고 IMPERVIOUS_AREA_M2 / TOTAL_AREA_M2 * 100과 일치"""
+    value = df['IMPERVIOUS_RATIO'].to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        expected = df['IMPERVIOUS_AREA_M2'].to_numpy() / df['TOTAL_AREA_M2'].to_numpy() * 100
+    bad = (value < 0) | (value > 100) | ~np.isfinite(value) | (np.abs(value - expected) > tolerance)
+    return bad, value, expected
 
-    # 토지피복 관련 컬럼들 (주거~수역)
-    land_cols = ['주거지역', '공업지역', '상업지역', '문화체육휴양지역', '교통지역', '공공시설지역', 
-                 '농업지역', '산림지역', '초지', '습지', '나지', '수역']
+def rule_non_negative(df):
+    """보간된 면적 값은 음수가 아니고 비어 있지 않아야 함 (행별 최솟값 기준)"""
+    cols = [c for c in LAND_COLS + IMPERVIOUS_COLS if c in df.columns]
+    values = df[cols].to_numpy()
+    value = np.nanmin(np.where(np.isnan(values), -np.inf, values), axis=1)
+    return value < 0, value, np.zeros(len(df))
 
-    # 존재하는 컬럼만 선택
-    cols_to_sum = [c for c in land_cols if c in df.columns]
+def rule_total_stability(df, max_change=0.02):
+    """시군구 총면적은 연도에 따라 크게 변하지 않아야 함 (시군구 중앙값 대비 상대 편차)"""
+    total = df['TOTAL_AREA_M2']
+    expected = total.groupby(df['SIGUNGU_NM']).transform('median').to_numpy()
+    value = total.to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        bad = np.abs(value - expected) / expected > max_change
+    return bad, value, expected
 
-    # 합계 계산
-    df['CALC_SUM'] = df[cols_to_sum].sum(axis=1)
+def rule_impervious_codes(df, tolerance=1e-6):
+    """조사 연도 불투수 면적 = 110~160 + 230 코드 면적 합계 (상대 오차)"""
+    value = df['IMPERVIOUS_CODE_SUM'].to_numpy()
+    expected = df['IMPERVIOUS_AREA_M2'].to_numpy()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        bad = ~(np.abs(value - expected) <= tolerance * np.maximum(np.abs(expected), 1.0))
+    return bad, value, expected
 
-    # 차이 계산 (소수점 고려하여 절대값 차이)
-    df['DIFF'] = (df['CALC_SUM'] - df['TOTAL_AREA_M2']).abs()
+RULES = [
+    {'name': 'area_sum', 'table': 'land_info', 'severity': 'error', 'check': rule_area_sum},
+    {'name': 'impervious_split', 'table': 'land_info', 'severity': 'error', 'check': rule_impervious_split},
+    {'name': 'impervious_ratio', 'table': 'land_info', 'severity': 'error', 'check': rule_impervious_ratio},
+    {'name': 'non_negative', 'table': 'land_info', 'severity': 'error', 'check': rule_non_negative},
+    # 조사 연도별 경계 차이로 총면적이 흔들리는 경우가 있어 (예: 2009년) 경고로만 보고
+    {'name': 'total_stability', 'table': 'land_info', 'severity': 'warning', 'check': rule_total_stability},
+    {'name': 'impervious_codes', 'table': 'survey', 'severity': 'error', 'check': rule_impervious_codes},
+]
 
-    # 오차 허용 범위 (부동소수점 오차 고려 0.01로 설정)
-    tolerance = 0.01 
+# --- 입력 ---
 
-    mismatch = df[df['DIFF'] > tolerance]
+def load_survey_table(summary_folder=SCRIPT_DIR, impervious_dir=IMPERVIOUS_DIR):
+    """
+    조사 연도별 (SIGUNGU_NM, YEAR)에 대해 요약 파일의 불투수 코드 면적 합계와
+    *_impervious_summary.csv의 IMPERVIOUS_AREA_M2를 나란히 놓은 표
+    """
+    frames = []
+    for year, f in sorted(find_year_summaries(summary_folder).items()):
+        df = pd.read_csv(f)
+        code_col = next((c for c in CODE_COLUMNS if c in df.columns), None)
+        if code_col is None:
+            continue
+        is_impervious = classify_codes(df[code_col])[2]
+        sums = pd.Series(np.where(is_impervious, df['AREA_M2'], 0.0)).groupby(df['SIGUNGU_NM']).sum()
+        frames.append(pd.DataFrame({'SIGUNGU_NM': sums.index, 'YEAR': year, 'IMPERVIOUS_CODE_SUM': sums.to_numpy()}))
+    if not frames:
+        return pd.DataFrame(columns=['SIGUNGU_NM', 'YEAR', 'IMPERVIOUS_CODE_SUM', 'IMPERVIOUS_AREA_M2'])
+    code_sums = pd.concat(frames, ignore_index=True)
+
+    imp_frames = []
+    for f in glob.glob(os.path.join(impervious_dir, '*_impervious_summary.csv')):
+        imp = pd.read_csv(f, usecols=['SIGUNGU_NM', 'IMPERVIOUS_AREA_M2'])
+        imp['YEAR'] = int(os.path.basename(f).split('_')[0])
+        imp_frames.append(imp)
+    if not imp_frames:
+        code_sums['IMPERVIOUS_AREA_M2'] = np.nan
+        return code_sums
+
+    return code_sums.merge(pd.concat(imp_frames, ignore_index=True), on=['SIGUNGU_NM', 'YEAR'], how='left')
+
+# --- 실행 ---
+
+def validate(tables, rules=RULES):
+    """모든 규칙을 실행하고 위반 행을 하나의 표로 반환합니다."""
+    violations = []
+    for rule in rules:
+        df = tables.get(rule['table'])
+        if df is None or df.empty:
+            continue
+        try:
+            bad, value, expected = rule['check'](df)
+        except KeyError as e:
+            print(f"  - 규칙 {rule['name']} 건너뜀: 컬럼 없음 {e}")
+            continue
+        bad = np.asarray(bad, dtype=bool)
+        if bad.any():
+            violations.append(pd.DataFrame({
+                'RULE': rule['name'],
+                'SEVERITY': rule['severity'],
+                'YEAR': df['YEAR'].to_numpy()[bad],
+                'SIGUNGU_NM': df['SIGUNGU_NM'].to_numpy()[bad],
+                'VALUE': np.asarray(value, dtype=float)[bad],
+                'EXPECTED': np.asarray(expected, dtype=float)[bad],
+            }))
+
+    if not violations:
+        return pd.DataFrame(columns=['RULE', 'SEVERITY', 'YEAR', 'SIGUNGU_NM', 'VALUE', 'EXPECTED', 'DIFF'])
+    result = pd.concat(violations, ignore_index=True)
+    result['DIFF'] = result['VALUE'] - result['EXPECTED']
+    return result
+
+def verify_data(file_path=LAND_INFO_PATH, output_path=VIOLATIONS_PATH, summary_folder=SCRIPT_DIR,
+                impervious_dir=IMPERVIOUS_DIR):
+    df = pd.read_csv(file_path)
+    tables = {'land_info': df, 'survey': load_survey_table(summary_folder, impervious_dir)}
+    violations = validate(tables)
 
     print("-" * 50)
-    if mismatch.empty:
-        print('✅ Verification SUCCESS: All rows match within tolerance.')
-        print(f"Max Difference found: {df['DIFF'].max()}")
+    checked = [r['name'] for r in RULES if r['table'] in tables and not tables[r['table']].empty]
+    errors = violations[violations['SEVERITY'] == 'error']
+    if violations.empty:
+        print(f'✅ Verification SUCCESS: {len(checked)} rules passed ({", ".join(checked)}).')
+        if os.path.exists(output_path):
+            os.remove(output_path)
     else:
-        print('❌ Verification FAILED: Some rows do not match.')
-        print(f'Number of mismatches: {len(mismatch)}')
+        if errors.empty:
+            print('⚠️ Verification PASSED with warnings.')
+        else:
+            print('❌ Verification FAILED: Some rows do not match.')
+        print(violations.groupby(['SEVERITY', 'RULE']).size().rename('violations').to_string())
         print("\nTop 5 Mismatches:")
-        print(mismatch[['YEAR', 'SIGUNGU_NM', 'CALC_SUM', 'TOTAL_AREA_M2', 'DIFF']].head())
+        print(violations.head())
+        violations.to_csv(output_path, index=False, encoding='utf-8-sig')
+        print(f"\nViolations saved to {output_path}")
     print("-" * 50)
+    return violations
 
 if __name__ == "__main__":
-    verify_data()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', default=LAND_INFO_PATH)
+    parser.add_argument('--output', default=VIOLATIONS_PATH, help='위반 목록 CSV')
+    parser.add_argument('--summary-folder', default=SCRIPT_DIR, help='조사 연도별 *_summary.csv 폴더')
+    parser.add_argument('--impervious-dir', default=IMPERVIOUS_DIR, help='*_impervious_summary.csv 폴더')
+    args = parser.parse_args()
+
+    violations = verify_data(args.input, args.output, args.summary_folder, args.impervious_dir)
+    # 파이프라인 게이트: error 규칙 위반이 있으면 실패 코드
+    sys.exit(1 if (violations['SEVERITY'] == 'error').any() else 0)
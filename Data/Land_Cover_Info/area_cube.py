@@ -0,0 +1,192 @@
+import os
+import json
+import glob
+import argparse
+import numpy as np
+import pandas as pd
+
+from land_cover_codes import parse_codes, classify_codes
+from interpolation import interpolate_cube, METHODS, EXTRAPOLATIONS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SUMMARY_FOLDER = os.path.join(BASE_DIR, 'Seoul_Land_Cover')
+CUBE_DIR = os.path.join(BASE_DIR, 'area_cube')
+
+CODE_COLUMNS = ['L3_CODE', 'L2_CODE', 'LV2_CODE', 'CODE']
+LEVELS = ('code', 'lv2', 'lv1', 'category', 'impervious')
+
+def find_year_summaries(base_folder=SUMMARY_FOLDER):
+    """
+    연도 -> 가장 세분화된 요약 파일. 세분류(*_summary.csv, L3_CODE)가 있으면 그것을,
+    없으면 *_lv2_summary.csv를 사용합니다. (impervious 요약은 제외)
+    """
+    files_by_year = {}
+    for f in sorted(glob.glob(os.path.join(base_folder, '**', '*_summary.csv'), recursive=True)):
+        filename = os.path.basename(f)
+        if 'impervious' in filename:
+            continue
+        try:
+            year = int(filename.split('_')[0])
+        except ValueError:
+            continue
+        if year not in files_by_year or 'lv2' in os.path.basename(files_by_year[year]):
+            files_by_year[year] = f
+    return files_by_year
+
+def build_cube(base_folder=SUMMARY_FOLDER, cube_dir=CUBE_DIR):
+    """
+    요약 CSV들을 (시군구 × 조사 연도 × 코드) 면적 배열로 한 번 변환해 저장합니다.
+    - area_cube.npy: float64 배열 (np.load(mmap_mode='r')로 메모리 매핑)
+    - area_cube.json: 축 정보 (districts, years, codes)와 원본 파일 목록
+    코드 축에는 세분류 코드와 (세분류가 없는 연도의) 중분류 코드가 함께 들어갑니다.
+    조사 연도에 없는 코드의 면적은 0입니다.
+    """
+    files_by_year = find_year_summaries(base_folder)
+    if not files_by_year:
+        print("No summary files found.")
+        return
+
+    frames = []
+    for year, f in sorted(files_by_year.items()):
+        df = pd.read_csv(f)
+        code_col = next((c for c in CODE_COLUMNS if c in df.columns), None)
+        if code_col is None or 'SIGUNGU_NM' not in df.columns:
+            print(f"  Skipping {os.path.basename(f)}: no code/SIGUNGU_NM column.")
+            continue
+        frames.append(pd.DataFrame({
+            'SIGUNGU_NM': df['SIGUNGU_NM'],
+            'YEAR': year,
+            'CODE': parse_codes(df[code_col]),
+            'AREA_M2': df['AREA_M2'].to_numpy(dtype=float),
+        }))
+
+    full_df = pd.concat(frames, ignore_index=True)
+    full_df = full_df[full_df['CODE'] >= 0]
+
+    districts = np.sort(full_df['SIGUNGU_NM'].unique())
+    years = np.sort(full_df['YEAR'].unique())
+    codes = np.sort(full_df['CODE'].unique())
+
+    cube = np.zeros((len(districts), len(years), len(codes)))
+    np.add.at(cube, (np.searchsorted(districts, full_df['SIGUNGU_NM'].to_numpy()),
+                     np.searchsorted(years, full_df['YEAR'].to_numpy()),
+                     np.searchsorted(codes, full_df['CODE'].to_numpy())),
+              full_df['AREA_M2'].to_numpy())
+
+    os.makedirs(cube_dir, exist_ok=True)
+    np.save(os.path.join(cube_dir, 'area_cube.npy'), cube)
+    meta = {
+        'districts': districts.tolist(),
+        'years': years.tolist(),
+        'codes': codes.tolist(),
+        'sources': {str(y): os.path.relpath(f, base_folder) for y, f in sorted(files_by_year.items())},
+    }
+    with open(os.path.join(cube_dir, 'area_cube.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    print(f"Saved area cube {cube.shape} (districts × years × codes) to {cube_dir}")
+
+def load_cube(cube_dir=CUBE_DIR):
+    """저장된 면적 배열(메모리 매핑)과 축 정보를 불러옵니다."""
+    with open(os.path.join(cube_dir, 'area_cube.json'), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return {
+        'values': np.load(os.path.join(cube_dir, 'area_cube.npy'), mmap_mode='r'),
+        'districts': np.array(meta['districts'], dtype=object),
+        'years': np.array(meta['years']),
+        'codes': np.array(meta['codes']),
+    }
+
+def rollup_groups(codes, level):
+    """코드 축 -> (그룹 인덱스 배열, 그룹 이름 배열)"""
+    if level == 'code':
+        return np.arange(len(codes)), codes
+    # 4자리 이상 코드도 calc_impervious_consistent/mapping_land_cover와 같은 규칙으로 분류
+    lv2, category, is_impervious = classify_codes(codes)
+    if level == 'lv2':
+        keys = lv2
+    elif level == 'lv1':
+        keys = lv2 // 100 * 100
+    elif level == 'category':
+        keys = category
+    elif level == 'impervious':
+        keys = np.where(is_impervious, 'IMPERVIOUS_AREA_M2', 'PERVIOUS_AREA_M2')
+    else:
+        raise ValueError(f"Unknown level: {level}")
+    names, groups = np.unique(keys, return_inverse=True)
+    return groups, names
+
+def query_cube(cube, districts=None, start=None, end=None, level='category',
+               interpolate=False, method='linear', extrapolate='forward'):
+    """
+    시군구/연도 범위로 자르고 코드 축을 level 단위로 합산한 표 (행: SIGUNGU_NM, YEAR).
+    level: 'code'(원본 코드), 'lv2'(중분류), 'lv1'(대분류), 'category'(Seoul_LandCover_Mapping과 같은 분류),
+           'impervious'(불투수/투수)
+    interpolate=True이면 start~end의 모든 연도를 조사 연도 사이에서 보간합니다.
+    """
+    district_idx = np.arange(len(cube['districts']))
+    if districts is not None:
+        district_idx = np.flatnonzero(np.isin(cube['districts'], list(districts)))
+
+    years = cube['years']
+    start = years[0] if start is None else start
+    end = years[-1] if end is None else end
+    year_mask = (years >= start) & (years <= end)
+
+    # 보간 시에는 범위 밖 가장 가까운 조사 연도도 함께 읽어 구간 끝을 보간
+    if interpolate:
+        before = np.flatnonzero(years < start)
+        after = np.flatnonzero(years > end)
+        year_mask[before[-1:]] = True
+        year_mask[after[:1]] = True
+
+    values = cube['values'][np.ix_(district_idx, np.flatnonzero(year_mask), np.arange(len(cube['codes'])))]
+
+    # 코드 축 합산: (코드 × 그룹) 지시 행렬과의 곱
+    groups, names = rollup_groups(cube['codes'], level)
+    indicator = np.zeros((len(groups), len(names)))
+    indicator[np.arange(len(groups)), groups] = 1.0
+    rolled = values @ indicator
+
+    out_years = years[year_mask]
+    if interpolate:
+        all_years = np.arange(min(start, out_years[0]), max(end, out_years[-1]) + 1)
+        full = np.full((len(district_idx), len(all_years), len(names)), np.nan)
+        full[:, np.searchsorted(all_years, out_years), :] = rolled
+        full = interpolate_cube(full, all_years, method=method, extrapolate=extrapolate)
+        keep = (all_years >= start) & (all_years <= end)
+        rolled, out_years = full[:, keep, :], all_years[keep]
+
+    out = pd.DataFrame({
+        'SIGUNGU_NM': np.repeat(cube['districts'][district_idx], len(out_years)),
+        'YEAR': np.tile(out_years, len(district_idx)),
+    })
+    columns = [str(n) for n in names]
+    out[columns] = rolled.reshape(-1, len(names))
+    return out
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='시군구 × 연도 × 코드 면적 큐브')
+    parser.add_argument('--build', action='store_true', help='요약 CSV로 큐브를 (다시) 생성')
+    parser.add_argument('--folder', default=SUMMARY_FOLDER, help='연도별 *_summary.csv 폴더')
+    parser.add_argument('--cube-dir', default=CUBE_DIR, help='큐브 저장 폴더')
+    parser.add_argument('--sigungu', nargs='+', default=None)
+    parser.add_argument('--start', type=int, default=None)
+    parser.add_argument('--end', type=int, default=None)
+    parser.add_argument('--level', choices=LEVELS, default='category')
+    parser.add_argument('--interpolate', action='store_true')
+    parser.add_argument('--method', choices=METHODS, default='linear', help='보간 방법')
+    parser.add_argument('--extrapolate', choices=EXTRAPOLATIONS, default='forward', help='조사 연도 범위 밖 처리')
+    parser.add_argument('--output', default=None, help='조회 결과 CSV (없으면 화면 출력)')
+    args = parser.parse_args()
+
+    if args.build or not os.path.exists(os.path.join(args.cube_dir, 'area_cube.npy')):
+        build_cube(args.folder, args.cube_dir)
+
+    result = query_cube(load_cube(args.cube_dir), args.sigungu, args.start, args.end, args.level,
+                        args.interpolate, args.method, args.extrapolate)
+    if args.output:
+        result.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"Saved to {args.output}")
+    else:
+        print(result)
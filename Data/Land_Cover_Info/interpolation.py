@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+
+METHODS = ('linear', 'pchip', 'nearest')
+EXTRAPOLATIONS = ('forward', 'none', 'hold', 'linear')
+
+
+def to_cube(df, key_col, year_col, value_cols, years):
+    """
+    긴 형태의 표를 (key × year × metric) 배열로 바꿉니다. 조사되지 않은 칸은 NaN.
+    key는 정렬된 순서 (groupby 결과와 동일)
+    """
+    years = np.asarray(years)
+    keys = np.sort(df[key_col].unique())
+    key_pos = np.searchsorted(keys, df[key_col].to_numpy())
+    year_pos = np.searchsorted(years, df[year_col].to_numpy())
+
+    # years 범위를 벗어난 행은 제외
+    in_range = (year_pos < len(years)) & (years[np.minimum(year_pos, len(years) - 1)] == df[year_col].to_numpy())
+
+    cube = np.full((len(keys), len(years), len(value_cols)), np.nan)
+    cube[key_pos[in_range], year_pos[in_range]] = df[value_cols].to_numpy(dtype=float)[in_range]
+    return keys, cube
+
+
+def from_cube(keys, years, cube, key_col, year_col, value_cols):
+    """to_cube의 역변환: key, year 순으로 정렬된 긴 형태의 표를 만듭니다."""
+    n_keys, n_years, _ = cube.shape
+    out = pd.DataFrame({
+        key_col: np.repeat(keys, n_years),
+        year_col: np.tile(np.asarray(years), n_keys),
+    })
+    out[value_cols] = cube.reshape(n_keys * n_years, -1)
+    return out
+
+
+def _take(values, idx):
+    return np.take_along_axis(values, np.clip(idx, 0, values.shape[1] - 1), axis=1)
+
+
+def _pchip_slopes(x, values, valid, prev_idx, next_idx):
+    """
+    각 조사값(knot) 위치의 단조 3차(PCHIP, Fritsch-Carlson) 기울기. knot가 아닌 칸은 NaN.
+    계열마다 조사 연도가 달라도 되도록 이웃 knot를 인덱스 배열로 찾습니다.
+    """
+    n_years = values.shape[1]
+    # 바로 이전/다음 knot (자기 자신 제외)
+    prev_strict = np.concatenate([np.full((len(values), 1), -1), prev_idx[:, :-1]], axis=1)
+    next_strict = np.concatenate([next_idx[:, 1:], np.full((len(values), 1), n_years)], axis=1)
+    has_l = prev_strict >= 0
+    has_r = next_strict < n_years
+
+    xs = np.broadcast_to(x, values.shape)
+    h0 = xs - x[np.clip(prev_strict, 0, n_years - 1)]
+    h1 = x[np.clip(next_strict, 0, n_years - 1)] - xs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 왼쪽/오른쪽 구간 기울기 (이웃 knot가 없으면 NaN)
+        d0 = np.where(has_l, (values - _take(values, prev_strict)) / h0, np.nan)
+        d1 = np.where(has_r, (_take(values, next_strict) - values) / h1, np.nan)
+
+        # 내부 knot: 가중 조화평균, 부호가 바뀌면 0
+        w1 = 2 * h1 + h0
+        w2 = h1 + 2 * h0
+        inner = np.where(d0 * d1 > 0, (w1 + w2) / (w1 / d0 + w2 / d1), 0.0)
+
+        # 끝 knot: 한쪽 방향 3점 공식 (scipy.interpolate.PchipInterpolator와 동일)
+        def edge(h_a, h_b, m_a, m_b):
+            d = ((2 * h_a + h_b) * m_a - h_a * m_b) / (h_a + h_b)
+            d = np.where(np.sign(d) != np.sign(m_a), 0.0, d)
+            overshoot = (np.sign(m_a) != np.sign(m_b)) & (np.abs(d) > np.abs(3 * m_a))
+            d = np.where(overshoot, 3 * m_a, d)
+            # knot가 두 개뿐이면 직선 기울기
+            return np.where(np.isnan(m_b), m_a, d)
+
+        # 왼쪽 끝: 첫 구간과 두 번째 구간 / 오른쪽 끝: 마지막 구간과 그 앞 구간
+        left = edge(h1, _take(h1, next_strict), d1, _take(d1, next_strict))
+        right = edge(h0, _take(h0, prev_strict), d0, _take(d0, prev_strict))
+
+    slopes = np.where(has_l & has_r, inner, np.where(has_r, left, np.where(has_l, right, 0.0)))
+    return np.where(valid, slopes, np.nan)
+
+
+def interpolate_cube(cube, years, method='linear', extrapolate='forward'):
+    """
+    (key × year × metric) 배열의 빈 연도를 모든 key와 metric에 대해 한 번에 보간합니다.
+    method: 'linear'(선형), 'pchip'(단조 3차), 'nearest'(가장 가까운 조사 연도)
+    extrapolate: 첫/마지막 조사 연도 밖의 처리 - 'forward'(앞쪽은 NaN, 뒤쪽은 마지막 값 유지;
+                 pandas interpolate 기본 동작과 동일), 'none'(NaN 유지), 'hold'(양 끝 값 유지),
+                 'linear'(끝 구간 기울기로 연장)
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method: {method}")
+    if extrapolate not in EXTRAPOLATIONS:
+        raise ValueError(f"Unknown extrapolate: {extrapolate}")
+
+    n_keys, n_years, n_metrics = cube.shape
+    x = np.asarray(years, dtype=float)
+    # (key*metric, year) 형태의 계열로 펼침
+    values = cube.transpose(0, 2, 1).reshape(-1, n_years)
+    valid = ~np.isnan(values)
+
+    idx = np.arange(n_years)
+    prev_idx = np.maximum.accumulate(np.where(valid, idx, -1), axis=1)
+    next_idx = np.minimum.accumulate(np.where(valid, idx, n_years)[:, ::-1], axis=1)[:, ::-1]
+    has_prev = prev_idx >= 0
+    has_next = next_idx < n_years
+
+    v_p, v_n = _take(values, prev_idx), _take(values, next_idx)
+    x_p, x_n = x[np.clip(prev_idx, 0, n_years - 1)], x[np.clip(next_idx, 0, n_years - 1)]
+    xs = np.broadcast_to(x, values.shape)
+
+    result = values.copy()
+    interior = has_prev & has_next & ~valid
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = x_n - x_p
+        t = (xs - x_p) / h
+        if method == 'linear':
+            filled = v_p + t * (v_n - v_p)
+        elif method == 'nearest':
+            filled = np.where(xs - x_p <= x_n - xs, v_p, v_n)
+        else:
+            slopes = _pchip_slopes(x, values, valid, prev_idx, next_idx)
+            s_p, s_n = _take(slopes, prev_idx), _take(slopes, next_idx)
+            t2, t3 = t * t, t * t * t
+            filled = ((2 * t3 - 3 * t2 + 1) * v_p + (t3 - 2 * t2 + t) * h * s_p
+                      + (-2 * t3 + 3 * t2) * v_n + (t3 - t2) * h * s_n)
+    result[interior] = filled[interior]
+
+    # 양 끝 외삽
+    leading = ~has_prev & has_next
+    trailing = has_prev & ~has_next
+    if extrapolate in ('forward', 'hold'):
+        result[trailing] = v_p[trailing]
+        if extrapolate == 'hold':
+            result[leading] = v_n[leading]
+    elif extrapolate == 'linear':
+        # 끝 knot와 그 안쪽 knot 사이의 기울기로 연장 (knot가 하나면 끝 값 유지)
+        first_idx, last_idx = next_idx[:, :1], prev_idx[:, -1:]
+        second_idx = np.where(valid & (idx > first_idx), idx, n_years).min(axis=1, keepdims=True)
+        before_last = np.where(valid & (idx < last_idx), idx, -1).max(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lead_slope = (_take(values, second_idx) - _take(values, first_idx)) / (
+                x[np.clip(second_idx, 0, n_years - 1)] - x[np.clip(first_idx, 0, n_years - 1)])
+            trail_slope = (_take(values, last_idx) - _take(values, before_last)) / (
+                x[np.clip(last_idx, 0, n_years - 1)] - x[np.clip(before_last, 0, n_years - 1)])
+        lead_slope = np.where(second_idx < n_years, lead_slope, 0.0)
+        trail_slope = np.where(before_last >= 0, trail_slope, 0.0)
+        lead = v_n + (xs - x_n) * lead_slope
+        trail = v_p + (xs - x_p) * trail_slope
+        result[leading] = lead[leading]
+        result[trailing] = trail[trailing]
+
+    return result.reshape(n_keys, n_metrics, n_years).transpose(0, 2, 1)
+
+
+def segment_update_matches(method, extrapolate):
+    """
+    새 조사 연도를 감싸는 구간(이전~다음 조사 연도)만 다시 계산해도 전체 재계산과 같은지 여부.
+    선형 보간은 양옆 조사값 두 개로만 정해지지만, pchip 기울기와 끝 외삽('hold', 'linear')은
+    구간 밖 조사값에 따라 달라지므로 증분 갱신 대신 전체를 다시 계산해야 합니다.
+    """
+    return method == 'linear' and extrapolate in ('forward', 'none')
+
+
+def interpolate_frame(df, key_col, year_col, value_cols, years, method='linear', extrapolate='forward'):
+    """긴 형태의 표를 years 전체로 확장하여 value_cols를 보간한 표를 반환합니다."""
+    keys, cube = to_cube(df, key_col, year_col, value_cols, years)
+    cube = interpolate_cube(cube, years, method=method, extrapolate=extrapolate)
+    return from_cube(keys, years, cube, key_col, year_col, value_cols)
@@ -0,0 +1,112 @@
+import os
+import unicodedata
+import numpy as np
+import pandas as pd
+
+LAND_COVER_DIR = os.path.dirname(os.path.abspath(__file__))
+# 시군구 경계 shp (Land_Cover_Info 기준 상대 경로). 폴더명은 macOS에서 만든 그대로 NFD 표기
+SIGUNGU_SHP = os.path.join(unicodedata.normalize('NFD', '서울_시군구'), 'bnd_sigungu_11_2025_2Q.shp')
+SIGUNGU_PATH = os.path.join(LAND_COVER_DIR, SIGUNGU_SHP)
+
+# 시가화 건조지역(100번대) 중분류 맵핑
+CODE_MAP = {
+    110: '주거지역',
+    120: '공업지역',
+    130: '상업지역',
+    140: '문화체육휴양지역',
+    150: '교통지역',
+    160: '공공시설지역'
+}
+# 200~700번대 대분류 맵핑
+MAJOR_MAP = {
+    2: '농업지역',
+    3: '산림지역',
+    4: '초지',
+    5: '습지',
+    6: '나지',
+    7: '수역'
+}
+# 불투수 중분류: 110(주거), 120(공업), 130(상업), 140(문화체육), 150(교통), 160(공공), 230(시설재배)
+IMPERVIOUS_LV2 = {110, 120, 130, 140, 150, 160, 230}
+
+# 카테고리 이름 배열 (인덱스 = 카테고리 ID)
+CATEGORY_NAMES = np.array(
+    list(CODE_MAP.values()) + list(MAJOR_MAP.values()) + ['기타시가화', '기타', 'Unknown'],
+    dtype=object
+)
+OTHER_URBAN, OTHER, UNKNOWN = len(CATEGORY_NAMES) - 3, len(CATEGORY_NAMES) - 2, len(CATEGORY_NAMES) - 1
+
+# LV2 코드(0~999) -> 카테고리 ID / 불투수 여부 룩업 테이블
+LV2_TABLE_SIZE = 1000
+
+def _build_lookup_tables():
+    category = np.full(LV2_TABLE_SIZE, OTHER, dtype=np.int16)
+    impervious = np.zeros(LV2_TABLE_SIZE, dtype=bool)
+
+    codes = np.arange(LV2_TABLE_SIZE)
+    digits = np.where(codes >= 100, 3, np.where(codes >= 10, 2, 1))
+    first_digit = codes // 10 ** (digits - 1)
+
+    # 1번대: 중분류 맵에 있으면 해당 카테고리, 없으면 기타시가화
+    category[first_digit == 1] = OTHER_URBAN
+    for i, code in enumerate(CODE_MAP):
+        category[code] = i
+    # 2~7번대: 대분류로 통합
+    for i, digit in enumerate(MAJOR_MAP):
+        category[(first_digit == digit) & (codes > 0)] = len(CODE_MAP) + i
+
+    impervious[list(IMPERVIOUS_LV2)] = True
+    return category, impervious
+
+CATEGORY_LOOKUP, IMPERVIOUS_LOOKUP = _build_lookup_tables()
+
+
+def parse_codes(values):
+    """코드 값(문자열/실수 등)을 정수 배열로 변환합니다. 변환할 수 없는 값은 -1."""
+    numeric = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+    valid = np.isfinite(numeric)
+    codes = np.full(len(numeric), -1, dtype=np.int64)
+    # str(int(float(x)))와 동일하게 소수점 이하는 버림
+    codes[valid] = np.trunc(numeric[valid]).astype(np.int64)
+    codes[codes < 0] = -1
+    return codes
+
+
+def to_lv2(codes):
+    """
+    정수 코드를 일관된 LV2(중분류) 코드로 변환합니다.
+    세분류(111, 112 ...)는 110, 중분류(110)는 그대로, 2자리 코드(11)는 110으로 보정합니다.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    lv2 = codes.copy()
+    three = (codes >= 100) & (codes < 1000)
+    two = (codes >= 10) & (codes < 100)
+    lv2[three] = codes[three] // 10 * 10
+    lv2[two] = codes[two] * 10
+    return lv2
+
+
+def classify_codes(values):
+    """
+    L3_CODE/L2_CODE/LV2_CODE/CODE 값을 한 번에 분류합니다.
+    반환: (LV2 코드 배열(무효값 -1), 카테고리명 배열, 불투수 여부 배열)
+    """
+    codes = parse_codes(values)
+    lv2 = to_lv2(codes)
+
+    in_table = (lv2 >= 0) & (lv2 < LV2_TABLE_SIZE)
+    table_idx = np.where(in_table, lv2, 0)
+
+    category = CATEGORY_LOOKUP[table_idx]
+    # 테이블 범위를 벗어난 코드(4자리 이상)는 앞 2자리 + '0' 기준으로 분류
+    if not in_table.all():
+        big = lv2 >= LV2_TABLE_SIZE
+        digits = np.floor(np.log10(lv2[big])).astype(np.int64) + 1
+        category[big] = CATEGORY_LOOKUP[lv2[big] // 10 ** (digits - 2) * 10]
+        category[lv2 < 0] = UNKNOWN
+        # 음수 코드는 숫자로는 읽히므로 '기타' (변환할 수 없는 값만 'Unknown')
+        negative = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float) <= -1
+        category[negative] = OTHER
+
+    is_impervious = IMPERVIOUS_LOOKUP[table_idx] & in_table
+    return lv2, CATEGORY_NAMES[category], is_impervious
@@ -0,0 +1,241 @@
+import os
+import sys
+import glob
+import json
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from land_cover_codes import SIGUNGU_SHP
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(BASE_DIR, '.pipeline_cache.json')
+
+# 단계 정의 (경로는 Land_Cover_Info 기준 상대 경로)
+# - script: 실행할 스크립트 (스크립트 폴더를 작업 폴더로 하여 실행)
+# - args: 스크립트 인자 (단계 파라미터로서 fingerprint에 포함). 입출력 경로는 모두 인자로 넘기며,
+#         '{base}'는 실행 시 BASE_DIR로 바뀝니다 (스크립트의 하드코딩된 기본 경로를 쓰지 않음)
+# - deps: 먼저 끝나야 하는 단계
+# - inputs / outputs: 입력/출력 파일 glob 패턴 (입력에 걸리는 자기 출력은 제외)
+# - default: False이면 대상 단계를 지정하지 않았을 때 실행하지 않음
+STAGES = {
+    'process_zips': {
+        # ZIP을 풀고 삭제하는 단계로, 이후 단계는 이 결과를 읽지 않으므로 명시적으로 지정할 때만 실행
+        'script': 'Origin/process_zips.py',
+        'args': ['--origin-dir', '{base}/Origin'],
+        'deps': [],
+        'inputs': ['Origin/[0-9][0-9][0-9][0-9]/*.zip'],
+        'outputs': ['Origin/[0-9][0-9][0-9][0-9]/*.shp'],
+        'default': False,
+    },
+    'index_metadata': {
+        'script': 'Origin/index_metadata.py',
+        'args': ['--origin-dir', '{base}/Origin', '--catalog', '{base}/Origin/tile_catalog.sqlite'],
+        'deps': [],
+        'inputs': ['Origin/[0-9][0-9][0-9][0-9]*/*.xml'],
+        'outputs': ['Origin/tile_catalog.sqlite'],
+    },
+    'intersect_sigungu': {
+        'script': 'Origin/intersect_sigungu.py',
+        'args': ['--input-dir', '{base}/temp',
+                 '--boundary', os.path.join('{base}', SIGUNGU_SHP),
+                 '--output-dir', '{base}/Seoul_Land_Cover'],
+        'deps': [],
+        'inputs': ['temp/*_add_area.*', os.path.splitext(SIGUNGU_SHP)[0] + '.*'],
+        # 연도별 하위 폴더 (Seoul_Land_Cover/<연도>/<대상>_summary.csv)
+        'outputs': ['Seoul_Land_Cover/[0-9][0-9][0-9][0-9]/*_summary.csv'],
+    },
+    'area_cube': {
+        'script': 'area_cube.py',
+        'args': ['--build', '--folder', '{base}/Seoul_Land_Cover', '--cube-dir', '{base}/area_cube'],
+        'deps': ['intersect_sigungu'],
+        'inputs': ['Seoul_Land_Cover/**/*_summary.csv'],
+        'outputs': ['area_cube/area_cube.npy', 'area_cube/area_cube.json'],
+    },
+    'calc_impervious_consistent': {
+        'script': 'ImperviousData/calc_impervious_consistent.py',
+        'args': ['--folder', '{base}/Seoul_Land_Cover', '--output-dir', '{base}/ImperviousData'],
+        'deps': ['intersect_sigungu'],
+        'inputs': ['Seoul_Land_Cover/**/*_summary.csv'],
+        'outputs': ['ImperviousData/*_impervious_summary.csv'],
+    },
+    'interpolate_impervious': {
+        'script': 'ImperviousData/interpolate_impervious.py',
+        'args': ['--folder', '{base}/ImperviousData'],
+        'deps': ['calc_impervious_consistent'],
+        'inputs': ['ImperviousData/*_impervious_summary.csv'],
+        'outputs': ['ImperviousData/Seoul_ImperviousData_*.csv'],
+    },
+    'mapping_land_cover': {
+        'script': 'Seoul_Land_Cover/mapping_land_cover.py',
+        'args': ['--folder', '{base}/Seoul_Land_Cover'],
+        'deps': ['intersect_sigungu'],
+        'inputs': ['Seoul_Land_Cover/**/*_lv2_summary.csv'],
+        'outputs': ['Seoul_Land_Cover/Seoul_LandCover_Mapping.csv'],
+    },
+    'merge_land_info': {
+        'script': 'Seoul_Land_Cover/merge_land_info.py',
+        'args': ['--land-cover', '{base}/Seoul_Land_Cover/Seoul_LandCover_Mapping.csv',
+                 '--impervious-dir', '{base}/ImperviousData',
+                 '--output', '{base}/Seoul_Land_info.csv'],
+        'deps': ['interpolate_impervious', 'mapping_land_cover'],
+        'inputs': ['Seoul_Land_Cover/Seoul_LandCover_Mapping.csv',
+                   'ImperviousData/Seoul_ImperviousData_*.csv'],
+        'outputs': ['Seoul_Land_info.csv'],
+    },
+    'verify_land_info': {
+        'script': 'Seoul_Land_Cover/verify_land_info.py',
+        'args': ['--input', '{base}/Seoul_Land_info.csv',
+                 '--summary-folder', '{base}/Seoul_Land_Cover',
+                 '--impervious-dir', '{base}/ImperviousData',
+                 '--output', '{base}/Seoul_Land_info_violations.csv'],
+        'deps': ['merge_land_info'],
+        'inputs': ['Seoul_Land_info.csv', 'Seoul_Land_Cover/**/*_summary.csv',
+                   'ImperviousData/*_impervious_summary.csv'],
+        'outputs': [],
+    },
+}
+
+
+def load_cache():
+    if not os.path.exists(CACHE_PATH):
+        return {'stages': {}, 'hashes': {}}
+    with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_cache(cache):
+    tmp_path = CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def file_hash(path, hashes):
+    """파일 내용의 sha256. 크기와 수정 시각이 그대로면 이전에 계산한 값을 재사용합니다."""
+    stat = os.stat(path)
+    rel_path = os.path.relpath(path, BASE_DIR)
+    cached = hashes.get(rel_path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    digest = h.hexdigest()
+    hashes[rel_path] = [stat.st_size, stat.st_mtime_ns, digest]
+    return digest
+
+def expand(patterns, exclude=()):
+    paths = set()
+    for pattern in patterns:
+        paths.update(p for p in glob.glob(os.path.join(BASE_DIR, pattern), recursive=True) if os.path.isfile(p))
+    if exclude:
+        paths -= set(expand(exclude))
+    return sorted(paths)
+
+def stage_fingerprint(name, hashes):
+    """스크립트 내용 + 인자 + 입력 파일 내용으로 단계의 fingerprint를 만듭니다."""
+    stage = STAGES[name]
+    h = hashlib.sha256()
+    h.update(file_hash(os.path.join(BASE_DIR, stage['script']), hashes).encode())
+    # '{base}'를 풀기 전의 인자를 사용 (저장소 위치가 바뀌어도 캐시 유지)
+    h.update(json.dumps(stage['args']).encode())
+    # 입력 폴더에 출력을 쓰는 단계가 자기 출력 때문에 매번 다시 실행되지 않도록 제외
+    for path in expand(stage['inputs'], exclude=stage['outputs']):
+        h.update(os.path.relpath(path, BASE_DIR).encode())
+        h.update(file_hash(path, hashes).encode())
+    return h.hexdigest()
+
+def is_current(name, fingerprint, cache):
+    stage = STAGES[name]
+    if cache['stages'].get(name) != fingerprint:
+        return False
+    # 출력이 지워졌으면 다시 실행
+    return all(expand([pattern]) for pattern in stage['outputs'])
+
+
+def stage_args(name):
+    """'{base}'를 BASE_DIR로 바꾼 단계 인자"""
+    return [arg.replace('{base}', BASE_DIR) for arg in STAGES[name]['args']]
+
+def run_stage(name):
+    stage = STAGES[name]
+    script_path = os.path.join(BASE_DIR, stage['script'])
+    args = stage_args(name)
+    print(f"[{name}] 실행: {stage['script']} {' '.join(args)}")
+    completed = subprocess.run([sys.executable, script_path] + args,
+                               cwd=os.path.dirname(script_path))
+    return completed.returncode == 0
+
+
+def run_pipeline(targets=None, force=False, max_workers=2):
+    """
+    의존 관계 순서대로 단계를 실행합니다.
+    입력이 바뀌지 않은 단계는 건너뛰고, 서로 독립인 단계(불투수/토지피복 매핑)는 동시에 실행합니다.
+    """
+    # 대상 단계와 그 선행 단계만 실행 (대상이 없으면 default가 False인 단계를 뺀 전체)
+    selected = set()
+    stack = list(targets or [name for name, stage in STAGES.items() if stage.get('default', True)])
+    while stack:
+        name = stack.pop()
+        if name not in selected:
+            selected.add(name)
+            stack.extend(STAGES[name]['deps'])
+
+    cache = load_cache()
+    done, failed = set(), set()
+    pending = {name for name in STAGES if name in selected}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for name in sorted(pending):
+                deps = STAGES[name]['deps']
+                if any(d in failed for d in deps):
+                    print(f"[{name}] 선행 단계 실패로 건너뜁니다.")
+                    pending.discard(name)
+                    failed.add(name)
+                elif all(d in done or d not in selected for d in deps):
+                    pending.discard(name)
+                    fingerprint = stage_fingerprint(name, cache['hashes'])
+                    if not force and is_current(name, fingerprint, cache):
+                        print(f"[{name}] 최신 상태입니다. 건너뜁니다.")
+                        done.add(name)
+                        continue
+                    running[executor.submit(run_stage, name)] = name
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                if future.result():
+                    # 실행 후의 입력 상태로 기록 (process_zips처럼 입력 ZIP을 지우는 단계도 다음 실행에서 최신으로 판정)
+                    cache['stages'][name] = stage_fingerprint(name, cache['hashes'])
+                    save_cache(cache)
+                    done.add(name)
+                else:
+                    print(f"[{name}] 실패")
+                    failed.add(name)
+
+    save_cache(cache)
+    print(f"완료: {len(done)}개 단계, 실패: {len(failed)}개 단계")
+    return not failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='토지피복 전처리 파이프라인 실행')
+    parser.add_argument('targets', nargs='*', help=f"실행할 단계 (기본: default가 False인 단계를 뺀 전체) {list(STAGES)}")
+    parser.add_argument('--force', action='store_true', help='캐시를 무시하고 모두 다시 실행')
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args()
+
+    unknown = [t for t in args.targets if t not in STAGES]
+    if unknown:
+        parser.error(f"알 수 없는 단계: {unknown}")
+
+    ok = run_pipeline(args.targets or None, force=args.force, max_workers=args.workers)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+scipy_interpolate = pytest.importorskip('scipy.interpolate')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from interpolation import interpolate_cube, interpolate_frame
+
+YEARS = np.arange(2000, 2025)
+
+
+def make_cube(n_keys=7, n_metrics=3, min_surveys=2, seed=0):
+    """시군구 × 연도 × 항목 배열, 계열마다 조사 연도가 다름 (첫/마지막 연도가 비어 있는 계열 포함)"""
+    rng = np.random.default_rng(seed)
+    cube = np.full((n_keys, len(YEARS), n_metrics), np.nan)
+    for k in range(n_keys):
+        for m in range(n_metrics):
+            surveyed = np.sort(rng.choice(len(YEARS), rng.integers(min_surveys, 9), replace=False))
+            cube[k, surveyed, m] = rng.uniform(1e5, 1e7, len(surveyed))
+    return cube
+
+
+def series(cube):
+    return cube.transpose(0, 2, 1).reshape(-1, cube.shape[1])
+
+
+@pytest.mark.parametrize('extrapolate,kwargs', [
+    ('forward', {}),
+    ('none', {'limit_area': 'inside'}),
+    ('hold', {'limit_direction': 'both'}),
+])
+def test_linear_matches_pandas_interpolate(extrapolate, kwargs):
+    cube = make_cube(min_surveys=0)
+    expected = pd.DataFrame(series(cube).T).interpolate(method='linear', **kwargs).to_numpy().T
+    np.testing.assert_allclose(series(interpolate_cube(cube, YEARS, 'linear', extrapolate)), expected, equal_nan=True)
+
+
+def test_pchip_matches_scipy():
+    cube = make_cube()
+    result = series(interpolate_cube(cube, YEARS, 'pchip', 'none'))
+    for values, got in zip(series(cube), result):
+        known = ~np.isnan(values)
+        inside = (YEARS >= YEARS[known][0]) & (YEARS <= YEARS[known][-1])
+        expected = scipy_interpolate.PchipInterpolator(YEARS[known], values[known])(YEARS[inside])
+        np.testing.assert_allclose(got[inside], expected, rtol=1e-10)
+        assert np.isnan(got[~inside]).all()
+
+
+def test_nearest_matches_scipy():
+    cube = make_cube()
+    result = series(interpolate_cube(cube, YEARS, 'nearest', 'none'))
+    for values, got in zip(series(cube), result):
+        known = ~np.isnan(values)
+        inside = (YEARS >= YEARS[known][0]) & (YEARS <= YEARS[known][-1])
+        # 같은 거리면 앞쪽 조사 연도 (scipy 'nearest'와 같은 규칙)
+        expected = scipy_interpolate.interp1d(YEARS[known], values[known], kind='nearest')(YEARS[inside])
+        np.testing.assert_allclose(got[inside], expected)
+
+
+def test_linear_extrapolation_matches_scipy():
+    cube = make_cube()
+    result = series(interpolate_cube(cube, YEARS, 'linear', 'linear'))
+    for values, got in zip(series(cube), result):
+        known = ~np.isnan(values)
+        expected = scipy_interpolate.interp1d(YEARS[known], values[known], fill_value='extrapolate')(YEARS)
+        np.testing.assert_allclose(got, expected, rtol=1e-10)
+
+
+def test_frame_matches_groupby_apply():
+    """기준: 예전 interpolate_impervious.py의 groupby().apply(interpolate_group)"""
+    cube = make_cube(n_metrics=2)
+    keys = np.array([f'구{k}' for k in range(cube.shape[0])])
+    long = pd.DataFrame({
+        'SIGUNGU_NM': np.repeat(keys, len(YEARS)),
+        'YEAR': np.tile(YEARS, len(keys)),
+        'IMPERVIOUS_AREA_M2': cube[:, :, 0].ravel(),
+        'TOTAL_AREA_M2': cube[:, :, 1].ravel(),
+    })
+    cols = ['IMPERVIOUS_AREA_M2', 'TOTAL_AREA_M2']
+    surveyed = long.dropna(subset=cols, how='all')
+
+    expected = long.sort_values(['SIGUNGU_NM', 'YEAR']).reset_index(drop=True)
+    expected[cols] = expected.groupby('SIGUNGU_NM')[cols].transform(lambda s: s.interpolate(method='linear'))
+
+    result = interpolate_frame(surveyed, 'SIGUNGU_NM', 'YEAR', cols, YEARS)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
@@ -0,0 +1,111 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+gpd = pytest.importorskip('geopandas')
+from shapely.geometry import box
+
+LAND_COVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LAND_COVER_DIR)
+sys.path.insert(0, os.path.join(LAND_COVER_DIR, 'Origin'))
+from intersect_sigungu import intersect_with_sigungu, summarize_intersection, process_target, process_year_tiles
+
+CRS = 'EPSG:5179'
+CODES = [110, 120, 210, 310, 620]
+
+
+def make_sigungu():
+    """맞닿은 세 시군구 (양쪽에 모두 있는 BASE_YEAR 컬럼 포함)"""
+    return gpd.GeoDataFrame({
+        'SIGUNGU_CD': ['11010', '11020', '11030'],
+        'SIGUNGU_NM': ['종로구', '중구', '용산구'],
+        'BASE_YEAR': [2025, 2025, 2025],
+    }, geometry=[box(0, 0, 100, 100), box(100, 0, 200, 100), box(0, 100, 200, 200)], crs=CRS)
+
+
+def make_land(n=400, seed=0):
+    """시군구 안, 경계에 걸친, 경계에 맞닿은, 바깥의 폴리곤이 섞인 토지피복"""
+    rng = np.random.default_rng(seed)
+    x, y = rng.integers(-20, 220, n), rng.integers(-20, 220, n)
+    w, h = rng.integers(1, 40, n), rng.integers(1, 40, n)
+    return gpd.GeoDataFrame({
+        'ID': np.arange(n),
+        'L2_CODE': rng.choice(CODES, n),
+        'BASE_YEAR': 2019,
+    }, geometry=[box(*b) for b in zip(x, y, x + w, y + h)], crs=CRS)
+
+
+def sort_rows(gdf):
+    gdf = gdf.assign(_area=gdf.geometry.area)
+    return gdf.sort_values(['ID', 'SIGUNGU_NM', '_area']).reset_index(drop=True)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_matches_overlay(seed):
+    land, sigungu = make_land(seed=seed), make_sigungu()
+    result = sort_rows(intersect_with_sigungu(land, sigungu))
+    expected = sort_rows(gpd.overlay(land, sigungu, how='intersection'))
+
+    assert sorted(result.columns) == sorted(expected.columns)
+    assert len(result) == len(expected) > 0
+    attrs = [c for c in expected.columns if c not in (expected.geometry.name, '_area')]
+    pd.testing.assert_frame_equal(result[attrs], expected[attrs], check_dtype=False)
+    np.testing.assert_allclose(result['_area'], expected['_area'])
+    assert result.geometry.symmetric_difference(expected.geometry, align=False).area.max() < 1e-6
+
+
+def test_summary_matches_overlay():
+    land, sigungu = make_land(), make_sigungu()
+    summaries = []
+    for gdf in (intersect_with_sigungu(land, sigungu), gpd.overlay(land, sigungu, how='intersection')):
+        gdf['AREA_M2'] = gdf.geometry.area
+        summaries.append(summarize_intersection(gdf)[0])
+    pd.testing.assert_frame_equal(*summaries)
+
+
+def test_all_inside_skips_overlay(monkeypatch):
+    land = make_land()
+    land = land[land.geometry.within(make_sigungu().geometry.iloc[0])]
+
+    def fail(*args, **kwargs):
+        raise AssertionError('overlay called for polygons inside one district')
+    monkeypatch.setattr(gpd, 'overlay', fail)
+
+    result = intersect_with_sigungu(land, make_sigungu())
+    assert len(result) == len(land)
+    assert (result['SIGUNGU_NM'] == '종로구').all()
+    assert {'BASE_YEAR_1', 'BASE_YEAR_2'} <= set(result.columns)
+
+
+def test_tile_map_reduce_matches_process_target(tmp_path):
+    """도엽 4장으로 나눈 타일 집계 == 같은 타일을 병합한 연도 shp의 process_target 요약"""
+    sigungu_path = str(tmp_path / 'sigungu.shp')
+    make_sigungu().to_file(sigungu_path, encoding='utf-8')
+
+    land = make_land()
+    year_dir = tmp_path / 'tiles' / '2019'
+    year_dir.mkdir(parents=True)
+    tiles = []
+    for i, (x, y) in enumerate([(-20, -20), (100, -20), (-20, 100), (100, 100)]):
+        tile = gpd.clip(land, box(x, y, x + 120, y + 120))
+        tile = tile[tile.geom_type.isin(['Polygon', 'MultiPolygon']) & (tile.area > 0)]
+        tile.to_file(str(year_dir / f'9차피복_3760803{i}.shp'), encoding='utf-8')
+        tiles.append(tile)
+
+    merged = pd.concat(tiles, ignore_index=True)
+    merged['AREA_M2'] = merged.geometry.area
+    (tmp_path / 'temp').mkdir()
+    merged_path = str(tmp_path / 'temp' / '2019_add_area.shp')
+    merged.to_file(merged_path, encoding='utf-8')
+
+    process_target(merged_path, sigungu_path, str(tmp_path / 'full'))
+    process_year_tiles(str(year_dir), sigungu_path, str(tmp_path / 'tiled'), max_workers=2)
+
+    full, tiled = (pd.read_csv(tmp_path / out / '2019' / '2019_summary.csv') for out in ('full', 'tiled'))
+    keys = ['SIGUNGU_NM', 'L2_CODE']
+    assert len(full) > 0
+    pd.testing.assert_frame_equal(tiled.sort_values(keys).reset_index(drop=True),
+                                  full.sort_values(keys).reset_index(drop=True), check_dtype=False)
@@ -0,0 +1,67 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from land_cover_codes import classify_codes
+
+CODE_MAP = {'110': '주거지역', '120': '공업지역', '130': '상업지역',
+            '140': '문화체육휴양지역', '150': '교통지역', '160': '공공시설지역'}
+MAJOR_MAP = {'2': '농업지역', '3': '산림지역', '4': '초지', '5': '습지', '6': '나지', '7': '수역'}
+IMPERVIOUS_LV2 = {110, 120, 130, 140, 150, 160, 230}
+
+
+def categorize(code):
+    """기준: 예전 mapping_land_cover.py의 행 단위 분류"""
+    code_str = str(code)
+    try:
+        code_str = str(int(float(code_str)))
+    except (TypeError, ValueError, OverflowError):
+        return 'Unknown'
+    if len(code_str) == 2 and code_str.startswith('1'):
+        code_str = code_str + '0'
+    first_digit = code_str[0]
+    if first_digit == '1':
+        norm_code = code_str[:2] + '0'
+        return CODE_MAP.get(norm_code, '기타시가화') if len(code_str) >= 2 else '기타시가화'
+    return MAJOR_MAP.get(first_digit, '기타')
+
+
+def get_lv2_standard(code):
+    """기준: 예전 calc_impervious_consistent.py의 행 단위 LV2 변환"""
+    try:
+        code_str = str(int(code))
+        if len(code_str) == 3:
+            return int(code_str[:2] + '0')
+        return int(code)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+CODES = list(range(0, 20000)) + [110.0, 111.9, 229.5, -5, -110, float('nan'), None,
+                                 '110', '111.9', ' 120', '1e3', 'abc', '']
+
+
+def test_categories_match_row_wise_categorize():
+    _, categories, _ = classify_codes(CODES)
+    assert list(categories) == [categorize(c) for c in CODES]
+
+
+@pytest.mark.parametrize('codes', [
+    list(range(0, 10)) + list(range(100, 20000)),
+    [110.0, 111.9, 229.5, 239.0, -110, float('nan'), None],
+])
+def test_impervious_matches_row_wise_lv2(codes):
+    # 2자리 코드(11 -> 110)는 classify_codes에서 의도적으로 보정하므로 비교에서 제외
+    _, _, is_impervious = classify_codes(codes)
+    expected = [get_lv2_standard(c) in IMPERVIOUS_LV2 for c in codes]
+    np.testing.assert_array_equal(is_impervious, expected)
+
+
+def test_two_digit_codes_are_scaled():
+    lv2, categories, is_impervious = classify_codes([11, 23, 71])
+    assert list(lv2) == [110, 230, 710]
+    assert list(categories) == ['주거지역', '농업지역', '수역']
+    assert list(is_impervious) == [True, True, False]
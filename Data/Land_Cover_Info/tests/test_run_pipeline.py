@@ -0,0 +1,139 @@
+import os
+import re
+import sys
+import glob
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import run_pipeline
+
+# 입력을 소비하는 단계, 입력 폴더에 출력을 쓰는 단계, 그 결과를 읽는 단계
+UNZIP = '''import glob, os
+for path in glob.glob('*.zip'):
+    with open(path) as src, open(path[:-4] + '.shp', 'w') as dst:
+        dst.write(src.read())
+    os.remove(path)
+'''
+SUMMARIZE = '''import glob
+for path in glob.glob('*_summary.csv'):
+    if 'impervious' in path:
+        continue
+    with open(path) as src, open(path.replace('_summary', '_impervious_summary'), 'w') as dst:
+        dst.write(src.read().upper())
+'''
+MERGE = '''import glob
+with open('merged.csv', 'w') as dst:
+    for path in sorted(glob.glob('../data/*_impervious_summary.csv')):
+        dst.write(open(path).read())
+'''
+
+FAKE_STAGES = {
+    'unzip': {
+        'script': 'src/unzip.py', 'args': [], 'deps': [],
+        'inputs': ['src/*.zip'], 'outputs': ['src/*.shp'],
+    },
+    'summarize': {
+        'script': 'data/summarize.py', 'args': [], 'deps': [],
+        'inputs': ['data/*_summary.csv'], 'outputs': ['data/*_impervious_summary.csv'],
+    },
+    'merge': {
+        'script': 'out/merge.py', 'args': [], 'deps': ['summarize'],
+        'inputs': ['data/*_impervious_summary.csv'], 'outputs': ['out/merged.csv'],
+    },
+}
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    base = str(tmp_path)
+    write(os.path.join(base, 'src/unzip.py'), UNZIP)
+    write(os.path.join(base, 'src/2019.zip'), 'tile')
+    write(os.path.join(base, 'data/summarize.py'), SUMMARIZE)
+    write(os.path.join(base, 'data/2019_summary.csv'), 'a,b\n')
+    write(os.path.join(base, 'data/2020_summary.csv'), 'c,d\n')
+    write(os.path.join(base, 'out/merge.py'), MERGE)
+
+    monkeypatch.setattr(run_pipeline, 'BASE_DIR', base)
+    monkeypatch.setattr(run_pipeline, 'CACHE_PATH', os.path.join(base, '.pipeline_cache.json'))
+    monkeypatch.setattr(run_pipeline, 'STAGES', FAKE_STAGES)
+
+    executed = []
+    run_stage = run_pipeline.run_stage
+    monkeypatch.setattr(run_pipeline, 'run_stage', lambda name: executed.append(name) or run_stage(name))
+    return base, executed
+
+
+def test_second_run_is_noop(pipeline):
+    base, executed = pipeline
+    assert run_pipeline.run_pipeline(max_workers=1)
+    assert sorted(executed) == ['merge', 'summarize', 'unzip']
+    assert not os.path.exists(os.path.join(base, 'src/2019.zip'))
+
+    executed.clear()
+    assert run_pipeline.run_pipeline(max_workers=1)
+    assert executed == []
+
+
+def test_changed_input_reruns_dependents_only(pipeline):
+    base, executed = pipeline
+    run_pipeline.run_pipeline(max_workers=1)
+
+    executed.clear()
+    write(os.path.join(base, 'data/2020_summary.csv'), 'e,f\n')
+    run_pipeline.run_pipeline(max_workers=1)
+    assert sorted(executed) == ['merge', 'summarize']
+
+
+def sample_path(pattern):
+    """glob 패턴에 걸리는 예시 경로"""
+    return re.sub(r'\*', 'sample', re.sub(r'\[0-9\]', '2', pattern.replace('**/', '')))
+
+
+@pytest.mark.parametrize('name', list(run_pipeline.STAGES))
+def test_stage_inputs_exclude_own_outputs(name, tmp_path):
+    stage = run_pipeline.STAGES[name]
+    for pattern in stage['outputs']:
+        write(os.path.join(str(tmp_path), sample_path(pattern)), '')
+
+    matched = set()
+    for pattern in stage['inputs']:
+        matched.update(glob.glob(os.path.join(str(tmp_path), pattern), recursive=True))
+    assert not matched
+
+
+def test_default_targets_skip_opt_in_stages(pipeline, monkeypatch):
+    base, executed = pipeline
+    stages = {name: dict(stage) for name, stage in FAKE_STAGES.items()}
+    stages['unzip']['default'] = False
+    monkeypatch.setattr(run_pipeline, 'STAGES', stages)
+
+    run_pipeline.run_pipeline(max_workers=1)
+    assert sorted(executed) == ['merge', 'summarize']
+    assert os.path.exists(os.path.join(base, 'src/2019.zip'))
+
+    run_pipeline.run_pipeline(['unzip'], max_workers=1)
+    assert not os.path.exists(os.path.join(base, 'src/2019.zip'))
+
+
+@pytest.mark.parametrize('name', list(run_pipeline.STAGES))
+def test_stage_args_are_explicit_base_paths(name):
+    stage = run_pipeline.STAGES[name]
+    with open(os.path.join(run_pipeline.BASE_DIR, stage['script']), encoding='utf-8') as f:
+        source = f.read()
+
+    for arg in stage['args']:
+        if arg.startswith('--'):
+            # 스크립트가 실제로 받는 인자
+            assert f"'{arg}'" in source
+        else:
+            # 경로 인자는 모두 BASE_DIR 기준
+            assert arg.startswith('{base}/'), arg
+    for arg in run_pipeline.stage_args(name):
+        assert '{base}' not in arg and '/Users/' not in arg
@@ -0,0 +1,130 @@
+import os
+import sys
+import glob
+
+import numpy as np
+import pandas as pd
+import pytest
+
+LAND_COVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, LAND_COVER_DIR)
+sys.path.insert(0, os.path.join(LAND_COVER_DIR, 'ImperviousData'))
+sys.path.insert(0, os.path.join(LAND_COVER_DIR, 'Seoul_Land_Cover'))
+from interpolation import METHODS, EXTRAPOLATIONS
+from interpolate_impervious import interpolate_impervious_data, find_output
+from mapping_land_cover import process_mixed_land_cover, OUTPUT_NAME as MAPPING_NAME
+
+SURVEY_YEARS = [2000, 2004, 2007, 2009, 2013, 2018, 2019, 2021]
+DISTRICTS = ['강남구', '종로구', '중구']
+CODES = [110, 120, 130, 150, 210, 310, 410, 620, 710]
+
+
+def write_impervious(folder, years, seed=0):
+    rng = np.random.default_rng(seed)
+    for year in years:
+        total = rng.uniform(2e7, 4e7, len(DISTRICTS))
+        impervious = total * rng.uniform(0.3, 0.8, len(DISTRICTS))
+        pd.DataFrame({
+            'SIGUNGU_NM': DISTRICTS, 'PERVIOUS_AREA_M2': total - impervious,
+            'IMPERVIOUS_AREA_M2': impervious, 'TOTAL_AREA_M2': total,
+            'IMPERVIOUS_RATIO': impervious / total * 100,
+        }).to_csv(os.path.join(folder, f'{year}_impervious_summary.csv'), index=False, encoding='utf-8-sig')
+
+
+def write_lv2(folder, years, seed=0):
+    rng = np.random.default_rng(seed)
+    for year in years:
+        os.makedirs(os.path.join(folder, str(year)), exist_ok=True)
+        rows = [(d, c, rng.uniform(1e5, 5e6)) for d in DISTRICTS for c in CODES]
+        pd.DataFrame(rows, columns=['SIGUNGU_NM', 'L2_CODE', 'AREA_M2']).to_csv(
+            os.path.join(folder, str(year), f'{year}_lv2_summary.csv'), index=False, encoding='utf-8-sig')
+
+
+def full_and_updated(tmp_path, write, run, read, update_year, **kwargs):
+    """전체 조사 연도로 한 번에 만든 결과와, update_year를 뺀 결과에 --update로 추가한 결과"""
+    full_dir, inc_dir = str(tmp_path / 'full'), str(tmp_path / 'inc')
+    os.makedirs(full_dir)
+    os.makedirs(inc_dir)
+    write(full_dir, SURVEY_YEARS)
+    run(full_dir, **kwargs)
+
+    write(inc_dir, SURVEY_YEARS)
+    new_files = glob.glob(os.path.join(inc_dir, '**', f'{update_year}_*summary.csv'), recursive=True)
+    for f in new_files:
+        os.rename(f, f + '.new')
+    run(inc_dir, **kwargs)
+    for f in new_files:
+        os.rename(f + '.new', f)
+    run(inc_dir, update_year=update_year, **kwargs)
+    return read(full_dir), read(inc_dir)
+
+
+def run_impervious(folder, **kwargs):
+    interpolate_impervious_data(folder, **kwargs)
+
+def read_impervious(folder):
+    return pd.read_csv(find_output(folder))
+
+def run_mapping(folder, **kwargs):
+    process_mixed_land_cover(folder, **kwargs)
+
+def read_mapping(folder):
+    return pd.read_csv(os.path.join(folder, MAPPING_NAME))
+
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('update_year', [2009, 2019, 2021])
+@pytest.mark.parametrize('target', ['impervious', 'mapping'])
+def test_update_matches_full_rebuild(tmp_path, target, update_year, method):
+    write, run, read = {
+        'impervious': (write_impervious, run_impervious, read_impervious),
+        'mapping': (write_lv2, run_mapping, read_mapping),
+    }[target]
+    full, updated = full_and_updated(tmp_path, write, run, read, update_year, method=method)
+    pd.testing.assert_frame_equal(updated, full)
+
+
+@pytest.mark.parametrize('extrapolate', EXTRAPOLATIONS)
+def test_update_matches_full_rebuild_extrapolation(tmp_path, extrapolate):
+    full, updated = full_and_updated(tmp_path, write_impervious, run_impervious, read_impervious, 2009,
+                                     method='pchip', extrapolate=extrapolate)
+    pd.testing.assert_frame_equal(updated, full)
+
+
+def write_lv2_new_category(folder, years, seed=0):
+    """마지막 조사 연도에만 나지(610) 면적이 있는 요약 파일"""
+    write_lv2(folder, years, seed)
+    last = os.path.join(folder, str(SURVEY_YEARS[-1]), f'{SURVEY_YEARS[-1]}_lv2_summary.csv')
+    if os.path.exists(last):
+        df = pd.read_csv(last)
+        extra = pd.DataFrame({'SIGUNGU_NM': DISTRICTS, 'L2_CODE': 610, 'AREA_M2': 1e5})
+        pd.concat([df, extra]).to_csv(last, index=False, encoding='utf-8-sig')
+
+
+@pytest.mark.parametrize('target', ['impervious', 'mapping', 'mapping_new_category'])
+def test_sequential_updates_match_full_rebuild(tmp_path, target):
+    """첫 두 조사 연도로 만든 뒤 나머지 연도를 하나씩 --update로 추가한 결과 == 전체 재계산"""
+    write, run, read = {
+        'impervious': (write_impervious, run_impervious, read_impervious),
+        'mapping': (write_lv2, run_mapping, read_mapping),
+        'mapping_new_category': (write_lv2_new_category, run_mapping, read_mapping),
+    }[target]
+    full_dir, inc_dir = str(tmp_path / 'full'), str(tmp_path / 'inc')
+    os.makedirs(full_dir)
+    os.makedirs(inc_dir)
+    write(full_dir, SURVEY_YEARS)
+    run(full_dir)
+
+    write(inc_dir, SURVEY_YEARS)
+    later = {year: glob.glob(os.path.join(inc_dir, '**', f'{year}_*summary.csv'), recursive=True)
+             for year in SURVEY_YEARS[2:]}
+    for files in later.values():
+        for f in files:
+            os.rename(f, f + '.new')
+    run(inc_dir)
+    for year, files in later.items():
+        for f in files:
+            os.rename(f + '.new', f)
+        run(inc_dir, update_year=year)
+
+    pd.testing.assert_frame_equal(read(inc_dir), read(full_dir))
@@ -0,0 +1,144 @@
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from land_cover_codes import classify_codes, CATEGORY_NAMES, LV2_TABLE_SIZE
+
+# 래스터 격자 생성 (ImperviousData/raster_impervious.py)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ImperviousData'))
+from raster_impervious import RASTER_DIR, NODATA, CHUNK_ROWS, load_grid, rasterize_land_cover
+
+LEVELS = ('category', 'lv2')
+
+def class_table(level):
+    """
+    uint16 코드 -> 분류 번호 룩업과 분류 이름 (classify_codes와 같은 분류).
+    'category': Seoul_LandCover_Mapping과 같은 분류 (시가화 중분류 + 대분류), 'lv2': 중분류 코드
+    (중분류 표 밖의 코드는 'Unknown'). 번호 0은 자료 없음(NODATA)
+    """
+    lv2, categories, _ = classify_codes(np.arange(np.iinfo(np.uint16).max + 1))
+    table = np.zeros(len(lv2), dtype=np.int32)
+    if level == 'category':
+        category_ids = {name: i for i, name in enumerate(CATEGORY_NAMES)}
+        table[1:] = pd.Series(categories[1:]).map(category_ids).to_numpy() + 1
+        names = CATEGORY_NAMES.astype(str)
+    elif level == 'lv2':
+        in_table = lv2 < LV2_TABLE_SIZE
+        codes, idx = np.unique(lv2[1:][in_table[1:]], return_inverse=True)
+        table[1:][in_table[1:]] = idx + 1
+        table[1:][~in_table[1:]] = len(codes) + 1
+        names = np.r_[codes.astype(str), ['Unknown']]
+    else:
+        raise ValueError(f"Unknown level: {level}")
+    table[NODATA] = 0
+    return table, np.r_[['NODATA'], names]
+
+def _count_chunk(args):
+    """[작업 프로세스] 행 범위 하나의 (구역, 이전 분류, 이후 분류) 조합별 셀 수"""
+    from_path, to_path, zone_path, row, rows, level = args
+    table, names = class_table(level)
+    n_classes = len(names)
+
+    before, _ = load_grid(from_path)
+    after, _ = load_grid(to_path)
+    zones, meta = load_grid(zone_path)
+    n_zones = len(meta['zones']) + 1
+
+    a = table[np.asarray(before[row:row + rows])].ravel()
+    b = table[np.asarray(after[row:row + rows])].ravel()
+    z = np.asarray(zones[row:row + rows]).ravel().astype(np.int64)
+
+    key = (z * n_classes + a) * n_classes + b
+    return np.bincount(key, minlength=n_zones * n_classes * n_classes)
+
+def transition_cube(from_year, to_year, level='category', max_workers=None, raster_dir=RASTER_DIR):
+    """
+    두 조사 연도 토지피복 격자를 겹쳐 (시군구 × 이전 분류 × 이후 분류) 면적(m²) 배열을 만듭니다.
+    행 청크를 프로세스 풀에서 나누어 bincount 하고 합산합니다.
+    """
+    from_path = os.path.join(raster_dir, f"{from_year}_landcover.npy")
+    to_path = os.path.join(raster_dir, f"{to_year}_landcover.npy")
+    zone_path = os.path.join(raster_dir, f"{to_year}_landcover_zones.npy")
+
+    before, before_meta = load_grid(from_path)
+    after, after_meta = load_grid(to_path)
+    zones, zone_meta = load_grid(zone_path)
+    if before.shape != after.shape or list(before_meta['transform']) != list(after_meta['transform']):
+        raise ValueError(f"{from_year}와 {to_year}의 격자가 다릅니다. 같은 해상도로 다시 래스터화하세요.")
+
+    _, names = class_table(level)
+    n_classes, n_zones = len(names), len(zone_meta['zones']) + 1
+    cell_area = abs(before_meta['transform'].a * before_meta['transform'].e)
+
+    tasks = [(from_path, to_path, zone_path, row, CHUNK_ROWS, level) for row in range(0, before.shape[0], CHUNK_ROWS)]
+    counts = np.zeros(n_zones * n_classes * n_classes, dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for partial in executor.map(_count_chunk, tasks):
+            counts += partial
+
+    cube = counts.reshape(n_zones, n_classes, n_classes)[1:] * cell_area
+    return cube, np.array(zone_meta['zones']), names
+
+def cache_path(from_year, to_year, level, raster_dir=RASTER_DIR):
+    return os.path.join(raster_dir, f"transition_{from_year}_{to_year}_{level}.npz")
+
+def load_transition(from_year, to_year, level='category', rebuild=False, max_workers=None, raster_dir=RASTER_DIR):
+    """캐시된 전이 배열을 읽고, 없거나 격자가 더 새로우면 다시 계산해 저장합니다."""
+    path = cache_path(from_year, to_year, level, raster_dir)
+    sources = [os.path.join(raster_dir, f"{y}_landcover.npy") for y in (from_year, to_year)]
+    fresh = os.path.exists(path) and all(os.path.getmtime(path) >= os.path.getmtime(s) for s in sources)
+
+    if fresh and not rebuild:
+        with np.load(path, allow_pickle=False) as cached:
+            return cached['cube'], cached['districts'], cached['classes']
+
+    cube, districts, classes = transition_cube(from_year, to_year, level, max_workers, raster_dir)
+    np.savez_compressed(path, cube=cube, districts=districts, classes=classes)
+    print(f"  전이 행렬 캐시 저장: {path}")
+    return cube, districts, classes
+
+def transition_table(cube, districts, classes, include_unchanged=False):
+    """전이 배열을 (SIGUNGU_NM, FROM, TO, AREA_M2) 긴 표로 변환합니다. 자료 없음(NODATA)은 제외."""
+    d, f, t = np.nonzero(cube)
+    keep = (f > 0) & (t > 0) & (include_unchanged | (f != t))
+    d, f, t = d[keep], f[keep], t[keep]
+    return pd.DataFrame({
+        'SIGUNGU_NM': districts[d],
+        'FROM': classes[f],
+        'TO': classes[t],
+        'AREA_M2': cube[d, f, t],
+    }).sort_values(['SIGUNGU_NM', 'AREA_M2'], ascending=[True, False]).reset_index(drop=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='두 조사 연도 사이 토지피복 전이 행렬')
+    parser.add_argument('from_year', type=int)
+    parser.add_argument('to_year', type=int)
+    parser.add_argument('--from-source', default=None, help='from_year 격자가 없을 때 래스터화할 토지피복 파일')
+    parser.add_argument('--to-source', default=None, help='to_year 격자가 없을 때 래스터화할 토지피복 파일')
+    parser.add_argument('--resolution', type=float, default=5.0)
+    parser.add_argument('--level', choices=LEVELS, default='category')
+    parser.add_argument('--sigungu', default=None, help='특정 시군구만 출력')
+    parser.add_argument('--rebuild', action='store_true')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', default=None, help='긴 형태 CSV 저장 경로')
+    args = parser.parse_args()
+
+    os.makedirs(RASTER_DIR, exist_ok=True)
+    for year, source in ((args.from_year, args.from_source), (args.to_year, args.to_source)):
+        grid_path = os.path.join(RASTER_DIR, f"{year}_landcover.npy")
+        if source and (args.rebuild or not os.path.exists(grid_path)):
+            rasterize_land_cover(source, grid_path, args.resolution)
+
+    cube, districts, classes = load_transition(args.from_year, args.to_year, args.level, args.rebuild, args.workers)
+    table = transition_table(cube, districts, classes)
+    if args.sigungu:
+        table = table[table['SIGUNGU_NM'] == args.sigungu]
+
+    if args.output:
+        table.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"Saved to {args.output}")
+    else:
+        print(table.head(30).to_string())
@@ -0,0 +1,269 @@
+import os
+import sys
+import sqlite3
+import argparse
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+RAIN_DIR = os.path.join(DATA_DIR, 'Amount_Of_Rain')
+
+sys.path.append(RAIN_DIR)
+sys.path.append(os.path.join(DATA_DIR, 'Inundation_Analysis'))
+from combine_csv import REGION_MAP
+from build_features import station_districts
+
+DB_FILE = os.path.join(DATA_DIR, 'seoul_flood.sqlite')
+
+# Later files win on duplicate (station, date): the raw AWS archive, then the summarized and appended observations
+DAILY_RAIN_FILES = [os.path.join(RAIN_DIR, 'combined_data.csv'), os.path.join(RAIN_DIR, 'rain_data.csv'),
+                    os.path.join(RAIN_DIR, 'daily_rain_obs.csv')]
+STATION_FILE = os.path.join(RAIN_DIR, 'aws_stations.csv')
+RAIN_EVENT_FILE = os.path.join(RAIN_DIR, 'cumulative_rain_data.csv')
+LAND_INFO_FILE = os.path.join(DATA_DIR, 'Land_Cover_Info', 'Seoul_Land_info.csv')
+INUNDATION_FILE = os.path.join(DATA_DIR, 'Inundation_Analysis', 'Merged_Inundation_Data.csv')
+
+CHUNK_SIZE = 200_000
+
+LAND_COLS = ['주거지역', '공업지역', '상업지역', '문화체육휴양지역', '교통지역', '공공시설지역',
+             '농업지역', '산림지역', '초지', '습지', '나지', '수역']
+
+# Merged_Inundation_Data.csv column -> inundation column
+INUNDATION_COLUMNS = {
+    'year': 'year', 'month': 'month', 'region_name': 'sigungu', 'region_code': 'region_code',
+    '피해액': 'damage', '월별_일최대강수량': 'max_daily_rain_mm',
+    '합류식_시설연장': 'combined_sewer_m', '분류식_시설연장': 'separate_sewer_m',
+    '맨홀': 'manholes', '오수받이': 'sewage_inlets', '토실토구': 'sediment_outlets',
+    '제방면적': 'levee_area', '하천면적': 'river_area', '인구수': 'population', '인구밀도': 'population_density',
+}
+
+# Tables are created without secondary indexes; INDEXES are built after the bulk load
+SCHEMA = {
+    'station': """
+        CREATE TABLE station (
+            station_id INTEGER PRIMARY KEY,
+            name TEXT,
+            sigungu TEXT,
+            lat REAL,
+            lon REAL
+        )""",
+    'daily_rain': """
+        CREATE TABLE daily_rain (
+            station_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            rain_mm REAL,
+            PRIMARY KEY (station_id, date)
+        ) WITHOUT ROWID""",
+    'rain_event': """
+        CREATE TABLE rain_event (
+            station_id INTEGER NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            duration_days INTEGER,
+            total_mm REAL,
+            PRIMARY KEY (station_id, start_date)
+        ) WITHOUT ROWID""",
+    'land_cover_year': """
+        CREATE TABLE land_cover_year (
+            year INTEGER NOT NULL,
+            sigungu TEXT NOT NULL,
+            category TEXT NOT NULL,
+            area_m2 REAL,
+            PRIMARY KEY (year, sigungu, category)
+        ) WITHOUT ROWID""",
+    'impervious_year': """
+        CREATE TABLE impervious_year (
+            year INTEGER NOT NULL,
+            sigungu TEXT NOT NULL,
+            impervious_m2 REAL,
+            pervious_m2 REAL,
+            total_m2 REAL,
+            impervious_ratio REAL,
+            PRIMARY KEY (year, sigungu)
+        ) WITHOUT ROWID""",
+    'inundation': """
+        CREATE TABLE inundation (
+            year INTEGER NOT NULL,
+            month INTEGER NOT NULL,
+            sigungu TEXT NOT NULL,
+            region_code INTEGER,
+            damage REAL,
+            max_daily_rain_mm REAL,
+            combined_sewer_m REAL,
+            separate_sewer_m REAL,
+            manholes REAL,
+            sewage_inlets REAL,
+            sediment_outlets REAL,
+            levee_area REAL,
+            river_area REAL,
+            population REAL,
+            population_density REAL,
+            PRIMARY KEY (year, month, sigungu)
+        ) WITHOUT ROWID""",
+}
+
+INDEXES = {
+    'station': ['CREATE INDEX idx_station_sigungu ON station (sigungu)'],
+    'daily_rain': ['CREATE INDEX idx_daily_rain_date ON daily_rain (date, station_id)'],
+    'rain_event': ['CREATE INDEX idx_rain_event_dates ON rain_event (start_date, end_date)'],
+    'land_cover_year': ['CREATE INDEX idx_land_cover_sigungu ON land_cover_year (sigungu, year)'],
+    'impervious_year': ['CREATE INDEX idx_impervious_sigungu ON impervious_year (sigungu, year)'],
+    'inundation': ['CREATE INDEX idx_inundation_sigungu ON inundation (sigungu, year)'],
+}
+
+def connect(db_path=DB_FILE):
+    """
+    WAL journal so several readers can query while one process writes.
+    Autocommit mode: transactions are opened with an explicit BEGIN so DDL is part of them.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+def insert_rows(conn, table, df, replace=False):
+    """Bulk insert of a DataFrame whose columns match the table, as one executemany."""
+    columns = ', '.join(df.columns)
+    placeholders = ', '.join('?' * len(df.columns))
+    verb = 'INSERT OR REPLACE' if replace else 'INSERT'
+    # object rows so numpy scalars become plain Python values and NaN becomes NULL
+    rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    conn.executemany(f'{verb} INTO {table} ({columns}) VALUES ({placeholders})', rows)
+    return len(df)
+
+def iso_dates(values):
+    return pd.to_datetime(values, errors='coerce').dt.strftime('%Y-%m-%d')
+
+# --- Table loaders: each returns the number of rows inserted ---
+
+def load_station(conn):
+    """Stations seen in REGION_MAP and the daily rain files, with district and coordinates if available."""
+    names = {int(code): name for code, name in REGION_MAP.items()}
+    for path in DAILY_RAIN_FILES:
+        if os.path.exists(path):
+            df = pd.read_csv(path, encoding='utf-8', usecols=lambda c: c in ('지점', '지역명', '지점명'))
+            df = df.rename(columns={'지점명': '지역명'})
+            df = df.drop_duplicates('지점')
+            for code, name in zip(df['지점'].astype(int), df['지역명']):
+                names.setdefault(code, name)
+
+    stations = pd.DataFrame({'station_id': list(names), 'name': list(names.values())})
+    stations['sigungu'] = stations['station_id'].map(station_districts())
+    if os.path.exists(STATION_FILE):
+        coords = pd.read_csv(STATION_FILE, encoding='utf-8').drop_duplicates('지점', keep='last')
+        coords = coords.set_index(coords['지점'].astype(int))
+        stations['lat'] = stations['station_id'].map(coords['위도'])
+        stations['lon'] = stations['station_id'].map(coords['경도'])
+    else:
+        stations['lat'] = stations['lon'] = np.nan
+    return insert_rows(conn, 'station', stations)
+
+def load_daily_rain(conn):
+    count = 0
+    for path in DAILY_RAIN_FILES:
+        if not os.path.exists(path):
+            print(f"  Skipping {os.path.basename(path)}: not found")
+            continue
+        for chunk in pd.read_csv(path, encoding='utf-8', usecols=['지점', '일시', '일강수량(mm)'], chunksize=CHUNK_SIZE):
+            rows = pd.DataFrame({
+                'station_id': pd.to_numeric(chunk['지점'], errors='coerce'),
+                'date': iso_dates(chunk['일시']),
+                'rain_mm': pd.to_numeric(chunk['일강수량(mm)'], errors='coerce'),
+            }).dropna(subset=['station_id', 'date'])
+            rows['station_id'] = rows['station_id'].astype(int)
+            count += insert_rows(conn, 'daily_rain', rows, replace=True)
+    return count
+
+def load_rain_event(conn):
+    df = pd.read_csv(RAIN_EVENT_FILE, encoding='utf-8')
+    events = pd.DataFrame({
+        'station_id': df['지점'].astype(int),
+        'start_date': iso_dates(df['강수 시작일']),
+        'end_date': iso_dates(df['강수 종료일']),
+        'duration_days': df['강수 기간'].astype(int),
+        'total_mm': df['기간 누적 강수량'].astype(float),
+    })
+    return insert_rows(conn, 'rain_event', events)
+
+def load_land_cover_year(conn):
+    df = pd.read_csv(LAND_INFO_FILE, encoding='utf-8-sig')
+    cols = [c for c in LAND_COLS if c in df.columns]
+    long = df.melt(id_vars=['YEAR', 'SIGUNGU_NM'], value_vars=cols, var_name='category', value_name='area_m2')
+    long = long.rename(columns={'YEAR': 'year', 'SIGUNGU_NM': 'sigungu'})
+    return insert_rows(conn, 'land_cover_year', long[['year', 'sigungu', 'category', 'area_m2']])
+
+def load_impervious_year(conn):
+    df = pd.read_csv(LAND_INFO_FILE, encoding='utf-8-sig')
+    imp = df.rename(columns={
+        'YEAR': 'year', 'SIGUNGU_NM': 'sigungu', 'IMPERVIOUS_AREA_M2': 'impervious_m2',
+        'PERVIOUS_AREA_M2': 'pervious_m2', 'TOTAL_AREA_M2': 'total_m2', 'IMPERVIOUS_RATIO': 'impervious_ratio',
+    })
+    return insert_rows(conn, 'impervious_year', imp[['year', 'sigungu', 'impervious_m2', 'pervious_m2',
+                                                     'total_m2', 'impervious_ratio']])
+
+def load_inundation(conn):
+    df = pd.read_csv(INUNDATION_FILE, encoding='utf-8-sig')
+    df = df[[c for c in INUNDATION_COLUMNS if c in df.columns]].rename(columns=INUNDATION_COLUMNS)
+    return insert_rows(conn, 'inundation', df)
+
+LOADERS = {
+    'station': load_station,
+    'daily_rain': load_daily_rain,
+    'rain_event': load_rain_event,
+    'land_cover_year': load_land_cover_year,
+    'impervious_year': load_impervious_year,
+    'inundation': load_inundation,
+}
+
+def build_database(db_path=DB_FILE, tables=None):
+    """
+    (Re)builds the given tables (all by default): drop, create, bulk insert and secondary indexes
+    in one transaction per table. If a table's source file is missing the transaction is rolled
+    back and the existing table is kept. Tables not listed are left untouched.
+    """
+    conn = connect(db_path)
+    try:
+        for table in tables or list(SCHEMA):
+            conn.execute('BEGIN')
+            try:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+                conn.execute(SCHEMA[table])
+                count = LOADERS[table](conn)
+                for sql in INDEXES[table]:
+                    conn.execute(sql)
+            except FileNotFoundError as e:
+                conn.execute('ROLLBACK')
+                print(f"  Skipping {table}: {e.filename} not found")
+                continue
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+            print(f"  {table}: {count} rows")
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    print(f"Database written to {db_path}")
+
+def query(sql, params=(), db_path=DB_FILE):
+    """Runs a read-only query and returns a DataFrame."""
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the SQLite database of rain, land cover and inundation tables')
+    parser.add_argument('--db', default=DB_FILE)
+    parser.add_argument('--tables', nargs='+', choices=list(SCHEMA), default=None, help='tables to rebuild (default: all)')
+    parser.add_argument('--query', default=None, help='run a SQL query against the database instead of building it')
+    args = parser.parse_args()
+
+    if args.query:
+        print(query(args.query, db_path=args.db).to_string())
+    else:
+        build_database(args.db, args.tables)
+
+if __name__ == '__main__':
+    main()